@@ -20,6 +20,25 @@ _test_failed_incremental: Dict[str, Dict[Tuple[int, ...], str]] = {}
 
 
 # Functions #
+def pytest_addoption(parser):
+    """Adds the options of the performance suite in tests/performance."""
+    group = parser.getgroup("performance")
+    group.addoption(
+        "--perf-sizes",
+        default="1e3,1e4",
+        help="Comma separated row counts the performance suite runs at, e.g. 1e3,1e5,1e7.",
+    )
+    group.addoption("--perf-output", default=None, help="The path of the JSON file the performance results are saved to.")
+    group.addoption("--perf-baseline", default=None, help="The path of a JSON results file to compare against.")
+    group.addoption(
+        "--perf-threshold",
+        type=float,
+        default=0.25,
+        help="The fraction a measurement may exceed its baseline by before it fails as a regression.",
+    )
+    group.addoption("--perf-repeat", type=int, default=3, help="The number of times each measurement is repeated.")
+
+
 def pytest_runtest_makereport(item, call):
     """Handles reports on incremental test calls which are dependent on the success of previous test calls."""
     if "incremental" in item.keywords:
@@ -12,5 +12,126 @@ __email__ = __email__
 
 
 # Imports #
+# Standard Libraries #
+import importlib
+from typing import TYPE_CHECKING
+from typing import Any
+
 # Local Packages #
+if TYPE_CHECKING:
+    from .arrays import NumpyFetcher
+    from .arrays import fetch_numpy
+    from .arrowio import ArrowStreamer
+    from .arrowio import from_arrow
+    from .arrowio import read_parquet
+    from .arrowio import to_arrow
+    from .arrowio import write_parquet
+    from .bulk import BulkInserter
+    from .bulk import BulkReport
+    from .bulk import BulkUpdater
+    from .bulk import bulk_insert
+    from .bulk import bulk_update
+    from .cache import CompiledCacheMonitor
+    from .cache import QueryCache
+    from .cache import StatementWarmup
+    from .databases import AsyncDatabase
+    from .databases import Database
+    from .databases import EagerLoadPlanner
+    from .databases import NPlusOneDetector
+    from .databases import NPlusOneError
+    from .databases import ScopedSessionManager
+    from .engines import EngineProfile
+    from .engines import EngineRegistry
+    from .engines import EngineTemplate
+    from .engines import SQLitePragmaManager
+    from .engines import get_async_engine
+    from .engines import get_engine
+    from .keysets import KeySet
+    from .keysets import delete_by_keys
+    from .keysets import select_by_keys
+    from .pagination import KeysetPager
+    from .pagination import Page
+    from .parallel import ParallelScanner
+    from .parallel import parallel_aggregate
+    from .tables import BaseTable
+    from .tables import FullTextTable
+    from .tables import IntervalTable
+    from .tables import TimeSeriesTable
+    from .upserts import Upserter
+    from .upserts import upsert
+    from .writebuffer import WriteBuffer
+
+
+# Definitions #
+# The public names of the package and the submodules which define them, imported on first access.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    "NumpyFetcher": ".arrays",
+    "fetch_numpy": ".arrays",
+    "ArrowStreamer": ".arrowio",
+    "from_arrow": ".arrowio",
+    "read_parquet": ".arrowio",
+    "to_arrow": ".arrowio",
+    "write_parquet": ".arrowio",
+    "BulkInserter": ".bulk",
+    "BulkReport": ".bulk",
+    "BulkUpdater": ".bulk",
+    "bulk_insert": ".bulk",
+    "bulk_update": ".bulk",
+    "CompiledCacheMonitor": ".cache",
+    "QueryCache": ".cache",
+    "StatementWarmup": ".cache",
+    "AsyncDatabase": ".databases",
+    "Database": ".databases",
+    "EagerLoadPlanner": ".databases",
+    "NPlusOneDetector": ".databases",
+    "NPlusOneError": ".databases",
+    "ScopedSessionManager": ".databases",
+    "EngineProfile": ".engines",
+    "EngineRegistry": ".engines",
+    "EngineTemplate": ".engines",
+    "SQLitePragmaManager": ".engines",
+    "get_async_engine": ".engines",
+    "get_engine": ".engines",
+    "KeySet": ".keysets",
+    "delete_by_keys": ".keysets",
+    "select_by_keys": ".keysets",
+    "KeysetPager": ".pagination",
+    "Page": ".pagination",
+    "ParallelScanner": ".parallel",
+    "parallel_aggregate": ".parallel",
+    "BaseTable": ".tables",
+    "FullTextTable": ".tables",
+    "IntervalTable": ".tables",
+    "TimeSeriesTable": ".tables",
+    "Upserter": ".upserts",
+    "upsert": ".upserts",
+    "WriteBuffer": ".writebuffer",
+}
+
+# The submodules which need an optional extra, numpy or pyarrow, and so are left out of a star import.
+_OPTIONAL_MODULES: frozenset[str] = frozenset({".arrays", ".arrowio"})
+
+__all__ = [name for name, module in _LAZY_ATTRIBUTES.items() if module not in _OPTIONAL_MODULES]
+
+
+# Functions #
+def __getattr__(name: str) -> Any:
+    """Imports a public name from its submodule on first access and caches it on the package.
+
+    Args:
+        name: The name of the attribute.
+
+    Returns:
+        The attribute.
+    """
+    module = _LAZY_ATTRIBUTES.get(name, None)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY_ATTRIBUTES))
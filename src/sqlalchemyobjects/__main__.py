@@ -0,0 +1,87 @@
+""" __main__.py
+The command-line interface of the package.
+"""
+# Package Header #
+from .header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import json
+
+# Third-Party Packages #
+import click
+
+# Local Packages #
+from .benchmarks import BenchmarkWorkload
+from .engines import EngineTemplate
+from .engines import get_engine
+
+
+# Definitions #
+# Functions #
+@click.group()
+@click.version_option()
+def main() -> None:
+    """Tools for SQLAlchemy databases."""
+
+
+@main.command()
+@click.argument("url")
+@click.option("--rows", "-n", default=100000, show_default=True, help="The number of rows to insert.")
+@click.option(
+    "--operations",
+    "-o",
+    default=1000,
+    show_default=True,
+    help="The number of single-row selects, updates, and deletes.",
+)
+@click.option(
+    "--profile",
+    "-p",
+    type=click.Choice(sorted(EngineTemplate.profiles)),
+    default=None,
+    help="The engine profile to connect with.",
+)
+@click.option("--table", default="sqlalchemyobjects_bench", show_default=True, help="The name of the scratch table.")
+@click.option("--seed", default=0, show_default=True, help="The seed of the random primary keys.")
+@click.option("--keep", is_flag=True, help="Keep the scratch table after the run.")
+@click.option("--json", "as_json", is_flag=True, help="Print the results as JSON.")
+def bench(
+    url: str,
+    rows: int,
+    operations: int,
+    profile: str | None,
+    table: str,
+    seed: int,
+    keep: bool,
+    as_json: bool,
+) -> None:
+    """Runs an insert/select/update/delete workload against the database at URL and prints its performance."""
+    engine = get_engine(url, profile)
+    workload = BenchmarkWorkload(rows, operations, table, seed)
+    try:
+        results = [s.summary() for s in workload.run(engine, keep=keep)]
+    except ValueError as error:
+        raise click.ClickException(str(error)) from error
+    finally:
+        engine.dispose()
+
+    if as_json:
+        click.echo(json.dumps({"url": engine.url.render_as_string(), "profile": profile, "results": results}, indent=2))
+        return
+
+    click.echo(f"{'operation':<10}{'ops':>10}{'ops/s':>14}{'p50 ms':>10}{'p90 ms':>10}{'p95 ms':>10}{'p99 ms':>10}")
+    for result in results:
+        latencies = "".join(f"{result[p] * 1000.0:>10.3f}" for p in ("p50", "p90", "p95", "p99"))
+        click.echo(f"{result['operation']:<10}{result['operations']:>10}{result['throughput']:>14.1f}{latencies}")
+
+
+if __name__ == "__main__":
+    main(prog_name="python-sqlalchemyobjects")  # pragma: no cover
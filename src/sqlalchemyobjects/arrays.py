@@ -0,0 +1,250 @@
+""" arrays.py
+Converts query results directly into NumPy structured arrays or column arrays.
+"""
+# Package Header #
+from .header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections.abc import Mapping
+from typing import Any
+
+# Third-Party Packages #
+import numpy as np
+from sqlalchemy import Connection
+from sqlalchemy import Select
+from sqlalchemy import types
+from sqlalchemy.orm import Session
+
+# Local Packages #
+from .utilities import is_nullable
+from .utilities import selected_columns
+
+# Definitions #
+TYPE_DTYPES: tuple[tuple[type[types.TypeEngine[Any]], str], ...] = (
+    (types.Boolean, "bool"),
+    (types.SmallInteger, "int16"),
+    (types.Integer, "int64"),
+    (types.Float, "float64"),
+    (types.Numeric, "float64"),
+    (types.DateTime, "datetime64[us]"),
+    (types.Date, "datetime64[D]"),
+    (types.Interval, "timedelta64[us]"),
+)
+
+NULLABLE_DTYPES: dict[str, str] = {
+    "bool": "object",
+    "int16": "float64",
+    "int64": "float64",
+}
+
+
+# Functions #
+def dtype_for(column: Any) -> np.dtype[Any]:
+    """Derives the NumPy dtype of a selected column from its SQLAlchemy type.
+
+    Nullable integer and boolean columns widen to float64 and object so NULL can be stored as NaN or None. All other
+    types, including strings whose length a database may not enforce, are stored as Python objects.
+
+    Args:
+        column: The selected column expression.
+
+    Returns:
+        The dtype of the column.
+    """
+    type_ = column.type
+    for sql_type, dtype in TYPE_DTYPES:
+        if isinstance(type_, sql_type):
+            if is_nullable(column):
+                dtype = NULLABLE_DTYPES.get(dtype, dtype)
+            return np.dtype(dtype)
+    return np.dtype("object")
+
+
+def statement_dtype(statement: Select[Any], dtypes: Mapping[str, Any] | None = None) -> np.dtype[Any]:
+    """Derives the structured dtype of the rows of a select.
+
+    Fields are named by the keys of the selected columns and unnamed expressions by their position, e.g. ``column_0``.
+
+    Args:
+        statement: The select to derive the dtype of.
+        dtypes: The dtypes which override the derived dtypes by column name.
+
+    Returns:
+        The structured dtype.
+    """
+    dtypes = dtypes or {}
+    fields = []
+    for name, column in selected_columns(statement):
+        fields.append((name, dtypes.get(name, None) or dtype_for(column)))
+    return np.dtype(fields)
+
+
+# Classes #
+class NumpyFetcher:
+    """Fills preallocated NumPy buffers from query results in chunks without building per-row Python objects.
+
+    Rows are fetched in partitions from a streaming result and each partition is written column by column into the
+    buffers, which double in size when full and are trimmed once the result is exhausted.
+
+    Attributes:
+        chunk_size: The number of rows fetched per partition.
+        columnar: Determines if a dictionary of column arrays is returned instead of a structured array.
+        dtypes: The dtypes which override the derived dtypes by column name.
+
+    Args:
+        chunk_size: The number of rows fetched per partition.
+        columnar: Determines if a dictionary of column arrays is returned instead of a structured array.
+        dtypes: The dtypes which override the derived dtypes by column name.
+        init: Determines if this object will construct.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        chunk_size: int = 10000,
+        columnar: bool = False,
+        dtypes: Mapping[str, Any] | None = None,
+        *,
+        init: bool = True,
+    ) -> None:
+        # New Attributes #
+        self.chunk_size: int = 10000
+        self.columnar: bool = False
+        self.dtypes: dict[str, Any] = {}
+
+        # Object Construction #
+        if init:
+            self.construct(chunk_size, columnar, dtypes)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(
+        self,
+        chunk_size: int | None = None,
+        columnar: bool | None = None,
+        dtypes: Mapping[str, Any] | None = None,
+    ) -> None:
+        """Constructs this object.
+
+        Args:
+            chunk_size: The number of rows fetched per partition.
+            columnar: Determines if a dictionary of column arrays is returned instead of a structured array.
+            dtypes: The dtypes which override the derived dtypes by column name.
+        """
+        if chunk_size is not None:
+            self.chunk_size = chunk_size
+
+        if columnar is not None:
+            self.columnar = columnar
+
+        if dtypes is not None:
+            self.dtypes.update(dtypes)
+
+    # Buffers
+    def allocate(self, dtype: np.dtype[Any], size: int) -> Any:
+        """Allocates an empty buffer.
+
+        Args:
+            dtype: The structured dtype of the rows.
+            size: The number of rows the buffer holds.
+
+        Returns:
+            The structured array or the dictionary of column arrays.
+        """
+        if self.columnar:
+            fields: Mapping[str, Any] = dtype.fields or {}
+            return {name: np.empty(size, dtype=fields[name][0]) for name in dtype.names or ()}
+        return np.empty(size, dtype=dtype)
+
+    def resize(self, buffer: Any, size: int, filled: int) -> Any:
+        """Creates a buffer of a new size holding the filled rows of a buffer.
+
+        Args:
+            buffer: The buffer to resize.
+            size: The number of rows the new buffer holds.
+            filled: The number of filled rows to keep.
+
+        Returns:
+            The resized buffer.
+        """
+        if self.columnar:
+            return {name: self._resize_array(array, size, filled) for name, array in buffer.items()}
+        return self._resize_array(buffer, size, filled)
+
+    @staticmethod
+    def _resize_array(array: np.ndarray[Any, Any], size: int, filled: int) -> np.ndarray[Any, Any]:
+        if array.shape[0] == size:
+            return array
+        new = np.empty(size, dtype=array.dtype)
+        new[:filled] = array[:filled]
+        return new
+
+    # Fetch
+    def fetch(self, bind: Session | Connection, statement: Select[Any], size: int | None = None) -> Any:
+        """Executes a select and fills its rows into NumPy buffers.
+
+        Args:
+            bind: The Session or Connection to execute with.
+            statement: The Core select to fetch.
+            size: The expected number of rows, used to preallocate the buffers exactly.
+
+        Returns:
+            The structured array or the dictionary of column arrays.
+        """
+        dtype = statement_dtype(statement, self.dtypes)
+        names = dtype.names or ()
+        capacity = size or self.chunk_size
+        buffer = self.allocate(dtype, capacity)
+        filled = 0
+
+        result = bind.execute(
+            statement,
+            execution_options={"stream_results": True, "yield_per": self.chunk_size},
+        )
+        try:
+            for rows in result.partitions():
+                end = filled + len(rows)
+                if end > capacity:
+                    capacity = max(end, capacity * 2)
+                    buffer = self.resize(buffer, capacity, filled)
+                for name, values in zip(names, zip(*rows, strict=True), strict=True):
+                    buffer[name][filled:end] = values
+                filled = end
+        finally:
+            result.close()
+
+        return self.resize(buffer, filled, filled)
+
+
+# Functions #
+def fetch_numpy(
+    bind: Session | Connection,
+    statement: Select[Any],
+    columnar: bool = False,
+    chunk_size: int = 10000,
+    dtypes: Mapping[str, Any] | None = None,
+    size: int | None = None,
+) -> Any:
+    """Executes a select and returns its rows as a NumPy structured array or a dictionary of column arrays.
+
+    Args:
+        bind: The Session or Connection to execute with.
+        statement: The Core select to fetch.
+        columnar: Determines if a dictionary of column arrays is returned instead of a structured array.
+        chunk_size: The number of rows fetched per partition.
+        dtypes: The dtypes which override the derived dtypes by column name.
+        size: The expected number of rows, used to preallocate the buffers exactly.
+
+    Returns:
+        The structured array or the dictionary of column arrays.
+    """
+    return NumpyFetcher(chunk_size, columnar, dtypes).fetch(bind, statement, size)
@@ -0,0 +1,365 @@
+""" arrowio.py
+Streams tables between databases and Apache Arrow record batches or Parquet files.
+"""
+# Package Header #
+from .header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import pathlib
+import uuid
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from typing import Any
+
+# Third-Party Packages #
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import Connection
+from sqlalchemy import Engine
+from sqlalchemy import Select
+from sqlalchemy import select
+from sqlalchemy import types
+from sqlalchemy.orm import Session
+
+# Local Packages #
+from .bulk import BulkInserter
+from .bulk import BulkReport
+from .utilities import as_table
+from .utilities import is_nullable
+from .utilities import selected_columns
+
+# Definitions #
+TYPE_ARROW: tuple[tuple[type[types.TypeEngine[Any]], Any], ...] = (
+    (types.Boolean, pa.bool_()),
+    (types.SmallInteger, pa.int16()),
+    (types.Integer, pa.int64()),
+    (types.Float, pa.float64()),
+    (types.Date, pa.date32()),
+    (types.Time, pa.time64("us")),
+    (types.Interval, pa.duration("us")),
+    (types.Uuid, pa.string()),
+    (types.String, pa.string()),
+    (types.LargeBinary, pa.binary()),
+)
+
+
+# Functions #
+def arrow_type_for(column: Any) -> pa.DataType:
+    """Derives the Arrow type of a selected column from its SQLAlchemy type.
+
+    Args:
+        column: The selected column expression.
+
+    Returns:
+        The Arrow type of the column.
+    """
+    type_ = column.type
+    if isinstance(type_, types.DateTime):
+        return pa.timestamp("us", tz="UTC" if type_.timezone else None)
+    if isinstance(type_, types.Numeric) and not isinstance(type_, types.Float):
+        if type_.asdecimal and type_.precision is not None:
+            return pa.decimal128(type_.precision, type_.scale or 0)
+        return pa.float64()
+    for sql_type, arrow_type in TYPE_ARROW:
+        if isinstance(type_, sql_type):
+            return arrow_type
+    return pa.string()
+
+
+def statement_schema(statement: Select[Any]) -> pa.Schema:
+    """Derives the Arrow schema of the rows of a select.
+
+    Fields are named by the keys of the selected columns and unnamed expressions by their position, e.g. ``column_0``.
+
+    Args:
+        statement: The select to derive the schema of.
+
+    Returns:
+        The Arrow schema.
+    """
+    return pa.schema([pa.field(n, arrow_type_for(c), nullable=is_nullable(c)) for n, c in selected_columns(statement)])
+
+
+def import_converter(column: Any) -> Any:
+    """Gets the function which converts an Arrow value into the Python value a target column expects.
+
+    Args:
+        column: The target column.
+
+    Returns:
+        The converter or None if values need no conversion.
+    """
+    if isinstance(column.type, types.Uuid) and column.type.as_uuid:
+        return uuid.UUID
+    return None
+
+
+def as_statement(source: Any) -> Select[Any]:
+    """Gets a select of all columns of a Table or mapped class, passing selects through.
+
+    Args:
+        source: The Table, mapped class, or select.
+
+    Returns:
+        The select.
+    """
+    if isinstance(source, Select):
+        return source
+    return select(*as_table(source).columns)
+
+
+# Classes #
+class ArrowStreamer:
+    """Streams rows between databases and Arrow record batches so neither side materializes a whole table.
+
+    Attributes:
+        batch_size: The number of rows per record batch.
+
+    Args:
+        batch_size: The number of rows per record batch.
+        init: Determines if this object will construct.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(self, batch_size: int = 65536, *, init: bool = True) -> None:
+        # New Attributes #
+        self.batch_size: int = 65536
+
+        # Object Construction #
+        if init:
+            self.construct(batch_size)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(self, batch_size: int | None = None) -> None:
+        """Constructs this object.
+
+        Args:
+            batch_size: The number of rows per record batch.
+        """
+        if batch_size is not None:
+            self.batch_size = batch_size
+
+    # Export
+    def iterate_batches(self, bind: Session | Connection, source: Any) -> Iterator[pa.RecordBatch]:
+        """Streams the rows of a table or select as record batches.
+
+        Args:
+            bind: The Session or Connection to execute with.
+            source: The Table, mapped class, or select to export.
+
+        Yields:
+            The next record batch.
+        """
+        statement = as_statement(source)
+        schema = statement_schema(statement)
+        converters = [str if pa.types.is_string(f.type) else None for f in schema]
+
+        result = bind.execute(
+            statement,
+            execution_options={"stream_results": True, "yield_per": self.batch_size},
+        )
+        try:
+            for rows in result.partitions():
+                arrays = []
+                values: Sequence[Any]
+                for field, converter, values in zip(schema, converters, zip(*rows, strict=True), strict=True):
+                    if converter is not None:
+                        values = [v if v is None or isinstance(v, str) else converter(v) for v in values]
+                    arrays.append(pa.array(values, type=field.type))
+                yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+        finally:
+            result.close()
+
+    def to_arrow(self, bind: Session | Connection, source: Any) -> pa.Table:
+        """Exports the rows of a table or select as an Arrow table.
+
+        Args:
+            bind: The Session or Connection to execute with.
+            source: The Table, mapped class, or select to export.
+
+        Returns:
+            The Arrow table.
+        """
+        schema = statement_schema(as_statement(source))
+        return pa.Table.from_batches(self.iterate_batches(bind, source), schema=schema)
+
+    def write_parquet(
+        self,
+        bind: Session | Connection,
+        source: Any,
+        path: str | pathlib.Path,
+        **kwargs: Any,
+    ) -> int:
+        """Streams the rows of a table or select into a Parquet file one record batch at a time.
+
+        Args:
+            bind: The Session or Connection to execute with.
+            source: The Table, mapped class, or select to export.
+            path: The path of the Parquet file.
+            **kwargs: The keyword arguments for the ParquetWriter.
+
+        Returns:
+            The number of rows written.
+        """
+        schema = statement_schema(as_statement(source))
+        rows = 0
+        with pq.ParquetWriter(path, schema, **kwargs) as writer:
+            for batch in self.iterate_batches(bind, source):
+                writer.write_batch(batch)
+                rows += batch.num_rows
+        return rows
+
+    # Import
+    def from_arrow(
+        self,
+        bind: Engine | Connection | Session,
+        table: Any,
+        data: pa.Table | pa.RecordBatch | Iterable[pa.RecordBatch],
+        inserter: BulkInserter | None = None,
+    ) -> BulkReport:
+        """Inserts Arrow data into a table, converting one record batch at a time.
+
+        Args:
+            bind: The Engine, Connection, or Session to insert with.
+            table: The Table or mapped class to insert into.
+            data: The Arrow table, record batch, or iterable of record batches.
+            inserter: The inserter to insert with, defaults to a BulkInserter for the table.
+
+        Returns:
+            The totals of the insert.
+        """
+        if isinstance(data, pa.Table):
+            batches: Iterable[pa.RecordBatch] = data.to_batches(self.batch_size)
+        elif isinstance(data, pa.RecordBatch):
+            batches = (data,)
+        else:
+            batches = data
+
+        batches = iter(batches)
+        first = next(batches, None)
+        if first is None:
+            return BulkReport()
+
+        if inserter is None:
+            inserter = BulkInserter(table)
+        names = first.schema.names
+        inserter.construct(columns=names)
+        columns = inserter.get_table().columns
+        converters = [import_converter(columns[n]) if n in columns else None for n in names]
+
+        def convert(batch: pa.RecordBatch) -> Iterator[tuple[Any, ...]]:
+            arrays = []
+            for converter, array in zip(converters, batch.columns, strict=True):
+                values = array.to_pylist()
+                if converter is not None:
+                    values = [v if v is None else converter(v) for v in values]
+                arrays.append(values)
+            return zip(*arrays, strict=True)
+
+        def rows() -> Iterator[tuple[Any, ...]]:
+            yield from convert(first)
+            for batch in batches:
+                yield from convert(batch)
+
+        return inserter.insert(bind, rows())
+
+    def read_parquet(
+        self,
+        bind: Engine | Connection | Session,
+        table: Any,
+        path: str | pathlib.Path,
+        inserter: BulkInserter | None = None,
+    ) -> BulkReport:
+        """Streams the rows of a Parquet file into a table one record batch at a time.
+
+        Args:
+            bind: The Engine, Connection, or Session to insert with.
+            table: The Table or mapped class to insert into.
+            path: The path of the Parquet file.
+            inserter: The inserter to insert with, defaults to a BulkInserter for the table.
+
+        Returns:
+            The totals of the insert.
+        """
+        return self.from_arrow(bind, table, pq.ParquetFile(path).iter_batches(self.batch_size), inserter)
+
+
+# Functions #
+def to_arrow(bind: Session | Connection, source: Any, batch_size: int = 65536) -> pa.Table:
+    """Exports the rows of a table or select as an Arrow table.
+
+    Args:
+        bind: The Session or Connection to execute with.
+        source: The Table, mapped class, or select to export.
+        batch_size: The number of rows per record batch.
+
+    Returns:
+        The Arrow table.
+    """
+    return ArrowStreamer(batch_size).to_arrow(bind, source)
+
+
+def from_arrow(
+    bind: Engine | Connection | Session,
+    table: Any,
+    data: pa.Table | pa.RecordBatch | Iterable[pa.RecordBatch],
+    batch_size: int = 65536,
+) -> BulkReport:
+    """Inserts Arrow data into a table one record batch at a time.
+
+    Args:
+        bind: The Engine, Connection, or Session to insert with.
+        table: The Table or mapped class to insert into.
+        data: The Arrow table, record batch, or iterable of record batches.
+        batch_size: The number of rows per record batch when splitting an Arrow table.
+
+    Returns:
+        The totals of the insert.
+    """
+    return ArrowStreamer(batch_size).from_arrow(bind, table, data)
+
+
+def write_parquet(bind: Session | Connection, source: Any, path: str | pathlib.Path, batch_size: int = 65536) -> int:
+    """Streams the rows of a table or select into a Parquet file.
+
+    Args:
+        bind: The Session or Connection to execute with.
+        source: The Table, mapped class, or select to export.
+        path: The path of the Parquet file.
+        batch_size: The number of rows per record batch.
+
+    Returns:
+        The number of rows written.
+    """
+    return ArrowStreamer(batch_size).write_parquet(bind, source, path)
+
+
+def read_parquet(
+    bind: Engine | Connection | Session,
+    table: Any,
+    path: str | pathlib.Path,
+    batch_size: int = 65536,
+) -> BulkReport:
+    """Streams the rows of a Parquet file into a table.
+
+    Args:
+        bind: The Engine, Connection, or Session to insert with.
+        table: The Table or mapped class to insert into.
+        path: The path of the Parquet file.
+        batch_size: The number of rows per record batch.
+
+    Returns:
+        The totals of the insert.
+    """
+    return ArrowStreamer(batch_size).read_parquet(bind, table, path)
@@ -0,0 +1,298 @@
+""" benchmarks.py
+A standard insert, select, update, and delete workload for measuring database throughput and latency.
+"""
+# Package Header #
+from .header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import random
+import statistics
+import time
+from collections.abc import Callable
+from collections.abc import Iterator
+from collections.abc import Sequence
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+# Third-Party Packages #
+from sqlalchemy import Column
+from sqlalchemy import Engine
+from sqlalchemy import Float
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import bindparam
+from sqlalchemy import delete
+from sqlalchemy import inspect
+from sqlalchemy import select
+from sqlalchemy import update
+
+# Local Packages #
+from .bulk import BulkInserter
+
+# Definitions #
+PERCENTILES = (50, 90, 95, 99)
+
+
+# Functions #
+def percentiles(samples: Sequence[float], points: Sequence[int] = PERCENTILES) -> dict[str, float]:
+    """Computes latency percentiles of samples.
+
+    Args:
+        samples: The latencies in seconds.
+        points: The percentiles to compute.
+
+    Returns:
+        The percentiles by name, such as "p50".
+    """
+    if len(samples) < 2:
+        value = samples[0] if samples else 0.0
+        return {f"p{p}": value for p in points}
+    cuts = statistics.quantiles(samples, n=100, method="inclusive")
+    return {f"p{p}": cuts[p - 1] for p in points}
+
+
+# Classes #
+@dataclass
+class OperationStats:
+    """The measurements of one benchmark operation.
+
+    Attributes:
+        name: The name of the operation.
+        operations: The number of operations executed.
+        seconds: The total time the operations took.
+        latencies: The latency of each timed operation in seconds.
+    """
+
+    name: str
+    operations: int = 0
+    seconds: float = 0.0
+    latencies: list[float] = field(default_factory=list, repr=False)
+
+    # Properties #
+    @property
+    def throughput(self) -> float:
+        """The operations per second."""
+        return self.operations / self.seconds if self.seconds > 0.0 else 0.0
+
+    # Instance Methods #
+    def summary(self) -> dict[str, Any]:
+        """Summarizes the measurements.
+
+        Returns:
+            The operation count, total seconds, throughput, and latency percentiles.
+        """
+        return {
+            "operation": self.name,
+            "operations": self.operations,
+            "seconds": self.seconds,
+            "throughput": self.throughput,
+        } | percentiles(self.latencies)
+
+
+class BenchmarkWorkload:
+    """A standard insert, select, update, and delete workload run against a scratch table.
+
+    The insert phase bulk loads the rows and is timed per chunk, the other phases execute single-row statements by
+    random primary key, each in its own transaction, and are timed per operation.
+
+    Attributes:
+        rows: The number of rows to insert.
+        operations: The number of single-row operations in each of the select, update, and delete phases.
+        table_name: The name of the scratch table.
+        seed: The seed of the random primary keys.
+        table: The scratch table.
+
+    Args:
+        rows: The number of rows to insert.
+        operations: The number of single-row operations in each of the select, update, and delete phases.
+        table_name: The name of the scratch table.
+        seed: The seed of the random primary keys.
+        init: Determines if this object will construct.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        rows: int = 100000,
+        operations: int = 1000,
+        table_name: str = "sqlalchemyobjects_bench",
+        seed: int = 0,
+        *,
+        init: bool = True,
+    ) -> None:
+        # New Attributes #
+        self.rows: int = 100000
+        self.operations: int = 1000
+        self.table_name: str = "sqlalchemyobjects_bench"
+        self.seed: int = 0
+        self.table: Table | None = None
+
+        # Object Construction #
+        if init:
+            self.construct(rows, operations, table_name, seed)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(
+        self,
+        rows: int | None = None,
+        operations: int | None = None,
+        table_name: str | None = None,
+        seed: int | None = None,
+    ) -> None:
+        """Constructs this object.
+
+        Args:
+            rows: The number of rows to insert.
+            operations: The number of single-row operations in each of the select, update, and delete phases.
+            table_name: The name of the scratch table.
+            seed: The seed of the random primary keys.
+        """
+        if rows is not None:
+            self.rows = rows
+
+        if operations is not None:
+            self.operations = operations
+
+        if table_name is not None:
+            self.table_name = table_name
+
+        if seed is not None:
+            self.seed = seed
+
+        self.table = Table(
+            self.table_name,
+            MetaData(),
+            Column("id", Integer, primary_key=True),
+            Column("name", String(32), nullable=False),
+            Column("value", Float, nullable=False),
+        )
+
+    # Table
+    def get_table(self) -> Table:
+        """Gets the scratch table.
+
+        Returns:
+            The scratch table.
+
+        Raises:
+            ValueError: If this object has not been constructed.
+        """
+        if self.table is None:
+            raise ValueError(f"{type(self).__name__} has no scratch table to run against.")
+        return self.table
+
+    # Phases
+    def generate_rows(self) -> Iterator[tuple[int, str, float]]:
+        """Generates the rows to insert.
+
+        Yields:
+            The next row.
+        """
+        generator = random.Random(self.seed)  # noqa: S311
+        for i in range(self.rows):
+            yield i, f"name-{i}", generator.random()
+
+    def time_operations(self, name: str, keys: Sequence[int], operation: Callable[[int], Any]) -> OperationStats:
+        """Times an operation for each key.
+
+        Args:
+            name: The name of the operation.
+            keys: The primary keys to run the operation with.
+            operation: The operation which takes a primary key.
+
+        Returns:
+            The measurements.
+        """
+        stats = OperationStats(name)
+        for key in keys:
+            start = time.perf_counter()
+            operation(key)
+            stats.latencies.append(time.perf_counter() - start)
+        stats.operations = len(keys)
+        stats.seconds = sum(stats.latencies)
+        return stats
+
+    def run_insert(self, engine: Engine) -> OperationStats:
+        """Bulk inserts the rows, timing each chunk.
+
+        Args:
+            engine: The engine to run with.
+
+        Returns:
+            The measurements, where each operation is one row.
+        """
+        stats = OperationStats("insert")
+        inserter = BulkInserter(self.get_table())
+        with engine.begin() as connection:
+            statement = inserter.create_statement(connection)
+            limit = inserter.chunk_limit(connection)
+            for chunk in inserter.iterate_chunks(self.generate_rows(), limit):
+                start = time.perf_counter()
+                inserter.execute_chunk(connection, statement, chunk)
+                elapsed = time.perf_counter() - start
+                inserter.adapt_chunk_size(len(chunk), elapsed, limit)
+                stats.latencies.append(elapsed / len(chunk))
+                stats.operations += len(chunk)
+                stats.seconds += elapsed
+        return stats
+
+    def run(self, engine: Engine, keep: bool = False) -> list[OperationStats]:
+        """Runs the workload, creating the scratch table and dropping it afterwards.
+
+        Args:
+            engine: The engine to run with.
+            keep: Determines if the scratch table is kept after the run.
+
+        Returns:
+            The measurements of each phase.
+
+        Raises:
+            ValueError: If the scratch table already exists, since the run would overwrite and drop it.
+        """
+        table = self.get_table()
+        if inspect(engine).has_table(table.name, schema=table.schema):
+            raise ValueError(f"Table {table.name!r} already exists, give the benchmark the name of a new table.")
+
+        generator = random.Random(self.seed + 1)  # noqa: S311
+        count = min(self.operations, self.rows)
+        keys = generator.sample(range(self.rows), count)
+        select_one = select(table).where(table.c.id == bindparam("key"))
+        update_one = update(table).where(table.c.id == bindparam("key")).values(value=bindparam("new_value"))
+        delete_one = delete(table).where(table.c.id == bindparam("key"))
+
+        def run_select(key: int) -> None:
+            with engine.connect() as connection:
+                connection.execute(select_one, {"key": key}).one()
+
+        def run_update(key: int) -> None:
+            with engine.begin() as connection:
+                connection.execute(update_one, {"key": key, "new_value": -1.0})
+
+        def run_delete(key: int) -> None:
+            with engine.begin() as connection:
+                connection.execute(delete_one, {"key": key})
+
+        table.create(engine)
+        try:
+            return [
+                self.run_insert(engine),
+                self.time_operations("select", keys, run_select),
+                self.time_operations("update", keys, run_update),
+                self.time_operations("delete", keys, run_delete),
+            ]
+        finally:
+            if not keep:
+                table.drop(engine)
@@ -0,0 +1,541 @@
+""" bulk.py
+Bulk writers which use Core executemany in adaptively sized chunks.
+"""
+# Package Header #
+from .header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import time
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from dataclasses import dataclass
+from itertools import islice
+from sys import maxsize
+from typing import Any
+
+# Third-Party Packages #
+from sqlalchemy import Connection
+from sqlalchemy import Engine
+from sqlalchemy import Table
+from sqlalchemy import and_
+from sqlalchemy import bindparam
+from sqlalchemy import insert
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+# Local Packages #
+from .utilities import as_connection
+from .utilities import as_table
+from .utilities import parameter_limit
+from .utilities import split_by_columns
+
+
+# Definitions #
+# Classes #
+@dataclass
+class BulkReport:
+    """The totals of a bulk operation.
+
+    Attributes:
+        rows: The number of rows written.
+        chunks: The number of chunks executed.
+        seconds: The time spent executing the chunks.
+    """
+
+    rows: int = 0
+    chunks: int = 0
+    seconds: float = 0.0
+
+    # Properties #
+    @property
+    def rows_per_second(self) -> float:
+        """The average number of rows written per second."""
+        return self.rows / self.seconds if self.seconds > 0.0 else 0.0
+
+
+class BulkInserter:
+    """Inserts rows into a table with Core executemany in chunks which adapt to the measured throughput.
+
+    Rows are pulled from the input lazily, so generators are streamed rather than materialized. After each chunk the
+    rows/sec is measured and the next chunk is resized to take about target_seconds, bounded by the bound-parameter
+    limit of the dialect so a chunk always fits in one multi-row VALUES statement.
+
+    Attributes:
+        table: The table to insert into.
+        columns: The column names tuple rows are mapped to, in order.
+        chunk_size: The number of rows in the next chunk.
+        min_chunk_size: The smallest allowed chunk size.
+        max_chunk_size: The largest allowed chunk size, None uses the bound-parameter limit.
+        target_seconds: The time each chunk should take to execute.
+        adaptive: Determines if the chunk size adapts to the measured throughput.
+        report: The totals of the rows inserted by this object.
+
+    Args:
+        table: The Table or mapped class to insert into.
+        columns: The column names tuple rows are mapped to, defaults to all columns of the table in order.
+        chunk_size: The number of rows in the first chunk.
+        min_chunk_size: The smallest allowed chunk size.
+        max_chunk_size: The largest allowed chunk size, None uses the bound-parameter limit.
+        target_seconds: The time each chunk should take to execute.
+        adaptive: Determines if the chunk size adapts to the measured throughput.
+        init: Determines if this object will construct.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        table: Any = None,
+        columns: Sequence[str] | None = None,
+        chunk_size: int = 1000,
+        min_chunk_size: int = 100,
+        max_chunk_size: int | None = None,
+        target_seconds: float = 0.25,
+        adaptive: bool = True,
+        *,
+        init: bool = True,
+    ) -> None:
+        # New Attributes #
+        self.table: Table | None = None
+        self.columns: tuple[str, ...] = ()
+        self.chunk_size: int = 1000
+        self.min_chunk_size: int = 100
+        self.max_chunk_size: int | None = None
+        self.target_seconds: float = 0.25
+        self.adaptive: bool = True
+        self.report: BulkReport = BulkReport()
+
+        # Object Construction #
+        if init:
+            self.construct(table, columns, chunk_size, min_chunk_size, max_chunk_size, target_seconds, adaptive)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(
+        self,
+        table: Any = None,
+        columns: Sequence[str] | None = None,
+        chunk_size: int | None = None,
+        min_chunk_size: int | None = None,
+        max_chunk_size: int | None = None,
+        target_seconds: float | None = None,
+        adaptive: bool | None = None,
+    ) -> None:
+        """Constructs this object.
+
+        Args:
+            table: The Table or mapped class to insert into.
+            columns: The column names tuple rows are mapped to, defaults to all columns of the table in order.
+            chunk_size: The number of rows in the first chunk.
+            min_chunk_size: The smallest allowed chunk size.
+            max_chunk_size: The largest allowed chunk size, None uses the bound-parameter limit.
+            target_seconds: The time each chunk should take to execute.
+            adaptive: Determines if the chunk size adapts to the measured throughput.
+        """
+        if table is not None:
+            self.table = as_table(table)
+            self.columns = tuple(self.table.columns.keys())
+
+        if columns is not None:
+            self.columns = tuple(columns)
+
+        if chunk_size is not None:
+            self.chunk_size = chunk_size
+
+        if min_chunk_size is not None:
+            self.min_chunk_size = min_chunk_size
+
+        if max_chunk_size is not None:
+            self.max_chunk_size = max_chunk_size
+
+        if target_seconds is not None:
+            self.target_seconds = target_seconds
+
+        if adaptive is not None:
+            self.adaptive = adaptive
+
+    # Table
+    def get_table(self) -> Table:
+        """Gets the table to write to.
+
+        Returns:
+            The table.
+
+        Raises:
+            ValueError: If no table was given.
+        """
+        if self.table is None:
+            raise ValueError(f"{type(self).__name__} has no table to write to.")
+        return self.table
+
+    # Chunking
+    def chunk_limit(self, connection: Connection) -> int:
+        """Gets the largest chunk size allowed on a connection.
+
+        Args:
+            connection: The connection the chunks will be executed on.
+
+        Returns:
+            The largest allowed chunk size.
+        """
+        limit = max(parameter_limit(connection.dialect) // max(len(self.columns), 1), 1)
+        return limit if self.max_chunk_size is None else min(limit, self.max_chunk_size)
+
+    def adapt_chunk_size(self, rows: int, seconds: float, limit: int) -> int:
+        """Resizes the next chunk from the throughput of the last one.
+
+        The size changes by at most a factor of two per chunk so a single slow chunk does not collapse the size.
+
+        Args:
+            rows: The number of rows in the last chunk.
+            seconds: The time the last chunk took.
+            limit: The largest allowed chunk size.
+
+        Returns:
+            The size of the next chunk.
+        """
+        if self.adaptive and seconds > 0.0:
+            ideal = int(rows / seconds * self.target_seconds)
+            size = min(max(ideal, self.chunk_size // 2), self.chunk_size * 2)
+        else:
+            size = self.chunk_size
+        self.chunk_size = min(max(size, self.min_chunk_size), limit)
+        return self.chunk_size
+
+    def iterate_chunks(
+        self, rows: Iterable[Mapping[str, Any] | Sequence[Any]], limit: int
+    ) -> Iterator[list[Mapping[str, Any]]]:
+        """Lazily splits rows into chunks of parameter dictionaries sized by the current chunk size.
+
+        Args:
+            rows: The rows as dictionaries or tuples.
+            limit: The largest allowed chunk size.
+
+        Yields:
+            The next chunk of parameter dictionaries.
+        """
+        iterator = iter(rows)
+        columns = self.columns
+        while chunk := list(islice(iterator, min(self.chunk_size, limit))):
+            yield [r if isinstance(r, Mapping) else dict(zip(columns, r, strict=False)) for r in chunk]
+
+    # Insert
+    def create_statement(self, connection: Connection) -> Any:
+        """Creates the statement each chunk is executed with.
+
+        Args:
+            connection: The connection the chunks will be executed on.
+
+        Returns:
+            The statement to execute.
+        """
+        return insert(self.get_table())
+
+    def execute_chunk(self, connection: Connection, statement: Any, chunk: list[Mapping[str, Any]]) -> None:
+        """Executes the statement for one chunk of rows, once per run of rows with the same columns.
+
+        Args:
+            connection: The connection to execute on.
+            statement: The statement to execute.
+            chunk: The parameter dictionaries of the rows.
+        """
+        for run in split_by_columns(chunk):
+            connection.execute(statement, run)
+
+    def insert_chunks(self, connection: Connection, rows: Iterable[Mapping[str, Any] | Sequence[Any]]) -> BulkReport:
+        """Inserts rows in chunks on a connection without managing the transaction.
+
+        Args:
+            connection: The connection to execute the chunks on.
+            rows: The rows as dictionaries or tuples.
+
+        Returns:
+            The totals of this insert.
+        """
+        statement = self.create_statement(connection)
+        limit = self.chunk_limit(connection)
+        report = BulkReport()
+        for chunk in self.iterate_chunks(rows, limit):
+            start = time.perf_counter()
+            self.execute_chunk(connection, statement, chunk)
+            elapsed = time.perf_counter() - start
+
+            report.rows += len(chunk)
+            report.chunks += 1
+            report.seconds += elapsed
+            self.adapt_chunk_size(len(chunk), elapsed, limit)
+
+        self.report.rows += report.rows
+        self.report.chunks += report.chunks
+        self.report.seconds += report.seconds
+        return report
+
+    def insert(
+        self,
+        bind: Engine | Connection | Session,
+        rows: Iterable[Mapping[str, Any] | Sequence[Any]],
+    ) -> BulkReport:
+        """Inserts rows into the table.
+
+        An Engine inserts all rows in one transaction, a Connection or Session uses its current transaction.
+
+        Args:
+            bind: The Engine, Connection, or Session to insert with.
+            rows: The rows as dictionaries or tuples.
+
+        Returns:
+            The totals of this insert.
+        """
+        self.get_table()
+        if isinstance(bind, Engine):
+            with bind.begin() as connection:
+                return self.insert_chunks(connection, rows)
+        else:
+            return self.insert_chunks(as_connection(bind), rows)
+
+
+class BulkUpdater(BulkInserter):
+    """Updates rows by primary key with Core executemany, one statement per set of changed columns.
+
+    Each row is a dictionary of the primary key values and the values to change. Rows are grouped by the set of columns
+    they change and each group is executed as an UPDATE ... WHERE key = :key executemany once it reaches the chunk size,
+    so memory stays bounded by one chunk per group while rows are streamed. When a row is updated again with another
+    set of columns, the group holding its earlier update is executed first, so the updates of a row keep their order.
+    Objects already loaded in a Session are not refreshed.
+
+    Attributes:
+        keys: The names of the primary key columns.
+
+    Args:
+        table: The Table or mapped class to update.
+        *args: The arguments for the BulkInserter.
+        init: Determines if this object will construct.
+        **kwargs: The keyword arguments for the BulkInserter.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(self, table: Any = None, *args: Any, init: bool = True, **kwargs: Any) -> None:
+        # New Attributes #
+        self.keys: tuple[str, ...] = ()
+
+        # Parent Attributes #
+        super().__init__(*args, init=False, **kwargs)
+
+        # Object Construction #
+        if init:
+            self.construct(table, *args, **kwargs)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(self, table: Any = None, *args: Any, **kwargs: Any) -> None:
+        """Constructs this object.
+
+        Args:
+            table: The Table or mapped class to update.
+            *args: The arguments for constructing the BulkInserter.
+            **kwargs: The keyword arguments for constructing the BulkInserter.
+        """
+        super().construct(table, *args, **kwargs)
+        if table is not None:
+            self.keys = tuple(self.get_table().primary_key.columns.keys())
+
+    # Chunking
+    def chunk_limit(self, connection: Connection) -> int:
+        """Gets the largest chunk size allowed on a connection.
+
+        Each row of an executemany is a separate execution, so the bound-parameter limit does not apply.
+
+        Args:
+            connection: The connection the chunks will be executed on.
+
+        Returns:
+            The largest allowed chunk size.
+        """
+        return maxsize if self.max_chunk_size is None else self.max_chunk_size
+
+    # Update
+    def create_update(self, columns: Sequence[str]) -> Any:
+        """Creates the statement which updates a set of columns of one row by its primary key.
+
+        The primary key values are bound as _key_<name> since the column names are reserved for the SET clause.
+
+        Args:
+            columns: The names of the columns to update.
+
+        Returns:
+            The update statement.
+        """
+        table = self.get_table()
+        matches = and_(*(table.c[k] == bindparam(f"_key_{k}") for k in self.keys))
+        return update(table).where(matches).values({c: bindparam(c) for c in columns})
+
+    def create_parameters(self, row: Mapping[str, Any]) -> tuple[tuple[Any, ...], tuple[str, ...], dict[str, Any]]:
+        """Splits a row into its primary key, the names of the columns it changes, and the parameters of its update.
+
+        Args:
+            row: The primary key values and changed values of the row.
+
+        Returns:
+            The primary key values, the sorted names of the changed columns, and the parameters of the update.
+
+        Raises:
+            ValueError: If the row is missing a primary key value.
+        """
+        keys = self.keys
+        columns = tuple(sorted(c for c in row if c not in keys))
+        try:
+            key = tuple(row[k] for k in keys)
+        except KeyError:
+            raise ValueError(f"Updates to {self.get_table().name} need values for the primary key {keys}.") from None
+        parameters = {f"_key_{k}": v for k, v in zip(keys, key)}
+        parameters.update((c, row[c]) for c in columns)
+        return key, columns, parameters
+
+    def execute_group(
+        self,
+        connection: Connection,
+        statement: Any,
+        chunk: list[Mapping[str, Any]],
+        limit: int,
+        report: BulkReport,
+    ) -> None:
+        """Executes one chunk of a group of rows and adapts the chunk size.
+
+        Args:
+            connection: The connection to execute on.
+            statement: The update statement of the group.
+            chunk: The parameter dictionaries of the rows.
+            limit: The largest allowed chunk size.
+            report: The totals to add the chunk to.
+        """
+        start = time.perf_counter()
+        self.execute_chunk(connection, statement, chunk)
+        elapsed = time.perf_counter() - start
+
+        report.rows += len(chunk)
+        report.chunks += 1
+        report.seconds += elapsed
+        self.adapt_chunk_size(len(chunk), elapsed, limit)
+
+    def update_chunks(self, connection: Connection, rows: Iterable[Mapping[str, Any]]) -> BulkReport:
+        """Updates rows in chunks grouped by changed columns on a connection without managing the transaction.
+
+        Args:
+            connection: The connection to execute the chunks on.
+            rows: The primary key values and changed values of each row as dictionaries.
+
+        Returns:
+            The totals of this update.
+        """
+        keys = self.keys
+        limit = self.chunk_limit(connection)
+        statements: dict[tuple[str, ...], Any] = {}
+        groups: dict[tuple[str, ...], list[Mapping[str, Any]]] = {}
+        pending: dict[tuple[Any, ...], tuple[str, ...]] = {}
+        report = BulkReport()
+
+        def flush(columns: tuple[str, ...]) -> None:
+            group = groups[columns]
+            self.execute_group(connection, statements[columns], group, limit, report)
+            for parameters in group:
+                pending.pop(tuple(parameters[f"_key_{k}"] for k in keys), None)
+            groups[columns] = []
+
+        for row in rows:
+            key, columns, parameters = self.create_parameters(row)
+            if not columns:
+                continue
+
+            # An earlier update of the row in another group must be executed before this one.
+            previous = pending.get(key, columns)
+            if previous != columns:
+                flush(previous)
+
+            group = groups.get(columns, None)
+            if group is None:
+                group = groups[columns] = []
+                statements[columns] = self.create_update(columns)
+            group.append(parameters)
+            pending[key] = columns
+            if len(group) >= min(self.chunk_size, limit):
+                flush(columns)
+
+        for columns, group in groups.items():
+            if group:
+                flush(columns)
+
+        self.report.rows += report.rows
+        self.report.chunks += report.chunks
+        self.report.seconds += report.seconds
+        return report
+
+    def update(self, bind: Engine | Connection | Session, rows: Iterable[Mapping[str, Any]]) -> BulkReport:
+        """Updates rows of the table by primary key.
+
+        An Engine updates all rows in one transaction, a Connection or Session uses its current transaction.
+
+        Args:
+            bind: The Engine, Connection, or Session to update with.
+            rows: The primary key values and changed values of each row as dictionaries.
+
+        Returns:
+            The totals of this update.
+        """
+        self.get_table()
+        if isinstance(bind, Engine):
+            with bind.begin() as connection:
+                return self.update_chunks(connection, rows)
+        else:
+            return self.update_chunks(as_connection(bind), rows)
+
+
+# Functions #
+def bulk_insert(
+    bind: Engine | Connection | Session,
+    table: Any,
+    rows: Iterable[Mapping[str, Any] | Sequence[Any]],
+    **kwargs: Any,
+) -> BulkReport:
+    """Inserts rows into a table with a BulkInserter.
+
+    Args:
+        bind: The Engine, Connection, or Session to insert with.
+        table: The Table or mapped class to insert into.
+        rows: The rows as dictionaries or tuples.
+        **kwargs: The keyword arguments for the BulkInserter.
+
+    Returns:
+        The totals of this insert.
+    """
+    return BulkInserter(table, **kwargs).insert(bind, rows)
+
+
+def bulk_update(
+    bind: Engine | Connection | Session,
+    table: Any,
+    rows: Iterable[Mapping[str, Any]],
+    **kwargs: Any,
+) -> BulkReport:
+    """Updates rows of a table by primary key with a BulkUpdater.
+
+    Args:
+        bind: The Engine, Connection, or Session to update with.
+        table: The Table or mapped class to update.
+        rows: The primary key values and changed values of each row as dictionaries.
+        **kwargs: The keyword arguments for the BulkUpdater.
+
+    Returns:
+        The totals of this update.
+    """
+    return BulkUpdater(table, **kwargs).update(bind, rows)
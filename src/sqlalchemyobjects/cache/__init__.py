@@ -0,0 +1,37 @@
+""" __init__.py
+Caches of query results which are invalidated by writes to the tables they read.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Local Packages #
+from .compiledcachemonitor import CacheSample
+from .compiledcachemonitor import CompiledCacheMonitor
+from .querycache import CacheEntry
+from .querycache import QueryCache
+from .statementwarmup import StatementWarmup
+from .statementwarmup import WarmupEntry
+from .statementwarmup import default_warmup
+from .statementwarmup import register_statement
+from .statementwarmup import warm_statements
+
+
+__all__ = [
+    "CacheSample",
+    "CompiledCacheMonitor",
+    "CacheEntry",
+    "QueryCache",
+    "StatementWarmup",
+    "WarmupEntry",
+    "default_warmup",
+    "register_statement",
+    "warm_statements",
+]
@@ -0,0 +1,236 @@
+""" compiledcachemonitor.py
+Tracks how often executions of an engine hit SQLAlchemy's compiled statement cache over time.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import time
+from collections import deque
+from dataclasses import asdict
+from dataclasses import dataclass
+from threading import Lock
+from typing import Any
+
+# Third-Party Packages #
+from sqlalchemy import Connection
+from sqlalchemy import Engine
+from sqlalchemy import event
+from sqlalchemy.engine.interfaces import CacheStats
+
+
+# Definitions #
+# Classes #
+@dataclass
+class CacheSample:
+    """The compiled cache statistics of one window of time.
+
+    Attributes:
+        start: The wall clock time the window started at.
+        seconds: The length of the window.
+        hits: The number of executions which found their compiled statement in the cache.
+        misses: The number of executions which compiled their statement and cached it.
+        uncached: The number of executions which could not use the cache.
+    """
+
+    start: float = 0.0
+    seconds: float = 0.0
+    hits: int = 0
+    misses: int = 0
+    uncached: int = 0
+
+    # Properties #
+    @property
+    def hit_ratio(self) -> float:
+        """The fraction of executions which hit the cache."""
+        total = self.hits + self.misses + self.uncached
+        return self.hits / total if total else 0.0
+
+
+class CompiledCacheMonitor:
+    """Tracks how often executions of an engine hit SQLAlchemy's compiled statement cache over time.
+
+    Each execution is counted as a hit, a miss, or uncached from its execution context. Counts are also collected into
+    fixed windows of time, the most recent of which are kept as samples, so a warmup can be verified and regressions
+    after a deploy show up as a falling hit ratio.
+
+    Attributes:
+        engine: The engine this monitor is attached to.
+        window: The seconds of each sample window.
+        total: The counts since this monitor was attached.
+        current: The counts of the current window.
+        samples: The counts of the completed windows, oldest first.
+        _lock: The lock which guards the counts.
+
+    Args:
+        engine: The engine to attach to.
+        window: The seconds of each sample window.
+        max_samples: The number of completed windows to keep.
+        init: Determines if this object will construct.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        engine: Engine | None = None,
+        window: float = 60.0,
+        max_samples: int = 1440,
+        *,
+        init: bool = True,
+    ) -> None:
+        # New Attributes #
+        self.engine: Engine | None = None
+        self.window: float = 60.0
+        self.total: CacheSample = CacheSample(start=time.time())
+        self.current: CacheSample = CacheSample(start=time.time())
+        self.samples: deque[CacheSample] = deque(maxlen=1440)
+        self._lock: Lock = Lock()
+
+        # Object Construction #
+        if init:
+            self.construct(engine, window, max_samples)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(
+        self,
+        engine: Engine | None = None,
+        window: float | None = None,
+        max_samples: int | None = None,
+    ) -> None:
+        """Constructs this object.
+
+        Args:
+            engine: The engine to attach to.
+            window: The seconds of each sample window.
+            max_samples: The number of completed windows to keep.
+        """
+        if window is not None:
+            self.window = window
+
+        if max_samples is not None:
+            self.samples = deque(self.samples, maxlen=max_samples)
+
+        if engine is not None:
+            self.attach(engine)
+
+    # Properties #
+    @property
+    def hit_ratio(self) -> float:
+        """The fraction of executions which hit the cache since this monitor was attached."""
+        return self.total.hit_ratio
+
+    @property
+    def cache_size(self) -> int:
+        """The number of compiled statements in the cache of the engine."""
+        cache = getattr(self.engine, "_compiled_cache", None)
+        return 0 if cache is None else len(cache)
+
+    # Counting
+    def roll(self, now: float | None = None) -> None:
+        """Completes the current window into a sample once its time has passed.
+
+        Args:
+            now: The current wall clock time, defaults to now.
+        """
+        now = time.time() if now is None else now
+        if now - self.current.start >= self.window:
+            self.current.seconds = now - self.current.start
+            self.samples.append(self.current)
+            self.current = CacheSample(start=now)
+
+    def record(self, cache_hit: Any) -> None:
+        """Counts one execution.
+
+        Args:
+            cache_hit: The cache statistic of the execution context.
+        """
+        with self._lock:
+            self.roll()
+            for sample in (self.total, self.current):
+                if cache_hit == CacheStats.CACHE_HIT:
+                    sample.hits += 1
+                elif cache_hit == CacheStats.CACHE_MISS:
+                    sample.misses += 1
+                else:
+                    sample.uncached += 1
+
+    def reset(self) -> None:
+        """Clears all counts and samples."""
+        with self._lock:
+            now = time.time()
+            self.total = CacheSample(start=now)
+            self.current = CacheSample(start=now)
+            self.samples.clear()
+
+    def report(self) -> dict[str, Any]:
+        """Summarizes the counts, the hit ratio, and the samples.
+
+        Returns:
+            The report as JSON serializable values.
+        """
+        with self._lock:
+            self.roll()
+            samples = [asdict(s) | {"hit_ratio": s.hit_ratio} for s in self.samples]
+            return {
+                "hits": self.total.hits,
+                "misses": self.total.misses,
+                "uncached": self.total.uncached,
+                "hit_ratio": self.total.hit_ratio,
+                "cache_size": self.cache_size,
+                "samples": samples,
+            }
+
+    # Events
+    def after_execute(
+        self,
+        connection: Connection,
+        clauseelement: Any,
+        multiparams: Any,
+        params: Any,
+        execution_options: Any,
+        result: Any,
+    ) -> None:
+        """Counts an execution by the cache statistic of its context.
+
+        Args:
+            connection: The connection the statement was executed on.
+            clauseelement: The executed statement.
+            multiparams: The multiple parameter sets of the statement.
+            params: The parameters of the statement.
+            execution_options: The execution options of the statement.
+            result: The result of the statement.
+        """
+        context = getattr(result, "context", None)
+        if context is not None and getattr(context, "compiled", None) is not None:
+            self.record(context.cache_hit)
+
+    def attach(self, engine: Engine) -> Engine:
+        """Attaches this monitor to the execution events of an engine.
+
+        Args:
+            engine: The engine to attach to.
+
+        Returns:
+            The engine.
+        """
+        if self.engine is not None:
+            self.detach()
+        self.engine = engine
+        event.listen(engine, "after_execute", self.after_execute)
+        return engine
+
+    def detach(self) -> None:
+        """Removes this monitor from the execution events of its engine."""
+        if self.engine is not None:
+            event.remove(self.engine, "after_execute", self.after_execute)
+            self.engine = None
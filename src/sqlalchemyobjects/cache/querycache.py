@@ -0,0 +1,411 @@
+""" querycache.py
+An LRU and TTL bounded cache of select results invalidated by writes to the tables they read.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+from collections.abc import Iterable
+from collections.abc import Mapping
+from dataclasses import dataclass
+from threading import RLock
+from typing import Any
+
+# Third-Party Packages #
+from sqlalchemy import Connection
+from sqlalchemy import Engine
+from sqlalchemy import Result
+from sqlalchemy import Select
+from sqlalchemy import Table
+from sqlalchemy import TextClause
+from sqlalchemy import event
+from sqlalchemy.engine import FrozenResult
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.loading import merge_frozen_result
+from sqlalchemy.sql import visitors
+from sqlalchemy.sql.dml import UpdateBase
+
+# Local Packages #
+from ..utilities import as_connection
+
+
+# Definitions #
+_MISSING = object()
+WRITE_KEYWORDS = frozenset({"INSERT", "UPDATE", "DELETE", "REPLACE", "UPSERT", "MERGE", "DROP", "ALTER", "TRUNCATE"})
+
+
+# Functions #
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, Mapping):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return tuple(_freeze(v) for v in value)
+    frozen: Hashable = value
+    return frozen
+
+
+def read_tables(statement: Any) -> frozenset[str]:
+    """Gets the names of the tables a statement reads.
+
+    Args:
+        statement: The statement to inspect.
+
+    Returns:
+        The names of the tables.
+    """
+    return frozenset(e.name for e in visitors.iterate(statement) if isinstance(e, Table))
+
+
+# Classes #
+@dataclass
+class CacheEntry:
+    """A cached result.
+
+    Attributes:
+        result: The frozen result.
+        tables: The names of the tables the statement reads.
+        expires: The monotonic time the entry expires at, None never expires.
+    """
+
+    result: FrozenResult[Any]
+    tables: frozenset[str]
+    expires: float | None = None
+
+
+class QueryCache:
+    """An LRU and TTL bounded cache of select results invalidated by writes to the tables they read.
+
+    Results are keyed by the structure of the statement, which tells entities apart from their columns, plus the
+    bound parameters. Once attached to an engine, every INSERT, UPDATE, or DELETE executed on it, including those the
+    ORM emits when a session flushes, evicts the entries which read the written table and evicts them again when the
+    transaction commits, dropping any entry read before the write became visible. Textual writes which cannot be
+    attributed to a table clear the whole cache. A connection with uncommitted writes bypasses the cache, so results
+    which could be rolled back are never cached.
+
+    Attributes:
+        max_size: The maximum number of entries, the least recently used entries are evicted first.
+        ttl: The seconds an entry lives, None lets entries live until evicted or invalidated.
+        entries: The entries by key in least to most recently used order.
+        table_keys: The keys of the entries which read each table.
+        hits: The number of lookups which found an entry.
+        misses: The number of lookups which executed the statement.
+        pending: The tables each connection has written in its open transaction, None for unknown tables.
+        _lock: The lock which serializes access to the entries.
+
+    Args:
+        max_size: The maximum number of entries.
+        ttl: The seconds an entry lives, None lets entries live until evicted or invalidated.
+        init: Determines if this object will construct.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(self, max_size: int = 1024, ttl: float | None = 300.0, *, init: bool = True) -> None:
+        # New Attributes #
+        self.max_size: int = 1024
+        self.ttl: float | None = 300.0
+        self.entries: OrderedDict[Hashable, CacheEntry] = OrderedDict()
+        self.table_keys: dict[str, set[Hashable]] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+        self.pending: dict[Connection, set[str] | None] = {}
+        self._lock: RLock = RLock()
+
+        # Object Construction #
+        if init:
+            self.construct(max_size, ttl)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(self, max_size: int | None = None, ttl: Any = _MISSING) -> None:
+        """Constructs this object.
+
+        Args:
+            max_size: The maximum number of entries.
+            ttl: The seconds an entry lives, None lets entries live until evicted or invalidated.
+        """
+        if max_size is not None:
+            self.max_size = max_size
+
+        if ttl is not _MISSING:
+            self.ttl = ttl
+
+    # Statistics
+    @property
+    def hit_ratio(self) -> float:
+        """The fraction of lookups which found an entry."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    # Entries
+    def create_key(
+        self, bind: Session | Connection, statement: Select[Any], params: Mapping[str, Any] | None
+    ) -> Hashable | None:
+        """Creates the key of a statement from its cache key, its bound values, and the execution parameters.
+
+        The cache key of a statement describes what it selects, so ``select(Model)`` and ``select(Model.id)`` get
+        different keys even though they compile to the same SQL.
+
+        Args:
+            bind: The Session or Connection the statement is executed with.
+            statement: The statement to create the key of.
+            params: The parameters the statement is executed with.
+
+        Returns:
+            The key or None if the statement cannot be cached.
+        """
+        cache_key = statement._generate_cache_key()
+        if cache_key is None:
+            return None
+        dialect = bind.get_bind().dialect if isinstance(bind, Session) else bind.dialect
+        values = tuple(_freeze(p.effective_value) for p in cache_key.bindparams)
+        return dialect.name, cache_key.key, values, _freeze(params or {})
+
+    def get(self, key: Hashable) -> CacheEntry | None:
+        """Gets a live entry, marking it as the most recently used.
+
+        Args:
+            key: The key of the entry.
+
+        Returns:
+            The entry or None if it does not exist or has expired.
+        """
+        with self._lock:
+            entry = self.entries.get(key, None)
+            if entry is None:
+                return None
+            if entry.expires is not None and entry.expires <= time.monotonic():
+                self.remove(key)
+                return None
+            self.entries.move_to_end(key)
+            return entry
+
+    def put(self, key: Hashable, result: FrozenResult[Any], tables: Iterable[str]) -> CacheEntry:
+        """Adds an entry, evicting the least recently used entries beyond the maximum size.
+
+        Args:
+            key: The key of the entry.
+            result: The frozen result to cache.
+            tables: The names of the tables the statement reads.
+
+        Returns:
+            The new entry.
+        """
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        entry = CacheEntry(result, frozenset(tables), expires)
+        with self._lock:
+            self.remove(key)
+            self.entries[key] = entry
+            for table in entry.tables:
+                self.table_keys.setdefault(table, set()).add(key)
+            while len(self.entries) > self.max_size:
+                self.remove(next(iter(self.entries)))
+        return entry
+
+    def remove(self, key: Hashable) -> None:
+        """Removes an entry if it exists.
+
+        Args:
+            key: The key of the entry.
+        """
+        with self._lock:
+            entry = self.entries.pop(key, None)
+            if entry is not None:
+                for table in entry.tables:
+                    keys = self.table_keys.get(table, None)
+                    if keys is not None:
+                        keys.discard(key)
+                        if not keys:
+                            del self.table_keys[table]
+
+    def invalidate(self, *tables: str) -> None:
+        """Removes the entries which read any of the given tables.
+
+        Args:
+            *tables: The names of the written tables.
+        """
+        with self._lock:
+            for table in tables:
+                for key in list(self.table_keys.get(table, ())):
+                    self.remove(key)
+
+    def clear(self) -> None:
+        """Removes all entries."""
+        with self._lock:
+            self.entries.clear()
+            self.table_keys.clear()
+
+    # Execution
+    def execute(
+        self,
+        bind: Session | Connection,
+        statement: Select[Any],
+        params: Mapping[str, Any] | None = None,
+    ) -> Result[Any]:
+        """Executes a select, returning the cached result when one is live.
+
+        ORM results are merged into the session without emitting a query, so cached entities are attached to the
+        session like freshly loaded ones. Statements which cannot be cached and binds with uncommitted writes are
+        executed without the cache.
+
+        Args:
+            bind: The Session or Connection to execute with.
+            statement: The select to execute.
+            params: The parameters to execute the statement with.
+
+        Returns:
+            The result.
+        """
+        key = self.create_key(bind, statement, params)
+        if key is None or as_connection(bind) in self.pending:
+            return bind.execute(statement, params)
+
+        entry = self.get(key)
+        if entry is None:
+            self.misses += 1
+            entry = self.put(key, bind.execute(statement, params).freeze(), read_tables(statement))
+        else:
+            self.hits += 1
+
+        if isinstance(bind, Session):
+            merge = merge_frozen_result(bind, statement, entry.result, load=False)  # type: ignore[no-untyped-call]
+            merged: Result[Any] = merge()
+            return merged
+        return entry.result()
+
+    # Transactions
+    def add_pending(self, connection: Connection, table: str | None) -> None:
+        """Records a write in the open transaction of a connection.
+
+        Args:
+            connection: The connection which executed the write.
+            table: The name of the written table or None if it is unknown.
+        """
+        with self._lock:
+            tables = self.pending.setdefault(connection, set())
+            if table is None:
+                self.pending[connection] = None
+            elif tables is not None:
+                tables.add(table)
+
+    def commit(self, connection: Connection) -> None:
+        """Invalidates the entries which read the tables a committed transaction wrote.
+
+        Args:
+            connection: The connection which committed.
+        """
+        with self._lock:
+            if connection in self.pending:
+                tables = self.pending.pop(connection)
+                if tables is None:
+                    self.clear()
+                else:
+                    self.invalidate(*tables)
+
+    def rollback(self, connection: Connection) -> None:
+        """Forgets the writes of a transaction which rolled back.
+
+        Args:
+            connection: The connection which rolled back.
+        """
+        with self._lock:
+            self.pending.pop(connection, None)
+
+    # Events
+    def after_execute(
+        self,
+        connection: Connection,
+        clauseelement: Any,
+        multiparams: Any,
+        params: Any,
+        execution_options: Any,
+        result: Any,
+    ) -> None:
+        """Invalidates the entries which read the tables a write statement changed and records the write.
+
+        Args:
+            connection: The connection the statement was executed on.
+            clauseelement: The executed statement.
+            multiparams: The multiple parameter sets of the statement.
+            params: The parameters of the statement.
+            execution_options: The execution options of the statement.
+            result: The result of the statement.
+        """
+        if isinstance(clauseelement, UpdateBase):
+            table = getattr(clauseelement, "table", None)
+            if isinstance(table, Table):
+                self.invalidate(table.name)
+                self.add_pending(connection, table.name)
+            else:
+                self.clear()
+                self.add_pending(connection, None)
+        elif isinstance(clauseelement, (TextClause, str)):
+            words = str(clauseelement).split(None, 1)
+            if words and words[0].upper() in WRITE_KEYWORDS:
+                self.clear()
+                self.add_pending(connection, None)
+
+    def after_driver_execute(
+        self,
+        connection: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        """Clears the cache and records the write when a textual write is executed directly on the driver.
+
+        Args:
+            connection: The connection the statement was executed on.
+            cursor: The DBAPI cursor.
+            statement: The SQL string.
+            parameters: The parameters of the statement.
+            context: The execution context.
+            executemany: Determines if the statement was executed with executemany.
+        """
+        if context is None or getattr(context, "compiled", None) is None:
+            words = statement.split(None, 1)
+            if words and words[0].upper() in WRITE_KEYWORDS:
+                self.clear()
+                self.add_pending(connection, None)
+
+    def attach(self, engine: Engine) -> Engine:
+        """Attaches this cache to the execution and transaction events of an engine so writes invalidate it.
+
+        Args:
+            engine: The engine to attach to.
+
+        Returns:
+            The engine.
+        """
+        event.listen(engine, "after_execute", self.after_execute)
+        event.listen(engine, "after_cursor_execute", self.after_driver_execute)
+        event.listen(engine, "commit", self.commit)
+        event.listen(engine, "rollback", self.rollback)
+        return engine
+
+    def detach(self, engine: Engine) -> None:
+        """Removes this cache from the execution and transaction events of an engine.
+
+        Args:
+            engine: The engine to detach from.
+        """
+        event.remove(engine, "after_execute", self.after_execute)
+        event.remove(engine, "after_cursor_execute", self.after_driver_execute)
+        event.remove(engine, "commit", self.commit)
+        event.remove(engine, "rollback", self.rollback)
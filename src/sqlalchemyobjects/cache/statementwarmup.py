@@ -0,0 +1,268 @@
+""" statementwarmup.py
+A registry of frequently used statements which are compiled into an engine's compiled cache at startup.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections.abc import Sequence
+from dataclasses import dataclass
+from threading import RLock
+from typing import Any
+
+# Third-Party Packages #
+from sqlalchemy import Connection
+from sqlalchemy import Engine
+from sqlalchemy import event
+from sqlalchemy.engine.interfaces import CacheStats
+
+
+# Definitions #
+# Classes #
+class _Compiled(Exception):
+    """Stops a warmup execution before it reaches the database, once its statement has been compiled.
+
+    Attributes:
+        cache_hit: The cache statistic of the compilation.
+
+    Args:
+        cache_hit: The cache statistic of the compilation.
+    """
+
+    def __init__(self, cache_hit: CacheStats) -> None:
+        super().__init__(cache_hit)
+        self.cache_hit: CacheStats = cache_hit
+
+
+@dataclass
+class WarmupEntry:
+    """A statement to compile at startup and the shape of the parameters it is executed with.
+
+    The compiled cache is keyed by the names of the parameters passed at execution and by whether the statement is
+    executed with executemany, so both must match how the statement is executed later.
+
+    Attributes:
+        name: The name of the statement.
+        statement: The select, insert, update, or delete construct.
+        column_keys: The names of the parameters the statement is executed with.
+        executemany: Determines if the statement is executed with many parameter sets.
+    """
+
+    name: str
+    statement: Any
+    column_keys: tuple[str, ...] = ()
+    executemany: bool = False
+
+
+class StatementWarmup:
+    """A registry of frequently used statements which are compiled into an engine's compiled cache at startup.
+
+    Each statement is executed on a connection of the engine and stopped just before its cursor runs, so it is compiled
+    into the engine's compiled cache, including a compiled_cache given in the engine's execution options, exactly as
+    Connection.execute would compile it, without touching the database. The first requests after a deploy then do
+    not pay the compilation cost. ORM selects hit the same cache entries when executed
+    by a Session, but ORM-enabled insert, update, and delete statements are rewritten by the Session and so only warm
+    when built from the Table, e.g. ``insert(Model.__table__)``.
+
+    Attributes:
+        entries: The statements to compile by name.
+        _lock: The lock which guards the entries.
+
+    Args:
+        entries: The statements to compile.
+        init: Determines if this object will construct.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(self, entries: Sequence[WarmupEntry] | None = None, *, init: bool = True) -> None:
+        # New Attributes #
+        self.entries: dict[str, WarmupEntry] = {}
+        self._lock: RLock = RLock()
+
+        # Object Construction #
+        if init:
+            self.construct(entries)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(self, entries: Sequence[WarmupEntry] | None = None) -> None:
+        """Constructs this object.
+
+        Args:
+            entries: The statements to compile.
+        """
+        if entries is not None:
+            for entry in entries:
+                self.entries[entry.name] = entry
+
+    # Registry
+    def register(
+        self,
+        statement: Any,
+        name: str | None = None,
+        column_keys: Sequence[str] = (),
+        executemany: bool = False,
+    ) -> Any:
+        """Adds a statement to compile at startup.
+
+        Args:
+            statement: The select, insert, update, or delete construct.
+            name: The name of the statement, defaults to its SQL string.
+            column_keys: The names of the parameters the statement is executed with.
+            executemany: Determines if the statement is executed with many parameter sets.
+
+        Returns:
+            The statement, so it can be registered where it is defined.
+        """
+        name = str(statement) if name is None else name
+        with self._lock:
+            self.entries[name] = WarmupEntry(name, statement, tuple(sorted(column_keys)), executemany)
+        return statement
+
+    def unregister(self, name: str) -> None:
+        """Removes a statement.
+
+        Args:
+            name: The name of the statement.
+        """
+        with self._lock:
+            self.entries.pop(name, None)
+
+    # Compiling
+    @staticmethod
+    def stop_execution(
+        connection: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        """Stops an execution before its cursor runs, raising the cache statistic of its compilation.
+
+        Args:
+            connection: The connection the statement is executed on.
+            cursor: The cursor the statement would run on.
+            statement: The compiled SQL string.
+            parameters: The parameters of the statement.
+            context: The execution context of the statement.
+            executemany: Determines if the statement is executed with many parameter sets.
+
+        Raises:
+            _Compiled: Always, with the cache statistic of the context.
+        """
+        raise _Compiled(context.cache_hit)
+
+    def compile(self, connection: Connection, entry: WarmupEntry) -> CacheStats:
+        """Compiles one statement through the compiled cache of a connection's engine without running it.
+
+        The statement is executed with None for each of its parameters, once for a single execution or twice for an
+        executemany, and stopped just before its cursor runs.
+
+        Args:
+            connection: A connection of the engine whose compiled cache is used.
+            entry: The statement to compile.
+
+        Returns:
+            The cache statistic, CACHE_MISS if it was compiled and cached, CACHE_HIT if it was already cached.
+        """
+        parameters = dict.fromkeys(entry.column_keys)
+        event.listen(connection, "before_cursor_execute", self.stop_execution)
+        try:
+            connection.execute(entry.statement, [parameters, parameters] if entry.executemany else parameters)
+        except _Compiled as compiled:
+            return compiled.cache_hit
+        finally:
+            event.remove(connection, "before_cursor_execute", self.stop_execution)
+            connection.rollback()
+        raise RuntimeError(f"Statement {entry.name!r} was not executed by a cursor.")
+
+    def compile_all(self, engine: Engine) -> dict[str, CacheStats]:
+        """Compiles all statements into the compiled cache of an engine without running them.
+
+        Args:
+            engine: The engine whose compiled cache is used.
+
+        Returns:
+            The cache statistic of each statement by name.
+        """
+        with self._lock:
+            entries = list(self.entries.values())
+        with engine.connect() as connection:
+            return {e.name: self.compile(connection, e) for e in entries}
+
+    def warm(self, engine: Engine) -> dict[str, CacheStats]:
+        """Compiles all statements into the compiled cache of an engine.
+
+        The statements are compiled on a connection, so the dialect is initialized with the server version, which
+        compilation depends on, and the pool holds a connection for the first request.
+
+        Args:
+            engine: The engine to warm.
+
+        Returns:
+            The cache statistic of each statement by name.
+        """
+        return self.compile_all(engine)
+
+    def verify(self, engine: Engine) -> dict[str, bool]:
+        """Checks which statements are in the compiled cache of an engine.
+
+        Statements which are not are compiled and cached by this check.
+
+        Args:
+            engine: The engine to check.
+
+        Returns:
+            If each statement hit the cache by name.
+        """
+        return {n: s == CacheStats.CACHE_HIT for n, s in self.compile_all(engine).items()}
+
+
+# Definitions #
+default_warmup = StatementWarmup()
+
+
+# Functions #
+def register_statement(
+    statement: Any,
+    name: str | None = None,
+    column_keys: Sequence[str] = (),
+    executemany: bool = False,
+) -> Any:
+    """Adds a statement to the default warmup.
+
+    Args:
+        statement: The select, insert, update, or delete construct.
+        name: The name of the statement, defaults to its SQL string.
+        column_keys: The names of the parameters the statement is executed with.
+        executemany: Determines if the statement is executed with many parameter sets.
+
+    Returns:
+        The statement, so it can be registered where it is defined.
+    """
+    return default_warmup.register(statement, name, column_keys, executemany)
+
+
+def warm_statements(engine: Engine) -> dict[str, CacheStats]:
+    """Compiles the statements of the default warmup into the compiled cache of an engine.
+
+    Args:
+        engine: The engine to warm.
+
+    Returns:
+        The cache statistic of each statement by name.
+    """
+    return default_warmup.warm(engine)
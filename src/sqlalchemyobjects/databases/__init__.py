@@ -0,0 +1,37 @@
+""" __init__.py
+Databases which pair shared engines with session factories.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Local Packages #
+from .asyncdatabase import AsyncDatabase
+from .database import Database
+from .eagerloadplanner import EagerLoadPlanner
+from .eagerloadplanner import QuerySite
+from .nplusonedetector import NPlusOneDetector
+from .nplusonedetector import NPlusOneError
+from .nplusonedetector import QueryAccount
+from .scopedsessionmanager import ScopedSessionManager
+from .scopedsessionmanager import ThreadScope
+
+
+__all__ = [
+    "AsyncDatabase",
+    "Database",
+    "EagerLoadPlanner",
+    "QuerySite",
+    "NPlusOneDetector",
+    "NPlusOneError",
+    "QueryAccount",
+    "ScopedSessionManager",
+    "ThreadScope",
+]
@@ -0,0 +1,213 @@
+""" asyncdatabase.py
+An asyncio database which pairs a shared asyncio engine with a session factory.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections.abc import AsyncIterable
+from collections.abc import AsyncIterator
+from collections.abc import Iterable
+from collections.abc import Mapping
+from collections.abc import Sequence
+from contextlib import asynccontextmanager
+from typing import Any
+
+# Third-Party Packages #
+from sqlalchemy import URL
+from sqlalchemy import MetaData
+from sqlalchemy import Select
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+# Local Packages #
+from ..bulk import BulkInserter
+from ..bulk import BulkReport
+from ..engines import EngineProfile
+from ..engines import EngineRegistry
+from ..engines import default_registry
+from ..utilities import expunge_partition
+
+
+# Definitions #
+# Classes #
+class AsyncDatabase:
+    """An asyncio database which pairs a shared asyncio engine with a session factory.
+
+    Blocking work such as bulk inserts runs on the connection's greenlet via run_sync, so the event loop keeps serving
+    other queries while it waits on the driver.
+
+    Attributes:
+        engine: The asyncio engine of the database.
+        session_factory: The factory which creates asyncio sessions bound to the engine.
+
+    Args:
+        url: The URL of the database, which must name an asyncio driver such as aiosqlite.
+        profile: The engine profile or the name of the profile.
+        engine: An existing asyncio engine to use instead of getting one from the registry.
+        registry: The registry to get the engine from, defaults to the shared registry.
+        init: Determines if this object will construct.
+        **kwargs: The keyword arguments for the session factory.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        url: str | URL | None = None,
+        profile: EngineProfile | str | None = None,
+        engine: AsyncEngine | None = None,
+        registry: EngineRegistry | None = None,
+        *,
+        init: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        # New Attributes #
+        self.engine: AsyncEngine | None = None
+        self.session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(expire_on_commit=False)
+
+        # Object Construction #
+        if init:
+            self.construct(url, profile, engine, registry, **kwargs)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(
+        self,
+        url: str | URL | None = None,
+        profile: EngineProfile | str | None = None,
+        engine: AsyncEngine | None = None,
+        registry: EngineRegistry | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Constructs this object.
+
+        Args:
+            url: The URL of the database, which must name an asyncio driver such as aiosqlite.
+            profile: The engine profile or the name of the profile.
+            engine: An existing asyncio engine to use instead of getting one from the registry.
+            registry: The registry to get the engine from, defaults to the shared registry.
+            **kwargs: The keyword arguments for the session factory.
+        """
+        if engine is not None:
+            self.engine = engine
+        elif url is not None:
+            registry = default_registry if registry is None else registry
+            self.engine = registry.get_async_engine(url, profile)
+
+        if kwargs:
+            self.session_factory.configure(**kwargs)
+
+        if self.engine is not None:
+            self.session_factory.configure(bind=self.engine)
+
+    # Engine
+    def get_engine(self) -> AsyncEngine:
+        """Gets the asyncio engine of this database.
+
+        Returns:
+            The asyncio engine.
+
+        Raises:
+            ValueError: If no URL or engine was given.
+        """
+        if self.engine is None:
+            raise ValueError(f"{type(self).__name__} has no engine, give it a URL or an engine.")
+        return self.engine
+
+    # Schema
+    async def create_all(self, metadata: MetaData) -> None:
+        """Creates the tables of a metadata which do not exist yet.
+
+        Args:
+            metadata: The metadata to create the tables of.
+        """
+        async with self.get_engine().begin() as connection:
+            await connection.run_sync(metadata.create_all)
+
+    # Sessions
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """Opens an asyncio session which commits when the block exits and rolls back when it raises.
+
+        Yields:
+            The asyncio session.
+        """
+        async with self.session_factory() as session:
+            try:
+                yield session
+                await session.commit()
+            except BaseException:
+                await session.rollback()
+                raise
+
+    # Bulk
+    async def bulk_insert(
+        self,
+        table: Any,
+        rows: Iterable[Mapping[str, Any] | Sequence[Any]] | AsyncIterable[Mapping[str, Any] | Sequence[Any]],
+        **kwargs: Any,
+    ) -> BulkReport:
+        """Inserts rows into a table in one transaction with a BulkInserter.
+
+        Rows from an asynchronous iterable are gathered one chunk at a time, so they are not materialized either.
+
+        Args:
+            table: The Table or mapped class to insert into.
+            rows: The rows as dictionaries or tuples from an iterable or asynchronous iterable.
+            **kwargs: The keyword arguments for the BulkInserter.
+
+        Returns:
+            The totals of the insert.
+        """
+        inserter = BulkInserter(table, **kwargs)
+        async with self.get_engine().begin() as connection:
+            if not isinstance(rows, AsyncIterable):
+                return await connection.run_sync(inserter.insert_chunks, rows)
+
+            chunk = []
+            async for row in rows:
+                chunk.append(row)
+                if len(chunk) >= inserter.chunk_size:
+                    await connection.run_sync(inserter.insert_chunks, chunk)
+                    chunk = []
+            if chunk:
+                await connection.run_sync(inserter.insert_chunks, chunk)
+            return inserter.report
+
+    # Streaming
+    async def stream(
+        self,
+        statement: Select[Any],
+        partition_size: int = 1000,
+        scalars: bool = True,
+    ) -> AsyncIterator[Sequence[Any]]:
+        """Streams the results of a select in partitions from a server-side cursor in its own session.
+
+        Objects of a partition are expunged once the next partition is requested, so the session stays bounded.
+
+        Args:
+            statement: The select to stream.
+            partition_size: The number of results per partition.
+            scalars: Determines if the first column of each row is yielded instead of the row.
+
+        Yields:
+            The next partition of results.
+        """
+        async with self.session_factory() as session:
+            result = await session.stream(statement, execution_options={"yield_per": partition_size})
+            try:
+                async for partition in (result.scalars() if scalars else result).partitions():
+                    yield partition
+                    expunge_partition(session.sync_session, partition)
+            finally:
+                await result.close()
@@ -0,0 +1,237 @@
+""" database.py
+A database which pairs a shared engine with a session factory.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from collections.abc import Sequence
+from contextlib import contextmanager
+from typing import Any
+
+# Third-Party Packages #
+from sqlalchemy import URL
+from sqlalchemy import Engine
+from sqlalchemy import MetaData
+from sqlalchemy import Select
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import sessionmaker
+
+# Local Packages #
+from ..bulk import BulkInserter
+from ..bulk import BulkReport
+from ..engines import EngineProfile
+from ..engines import EngineRegistry
+from ..engines import default_registry
+from ..utilities import expunge_partition
+from .eagerloadplanner import EagerLoadPlanner
+from .nplusonedetector import NPlusOneDetector
+
+
+# Definitions #
+# Classes #
+class Database:
+    """A database which pairs a shared engine with a session factory.
+
+    Attributes:
+        engine: The engine of the database.
+        session_factory: The factory which creates sessions bound to the engine.
+        detector: The N+1 detector instrumenting the sessions, None if not instrumented.
+        planner: The eager load planner of the sessions, None if not planned.
+
+    Args:
+        url: The URL of the database.
+        profile: The engine profile or the name of the profile.
+        engine: An existing engine to use instead of getting one from the registry.
+        registry: The registry to get the engine from, defaults to the shared registry.
+        detector: The N+1 detector to instrument the sessions with.
+        planner: The eager load planner to plan the queries of the sessions with.
+        init: Determines if this object will construct.
+        **kwargs: The keyword arguments for the session factory.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        url: str | URL | None = None,
+        profile: EngineProfile | str | None = None,
+        engine: Engine | None = None,
+        registry: EngineRegistry | None = None,
+        detector: NPlusOneDetector | None = None,
+        planner: EagerLoadPlanner | None = None,
+        *,
+        init: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        # New Attributes #
+        self.engine: Engine | None = None
+        self.session_factory: sessionmaker[Session] = sessionmaker(expire_on_commit=False)
+        self.detector: NPlusOneDetector | None = None
+        self.planner: EagerLoadPlanner | None = None
+
+        # Object Construction #
+        if init:
+            self.construct(url, profile, engine, registry, detector, planner, **kwargs)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(
+        self,
+        url: str | URL | None = None,
+        profile: EngineProfile | str | None = None,
+        engine: Engine | None = None,
+        registry: EngineRegistry | None = None,
+        detector: NPlusOneDetector | None = None,
+        planner: EagerLoadPlanner | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Constructs this object.
+
+        Args:
+            url: The URL of the database.
+            profile: The engine profile or the name of the profile.
+            engine: An existing engine to use instead of getting one from the registry.
+            registry: The registry to get the engine from, defaults to the shared registry.
+            detector: The N+1 detector to instrument the sessions with.
+            planner: The eager load planner to plan the queries of the sessions with.
+            **kwargs: The keyword arguments for the session factory.
+        """
+        previous_engine = self.engine
+        if engine is not None:
+            self.engine = engine
+        elif url is not None:
+            registry = default_registry if registry is None else registry
+            self.engine = registry.get_engine(url, profile)
+
+        if kwargs:
+            self.session_factory.configure(**kwargs)
+
+        if self.engine is not None:
+            self.session_factory.configure(bind=self.engine)
+
+        if detector is not None or self.engine is not previous_engine:
+            self.attach_detector(detector, attached=previous_engine is not None)
+
+        if planner is not None:
+            if self.planner is not None:
+                self.planner.detach(self.session_factory)
+            self.planner = planner
+            planner.attach(self.session_factory)
+
+    # Instrumentation
+    def attach_detector(self, detector: NPlusOneDetector | None = None, attached: bool = True) -> None:
+        """Replaces the N+1 detector of the sessions, which is only attached once this database has an engine.
+
+        Args:
+            detector: The new detector, defaults to reattaching the current detector.
+            attached: Determines if the current detector is attached and must be detached first.
+        """
+        if self.detector is not None and attached:
+            self.detector.detach(self.session_factory)
+
+        if detector is not None:
+            self.detector = detector
+
+        if self.detector is not None and self.engine is not None:
+            self.detector.attach(self.session_factory, self.engine)
+
+    # Engine
+    def get_engine(self) -> Engine:
+        """Gets the engine of this database.
+
+        Returns:
+            The engine.
+
+        Raises:
+            ValueError: If no URL or engine was given.
+        """
+        if self.engine is None:
+            raise ValueError(f"{type(self).__name__} has no engine, give it a URL or an engine.")
+        return self.engine
+
+    # Schema
+    def create_all(self, metadata: MetaData) -> None:
+        """Creates the tables of a metadata which do not exist yet.
+
+        Args:
+            metadata: The metadata to create the tables of.
+        """
+        metadata.create_all(self.get_engine())
+
+    # Sessions
+    @contextmanager
+    def session(self) -> Iterator[Session]:
+        """Opens a session which commits when the block exits and rolls back when it raises.
+
+        Yields:
+            The session.
+        """
+        with self.session_factory() as session:
+            try:
+                yield session
+                session.commit()
+            except BaseException:
+                session.rollback()
+                raise
+
+    # Bulk
+    def bulk_insert(
+        self,
+        table: Any,
+        rows: Iterable[Mapping[str, Any] | Sequence[Any]],
+        **kwargs: Any,
+    ) -> BulkReport:
+        """Inserts rows into a table in one transaction with a BulkInserter.
+
+        Args:
+            table: The Table or mapped class to insert into.
+            rows: The rows as dictionaries or tuples.
+            **kwargs: The keyword arguments for the BulkInserter.
+
+        Returns:
+            The totals of the insert.
+        """
+        return BulkInserter(table, **kwargs).insert(self.get_engine(), rows)
+
+    # Streaming
+    def stream(
+        self,
+        statement: Select[Any],
+        partition_size: int = 1000,
+        scalars: bool = True,
+    ) -> Iterator[Sequence[Any]]:
+        """Streams the results of a select in partitions from a server-side cursor in its own session.
+
+        Objects of a partition are expunged once the next partition is requested, so the session stays bounded.
+
+        Args:
+            statement: The select to stream.
+            partition_size: The number of results per partition.
+            scalars: Determines if the first column of each row is yielded instead of the row.
+
+        Yields:
+            The next partition of results.
+        """
+        with self.session_factory() as session:
+            result = session.execute(
+                statement,
+                execution_options={"stream_results": True, "yield_per": partition_size},
+            )
+            try:
+                for partition in (result.scalars() if scalars else result).partitions():
+                    yield partition
+                    expunge_partition(session, partition)
+            finally:
+                result.close()
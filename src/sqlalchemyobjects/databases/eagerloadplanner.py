@@ -0,0 +1,347 @@
+""" eagerloadplanner.py
+Learns which relationships are accessed after each query and eager loads them on later executions.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections import Counter
+from collections import deque
+from dataclasses import dataclass
+from dataclasses import field
+from threading import Lock
+from typing import Any
+
+# Third-Party Packages #
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState
+from sqlalchemy.orm import RelationshipProperty
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.interfaces import UserDefinedOption
+from sqlalchemy.sql.cache_key import HasCacheKey
+
+
+# Definitions #
+# Classes #
+class SampleOption(UserDefinedOption):
+    """Marks the objects loaded by a sampled execution so the lazy loads they trigger are recorded for its site.
+
+    The payload is the QuerySite and the set of relationship paths accessed in the sample. The option propagates to
+    lazy loads, so objects loaded by them are traced too, and it does not take part in the compiled cache key.
+    """
+
+    propagate_to_loaders = True
+    payload: tuple["QuerySite", set[tuple[RelationshipProperty[Any], ...]]]
+
+
+@dataclass
+class QuerySite:
+    """The relationship accesses observed after one query and the eager loading plan learned from them.
+
+    A site is one select shape, i.e. one compiled cache key, wherever it is executed from.
+
+    Attributes:
+        label: The SQL of the query.
+        executions: The number of times the query was executed.
+        samples: The relationship paths accessed in each recent sampled execution.
+        plan: The relationship paths which are eager loaded.
+        options: The loader options which eager load the plan.
+    """
+
+    label: str
+    executions: int = 0
+    samples: deque[set[tuple[RelationshipProperty[Any], ...]]] = field(default_factory=deque)
+    plan: tuple[tuple[RelationshipProperty[Any], ...], ...] = ()
+    options: tuple[Any, ...] = ()
+
+    # Instance Methods #
+    def get_frequencies(self) -> dict[tuple[RelationshipProperty[Any], ...], float]:
+        """Gets the fraction of the recent samples each relationship path was accessed in.
+
+        Returns:
+            The fraction of samples by relationship path.
+        """
+        counts = Counter(p for s in self.samples for p in s)
+        return {p: n / len(self.samples) for p, n in counts.most_common()}
+
+
+class EagerLoadPlanner:
+    """Learns which relationships are accessed after each query and eager loads them on later executions.
+
+    Each top level ORM select is identified by its compiled cache key. Sampled executions mark the objects they load,
+    and every lazy load of a relationship from those objects, directly or through other lazily or eagerly loaded
+    objects, is recorded as a relationship path of the query. Once min_samples executions were sampled, the paths
+    accessed in at least ratio of the recent samples are added to later executions as loader options, selectinload for
+    collections and joinedload for many-to-one relationships.
+
+    To notice access patterns going stale, every resample_interval-th execution of a planned query runs without the plan
+    as a new sample. Queries with their own loader options are never changed, only learned, so explicit annotations win.
+
+    Attributes:
+        window: The number of recent samples a plan is learned from.
+        min_samples: The number of samples a query needs before it is planned.
+        ratio: The fraction of samples a relationship must be accessed in to be eager loaded.
+        resample_interval: The number of executions between samples of a planned query, 0 never resamples.
+        max_sites: The largest number of queries learned.
+        sites: The learned queries by compiled cache key.
+        _lock: The lock which guards the sites.
+
+    Args:
+        window: The number of recent samples a plan is learned from.
+        min_samples: The number of samples a query needs before it is planned.
+        ratio: The fraction of samples a relationship must be accessed in to be eager loaded.
+        resample_interval: The number of executions between samples of a planned query, 0 never resamples.
+        max_sites: The largest number of queries learned.
+        init: Determines if this object will construct.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        window: int = 20,
+        min_samples: int = 3,
+        ratio: float = 0.5,
+        resample_interval: int = 100,
+        max_sites: int = 1000,
+        *,
+        init: bool = True,
+    ) -> None:
+        # New Attributes #
+        self.window: int = 20
+        self.min_samples: int = 3
+        self.ratio: float = 0.5
+        self.resample_interval: int = 100
+        self.max_sites: int = 1000
+        self.sites: dict[Any, QuerySite] = {}
+        self._lock: Lock = Lock()
+
+        # Object Construction #
+        if init:
+            self.construct(window, min_samples, ratio, resample_interval, max_sites)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(
+        self,
+        window: int | None = None,
+        min_samples: int | None = None,
+        ratio: float | None = None,
+        resample_interval: int | None = None,
+        max_sites: int | None = None,
+    ) -> None:
+        """Constructs this object.
+
+        Args:
+            window: The number of recent samples a plan is learned from.
+            min_samples: The number of samples a query needs before it is planned.
+            ratio: The fraction of samples a relationship must be accessed in to be eager loaded.
+            resample_interval: The number of executions between samples of a planned query, 0 never resamples.
+            max_sites: The largest number of queries learned.
+        """
+        if window is not None:
+            self.window = window
+
+        if min_samples is not None:
+            self.min_samples = min_samples
+
+        if ratio is not None:
+            self.ratio = ratio
+
+        if resample_interval is not None:
+            self.resample_interval = resample_interval
+
+        if max_sites is not None:
+            self.max_sites = max_sites
+
+    # Planning
+    @staticmethod
+    def describe_path(path: tuple[RelationshipProperty[Any], ...]) -> str:
+        """Describes a relationship path, e.g. ``Parent.children.toys``.
+
+        Args:
+            path: The relationships from the queried entity.
+
+        Returns:
+            The description of the path.
+        """
+        return ".".join([str(path[0]), *(p.key for p in path[1:])])
+
+    @staticmethod
+    def describe_option(path: tuple[RelationshipProperty[Any], ...]) -> str:
+        """Describes the loader option which eager loads a relationship path, e.g. ``selectinload(Parent.children)``.
+
+        Args:
+            path: The relationships from the queried entity.
+
+        Returns:
+            The description of the loader option.
+        """
+        return ".".join(f"{'selectinload' if r.uselist else 'joinedload'}({r})" for r in path)
+
+    @staticmethod
+    def create_option(path: tuple[RelationshipProperty[Any], ...]) -> Any:
+        """Creates the loader option which eager loads a relationship path.
+
+        Args:
+            path: The relationships from the queried entity.
+
+        Returns:
+            The loader option.
+        """
+        option = None
+        for relationship in path:
+            loader = selectinload if relationship.uselist else joinedload
+            attribute = relationship.class_attribute
+            option = loader(attribute) if option is None else getattr(option, loader.__name__)(attribute)
+        return option
+
+    def update_plan(self, site: QuerySite) -> None:
+        """Learns the plan of a query from its recent samples.
+
+        Args:
+            site: The query to plan.
+        """
+        if len(site.samples) < self.min_samples:
+            return
+
+        plan = tuple(sorted((p for p, f in site.get_frequencies().items() if f >= self.ratio), key=len))
+        if plan != site.plan:
+            site.plan = plan
+            site.options = tuple(self.create_option(p) for p in plan)
+
+    def get_site(self, state: ORMExecuteState) -> QuerySite | None:
+        """Gets the site of a top level select, creating it on first execution.
+
+        Args:
+            state: The state of the ORM execution.
+
+        Returns:
+            The site, None if the select is not cacheable or too many sites are learned.
+        """
+        statement = state.statement
+        cache_key = statement._generate_cache_key() if isinstance(statement, HasCacheKey) else None
+        if cache_key is None:
+            return None
+
+        site = self.sites.get(cache_key.key, None)
+        if site is None and len(self.sites) < self.max_sites:
+            site = self.sites[cache_key.key] = QuerySite(str(state.statement))
+        return site
+
+    # Session Events
+    def do_orm_execute(self, state: ORMExecuteState) -> None:
+        """Applies the plan to top level selects, or samples them, and records the lazy loads of sampled objects.
+
+        Args:
+            state: The state of the ORM execution.
+        """
+        # The load options, which hold the lazy loaded state, only exist for selects.
+        if not state.is_select:
+            return
+
+        if state.lazy_loaded_from is not None:
+            self.record(state)
+            return
+
+        if state.is_relationship_load or state.is_column_load:
+            return
+
+        statement = state.statement
+        if any(isinstance(o, SampleOption) for o in state.user_defined_options):
+            return
+        explicit = any(getattr(o, "_is_strategy_option", False) for o in statement._with_options)
+
+        with self._lock:
+            site = self.get_site(state)
+            if site is None:
+                return
+
+            site.executions += 1
+            resample = bool(self.resample_interval) and site.executions % self.resample_interval == 0
+            sampling = explicit or resample or not site.plan
+            if sampling:
+                # The samples so far may be enough to plan this execution.
+                self.update_plan(site)
+                sampling = explicit or resample or not site.plan
+
+            if sampling:
+                sample: set[tuple[RelationshipProperty[Any], ...]] = set()
+                site.samples.append(sample)
+                while len(site.samples) > self.window:
+                    site.samples.popleft()
+                options = (SampleOption((site, sample)),)
+            else:
+                options = site.options
+
+        state.statement = statement.options(*options)
+
+    def record(self, state: ORMExecuteState) -> None:
+        """Records the relationship path of a lazy load from the objects of a sampled execution.
+
+        Args:
+            state: The state of the lazy load.
+        """
+        path_registry = state.loader_strategy_path
+        if path_registry is None:
+            return
+
+        for option in state.user_defined_options:
+            if isinstance(option, SampleOption):
+                path = tuple(p for p in path_registry.path[1::2] if isinstance(p, RelationshipProperty))
+                with self._lock:
+                    option.payload[1].add(path)
+                return
+
+    # Reporting
+    def report(self) -> list[dict[str, Any]]:
+        """Summarizes the learned plan of each query, most executed first.
+
+        Returns:
+            The report as JSON serializable values.
+        """
+        with self._lock:
+            sites = sorted(self.sites.values(), key=lambda s: s.executions, reverse=True)
+            return [
+                {
+                    "query": site.label,
+                    "executions": site.executions,
+                    "samples": len(site.samples),
+                    "accesses": {self.describe_path(p): f for p, f in site.get_frequencies().items()},
+                    "plan": [self.describe_option(p) for p in site.plan],
+                }
+                for site in sites
+            ]
+
+    def reset(self) -> None:
+        """Forgets all learned queries."""
+        with self._lock:
+            self.sites.clear()
+
+    # Attachment
+    def attach(self, sessions: sessionmaker[Session] | type[Session] | Session) -> None:
+        """Attaches this planner to the sessions of a factory.
+
+        Args:
+            sessions: The sessionmaker, Session class, or session to plan the queries of.
+        """
+        event.listen(sessions, "do_orm_execute", self.do_orm_execute)
+
+    def detach(self, sessions: sessionmaker[Session] | type[Session] | Session) -> None:
+        """Removes this planner from the sessions of a factory.
+
+        Args:
+            sessions: The sessionmaker, Session class, or session to stop planning the queries of.
+        """
+        event.remove(sessions, "do_orm_execute", self.do_orm_execute)
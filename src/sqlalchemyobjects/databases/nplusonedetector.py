@@ -0,0 +1,292 @@
+""" nplusonedetector.py
+Counts the statements of each session and detects relationships which are lazy loaded once per parent row.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import logging
+import re
+from collections import Counter
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+# Third-Party Packages #
+from sqlalchemy import Connection
+from sqlalchemy import Engine
+from sqlalchemy import event
+from sqlalchemy.orm import ORMExecuteState
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import SessionTransaction
+from sqlalchemy.orm import sessionmaker
+
+# Definitions #
+_logger = logging.getLogger(__name__)
+
+ACCOUNT_KEY = "sqlalchemyobjects_query_account"
+CONNECTIONS_KEY = "sqlalchemyobjects_query_connections"
+
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_PARAMETERS = re.compile(r"(?:\?|%s|%\(\w+\)s|:\w+|\$\d+|\[POSTCOMPILE_\w+\])")
+_LISTS = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACES = re.compile(r"\s+")
+
+
+# Functions #
+def fingerprint(statement: str) -> str:
+    """Normalizes a SQL string so statements which differ only in literals and parameters compare equal.
+
+    Args:
+        statement: The SQL string.
+
+    Returns:
+        The SQL with literals and parameters replaced by ? and lists of them collapsed.
+    """
+    statement = _LITERALS.sub("?", statement)
+    statement = _PARAMETERS.sub("?", statement)
+    statement = _LISTS.sub("(?)", statement)
+    return _SPACES.sub(" ", statement).strip()
+
+
+# Classes #
+class NPlusOneError(RuntimeError):
+    """Raised when a relationship is lazy loaded more times than allowed in one session."""
+
+
+@dataclass
+class QueryAccount:
+    """The statements executed by one session.
+
+    Attributes:
+        statements: The number of statements executed.
+        fingerprints: The number of statements executed by fingerprint.
+        lazy_loads: The number of lazy loads by relationship attribute.
+        lazy_fingerprints: The fingerprint of the statement of each lazily loaded relationship attribute.
+        lazy_attribute: The relationship attribute whose lazy load statement is about to execute.
+    """
+
+    statements: int = 0
+    fingerprints: Counter[str] = field(default_factory=Counter)
+    lazy_loads: Counter[str] = field(default_factory=Counter)
+    lazy_fingerprints: dict[str, str] = field(default_factory=dict)
+    lazy_attribute: str | None = None
+
+    # Instance Methods #
+    def report(self, threshold: int = 0) -> dict[str, Any]:
+        """Summarizes the statements and the lazy loads above a threshold.
+
+        Args:
+            threshold: The number of lazy loads of an attribute above which it is reported.
+
+        Returns:
+            The report as JSON serializable values.
+        """
+        return {
+            "statements": self.statements,
+            "distinct": len(self.fingerprints),
+            "repeated": {f: n for f, n in self.fingerprints.most_common() if n > 1},
+            "lazy_loads": {
+                a: {"count": n, "fingerprint": self.lazy_fingerprints.get(a, None)}
+                for a, n in self.lazy_loads.most_common()
+                if n > threshold
+            },
+        }
+
+
+class NPlusOneDetector:
+    """Counts the statements of each session and detects relationships which are lazy loaded once per parent row.
+
+    Every statement a session executes, including flushes, is counted and fingerprinted in the QueryAccount of the
+    session. When one relationship attribute is lazy loaded more than threshold times in a session, which is the
+    signature of an N+1 query, it is logged as a warning or, if raise_error is set, the load raises NPlusOneError
+    naming the attribute, e.g. ``Parent.children``.
+
+    Attributes:
+        threshold: The number of lazy loads of one attribute allowed per session.
+        raise_error: Determines if exceeding the threshold raises rather than logs.
+        engines: The engines this detector listens to.
+
+    Args:
+        threshold: The number of lazy loads of one attribute allowed per session.
+        raise_error: Determines if exceeding the threshold raises rather than logs.
+        init: Determines if this object will construct.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(self, threshold: int = 10, raise_error: bool = False, *, init: bool = True) -> None:
+        # New Attributes #
+        self.threshold: int = 10
+        self.raise_error: bool = False
+        self.engines: list[Engine] = []
+
+        # Object Construction #
+        if init:
+            self.construct(threshold, raise_error)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(self, threshold: int | None = None, raise_error: bool | None = None) -> None:
+        """Constructs this object.
+
+        Args:
+            threshold: The number of lazy loads of one attribute allowed per session.
+            raise_error: Determines if exceeding the threshold raises rather than logs.
+        """
+        if threshold is not None:
+            self.threshold = threshold
+
+        if raise_error is not None:
+            self.raise_error = raise_error
+
+    # Accounts
+    def get_account(self, session: Session) -> QueryAccount:
+        """Gets the account of a session, creating it on first use.
+
+        Args:
+            session: The session to get the account of.
+
+        Returns:
+            The account of the session.
+        """
+        account = session.info.get(ACCOUNT_KEY, None)
+        if account is None:
+            account = session.info[ACCOUNT_KEY] = QueryAccount()
+        return account
+
+    def reset_account(self, session: Session) -> QueryAccount:
+        """Starts a new account for a session, e.g. at the start of a request.
+
+        Args:
+            session: The session to reset the account of.
+
+        Returns:
+            The new account.
+        """
+        account = session.info[ACCOUNT_KEY] = QueryAccount()
+        for info in session.info.get(CONNECTIONS_KEY, ()):
+            info[ACCOUNT_KEY] = account
+        return account
+
+    # Session Events
+    def after_begin(self, session: Session, transaction: SessionTransaction, connection: Connection) -> None:
+        """Routes the statements of a connection the session begins using to the account of the session.
+
+        Args:
+            session: The session which began.
+            transaction: The transaction of the session.
+            connection: The connection the session uses.
+        """
+        connection.info[ACCOUNT_KEY] = self.get_account(session)
+        # The info of the pooled connection is kept since the connection may be closed when the transaction ends.
+        session.info.setdefault(CONNECTIONS_KEY, []).append(connection.info)
+
+    def after_transaction_end(self, session: Session, transaction: SessionTransaction) -> None:
+        """Stops routing statements to the session once its outermost transaction ends.
+
+        Args:
+            session: The session whose transaction ended.
+            transaction: The transaction which ended.
+        """
+        if transaction.parent is None:
+            for info in session.info.pop(CONNECTIONS_KEY, ()):
+                info.pop(ACCOUNT_KEY, None)
+
+    def do_orm_execute(self, state: ORMExecuteState) -> None:
+        """Counts lazy loads by relationship attribute and reports the attributes which exceed the threshold.
+
+        Args:
+            state: The state of the ORM execution.
+
+        Raises:
+            NPlusOneError: If raise_error is set and the threshold is exceeded.
+        """
+        # The load options, which hold the lazy loaded state, only exist for selects.
+        path = state.loader_strategy_path
+        if not state.is_select or state.lazy_loaded_from is None or not state.is_relationship_load or path is None:
+            return
+
+        account = self.get_account(state.session)
+        attribute = str(path[-1])
+        account.lazy_attribute = attribute
+        account.lazy_loads[attribute] += 1
+        count = account.lazy_loads[attribute]
+        if count > self.threshold:
+            message = (
+                f"{attribute} was lazy loaded {count} times in one session, an N+1 query; "
+                f"eager load it with selectinload({attribute}) or joinedload({attribute}). "
+                f"Statement: {account.lazy_fingerprints.get(attribute, '?')}"
+            )
+            if self.raise_error:
+                account.lazy_attribute = None
+                raise NPlusOneError(message)
+            elif count == self.threshold + 1:
+                _logger.warning(message)
+
+    # Engine Events
+    def before_cursor_execute(
+        self,
+        connection: Connection,
+        cursor: Any,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        """Counts and fingerprints a statement in the account of the session using the connection.
+
+        Args:
+            connection: The connection the statement is executed on.
+            cursor: The DBAPI cursor.
+            statement: The SQL string.
+            parameters: The parameters of the statement.
+            context: The execution context.
+            executemany: Determines if the statement is executed with executemany.
+        """
+        account = connection.info.get(ACCOUNT_KEY, None)
+        if account is None:
+            return
+
+        key = fingerprint(statement)
+        account.statements += 1
+        account.fingerprints[key] += 1
+        if account.lazy_attribute is not None:
+            account.lazy_fingerprints.setdefault(account.lazy_attribute, key)
+            account.lazy_attribute = None
+
+    # Attachment
+    def attach(self, sessions: sessionmaker[Session] | type[Session] | Session, engine: Engine) -> None:
+        """Attaches this detector to the sessions of a factory and the engine they use.
+
+        Args:
+            sessions: The sessionmaker, Session class, or session to instrument.
+            engine: The engine the sessions execute on.
+        """
+        event.listen(sessions, "after_begin", self.after_begin)
+        event.listen(sessions, "after_transaction_end", self.after_transaction_end)
+        event.listen(sessions, "do_orm_execute", self.do_orm_execute)
+        if engine not in self.engines:
+            event.listen(engine, "before_cursor_execute", self.before_cursor_execute)
+            self.engines.append(engine)
+
+    def detach(self, sessions: sessionmaker[Session] | type[Session] | Session) -> None:
+        """Removes this detector from the sessions of a factory and from its engines.
+
+        Args:
+            sessions: The sessionmaker, Session class, or session to stop instrumenting.
+        """
+        event.remove(sessions, "after_begin", self.after_begin)
+        event.remove(sessions, "after_transaction_end", self.after_transaction_end)
+        event.remove(sessions, "do_orm_execute", self.do_orm_execute)
+        for engine in self.engines:
+            event.remove(engine, "before_cursor_execute", self.before_cursor_execute)
+        self.engines.clear()
@@ -0,0 +1,209 @@
+""" scopedsessionmanager.py
+A manager of thread-local sessions which pins each thread to one pooled connection per unit of work.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import threading
+import weakref
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any
+
+# Third-Party Packages #
+from sqlalchemy import Connection
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import sessionmaker
+
+
+# Definitions #
+# Classes #
+class ThreadScope:
+    """The session and connection of one thread.
+
+    Attributes:
+        session: The session of the thread.
+        connection: The connection pinned to the thread for the current unit of work.
+        depth: The number of nested units of work the thread is in.
+    """
+
+    __slots__ = ("session", "connection", "depth", "__weakref__")
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(self) -> None:
+        # New Attributes #
+        self.session: Session | None = None
+        self.connection: Connection | None = None
+        self.depth: int = 0
+
+    # Static Methods #
+    @staticmethod
+    def release(session: Session | None, connection: Connection | None) -> None:
+        """Closes a session and returns a connection to its pool.
+
+        Args:
+            session: The session to close.
+            connection: The connection to close.
+        """
+        if session is not None:
+            session.close()
+        if connection is not None:
+            connection.close()
+
+    # Instance Methods #
+    def close(self) -> None:
+        """Closes the session and returns the connection of this scope to the pool."""
+        session, connection = self.session, self.connection
+        self.session = self.connection = None
+        self.depth = 0
+        self.release(session, connection)
+
+
+class ScopedSessionManager:
+    """A manager of thread-local sessions which pins each thread to one pooled connection per unit of work.
+
+    A unit of work checks a connection out once and binds the thread's session to it, so every transaction the
+    session commits inside the unit of work reuses that connection instead of going back through the pool. Sessions
+    and connections still open when a thread exits are released when its thread-local storage is collected.
+
+    Attributes:
+        engine: The engine the sessions connect with.
+        session_factory: The factory which creates the sessions.
+        _local: The thread-local storage of the scopes.
+        _scopes: The scopes of all live threads.
+        _lock: The lock which serializes access to the scopes of all threads.
+
+    Args:
+        engine: The engine the sessions connect with.
+        init: Determines if this object will construct.
+        **kwargs: The keyword arguments for the session factory.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(self, engine: Engine | None = None, *, init: bool = True, **kwargs: Any) -> None:
+        # New Attributes #
+        self.engine: Engine | None = None
+        self.session_factory: sessionmaker[Session] = sessionmaker(expire_on_commit=False)
+        self._local: threading.local = threading.local()
+        self._scopes: weakref.WeakSet[ThreadScope] = weakref.WeakSet()
+        self._lock: threading.Lock = threading.Lock()
+
+        # Object Construction #
+        if init:
+            self.construct(engine, **kwargs)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(self, engine: Engine | None = None, **kwargs: Any) -> None:
+        """Constructs this object.
+
+        Args:
+            engine: The engine the sessions connect with.
+            **kwargs: The keyword arguments for the session factory.
+        """
+        if engine is not None:
+            self.engine = engine
+
+        if kwargs:
+            self.session_factory.configure(**kwargs)
+
+    # Engine
+    def get_engine(self) -> Engine:
+        """Gets the engine the sessions connect with.
+
+        Returns:
+            The engine.
+
+        Raises:
+            ValueError: If no engine was given.
+        """
+        if self.engine is None:
+            raise ValueError(f"{type(self).__name__} has no engine to connect with.")
+        return self.engine
+
+    # Scopes
+    def get_scope(self) -> ThreadScope:
+        """Gets the scope of the current thread, creating it if it does not exist.
+
+        Returns:
+            The scope of the current thread.
+        """
+        scope = getattr(self._local, "scope", None)
+        if scope is None:
+            scope = self._local.scope = ThreadScope()
+            with self._lock:
+                self._scopes.add(scope)
+        return scope
+
+    @property
+    def session(self) -> Session:
+        """The session of the current thread, bound to the pinned connection inside a unit of work."""
+        scope = self.get_scope()
+        if scope.session is None:
+            scope.session = self.session_factory(bind=self.engine)
+            weakref.finalize(scope, ThreadScope.release, scope.session, None)
+        return scope.session
+
+    def remove(self) -> None:
+        """Closes the session of the current thread and returns its connection to the pool."""
+        scope = getattr(self._local, "scope", None)
+        if scope is not None:
+            scope.close()
+            del self._local.scope
+
+    def close_all(self) -> None:
+        """Closes the sessions of all threads and returns their connections to the pool."""
+        with self._lock:
+            scopes = list(self._scopes)
+        for scope in scopes:
+            scope.close()
+
+    # Units of Work
+    @contextmanager
+    def unit_of_work(self) -> Iterator[Session]:
+        """Pins a pooled connection to the current thread and yields the thread's session bound to it.
+
+        The outermost unit of work commits when its block exits, rolls back when it raises, and then returns the
+        connection to the pool. Nested units of work share the outer session and transaction.
+
+        Yields:
+            The session of the current thread.
+        """
+        scope = self.get_scope()
+        if scope.depth > 0:
+            scope.depth += 1
+            try:
+                yield self.session
+            finally:
+                scope.depth -= 1
+            return
+
+        if scope.session is not None:
+            scope.close()
+        scope.connection = connection = self.get_engine().connect()
+        scope.session = session = self.session_factory(bind=connection)
+        finalizer = weakref.finalize(scope, ThreadScope.release, session, connection)
+        scope.depth = 1
+        try:
+            yield session
+            session.commit()
+            connection.commit()
+        except BaseException:
+            session.rollback()
+            connection.rollback()
+            raise
+        finally:
+            finalizer.detach()
+            scope.close()
@@ -0,0 +1,37 @@
+""" __init__.py
+Engine construction tools which build and reuse tuned SQLAlchemy engines.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Local Packages #
+from .engineprofile import EngineProfile
+from .engineregistry import EngineRegistry
+from .engineregistry import default_registry
+from .engineregistry import get_async_engine
+from .engineregistry import get_engine
+from .enginetemplate import EngineTemplate
+from .sqlitepragmas import READ_MOSTLY_PRAGMAS
+from .sqlitepragmas import WRITE_HEAVY_PRAGMAS
+from .sqlitepragmas import SQLitePragmaManager
+
+
+__all__ = [
+    "EngineProfile",
+    "EngineRegistry",
+    "default_registry",
+    "get_async_engine",
+    "get_engine",
+    "EngineTemplate",
+    "READ_MOSTLY_PRAGMAS",
+    "WRITE_HEAVY_PRAGMAS",
+    "SQLitePragmaManager",
+]
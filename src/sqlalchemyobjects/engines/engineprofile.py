@@ -0,0 +1,121 @@
+""" engineprofile.py
+A named set of pool and connection settings used to build engines.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections.abc import Callable
+from collections.abc import Mapping
+from dataclasses import dataclass
+from dataclasses import field
+from dataclasses import fields
+from dataclasses import replace
+from typing import Any
+
+# Third-Party Packages #
+from sqlalchemy.pool import Pool
+from sqlalchemy.pool import QueuePool
+
+# Local Packages #
+from .sqlitepragmas import READ_MOSTLY_PRAGMAS
+from .sqlitepragmas import WRITE_HEAVY_PRAGMAS
+
+
+# Definitions #
+# Classes #
+@dataclass(frozen=True)
+class EngineProfile:
+    """A named set of pool and connection settings used to build engines.
+
+    Attributes:
+        name: The name of this profile.
+        poolclass: The pool type to use, None lets SQLAlchemy choose one for the dialect.
+        pool_size: The number of connections to keep open in the pool.
+        max_overflow: The number of connections allowed beyond the pool size.
+        pool_timeout: The seconds to wait for a connection before giving up.
+        pool_pre_ping: Determines if connections are tested for liveness on checkout.
+        pool_recycle: The seconds after which a connection is replaced, -1 disables recycling.
+        pragmas: The SQLite pragmas applied to every pooled connection by a SQLitePragmaManager.
+        connect_hooks: The callables to run on every new DBAPI connection as (dbapi_connection, connection_record).
+        connect_args: The keyword arguments passed to the DBAPI connect call.
+        engine_kwargs: Additional keyword arguments passed to create_engine.
+    """
+
+    name: str
+    poolclass: type[Pool] | None = QueuePool
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_pre_ping: bool = True
+    pool_recycle: int = -1
+    pragmas: Mapping[str, Any] = field(default_factory=dict)
+    connect_hooks: tuple[Callable[[Any, Any], None], ...] = ()
+    connect_args: Mapping[str, Any] = field(default_factory=dict)
+    engine_kwargs: Mapping[str, Any] = field(default_factory=dict)
+
+    # Instance Methods #
+    def evolve(self, **kwargs: Any) -> "EngineProfile":
+        """Creates a copy of this profile with the given fields replaced.
+
+        Args:
+            **kwargs: The fields to replace.
+
+        Returns:
+            The new profile.
+        """
+        return replace(self, **kwargs)
+
+    def create_key(self) -> tuple[tuple[str, str], ...]:
+        """Creates a hashable key of all the settings of this profile.
+
+        Mappings are compared by their sorted items, so profiles with equal settings have equal keys.
+
+        Returns:
+            The name and representation of each field.
+        """
+        values = ((f.name, getattr(self, f.name)) for f in fields(self))
+        return tuple((n, repr(sorted(v.items()) if isinstance(v, Mapping) else v)) for n, v in values)
+
+
+# Definitions #
+GENERIC_QUEUEPOOL = EngineProfile(
+    name="generic-queuepool",
+    poolclass=QueuePool,
+    pool_size=10,
+    max_overflow=20,
+    pool_pre_ping=True,
+    pool_recycle=1800,
+)
+
+SQLITE_WAL_READHEAVY = EngineProfile(
+    name="sqlite-wal-readheavy",
+    poolclass=QueuePool,
+    pool_size=8,
+    max_overflow=8,
+    pool_pre_ping=False,
+    pragmas=READ_MOSTLY_PRAGMAS,
+    connect_args={"check_same_thread": False},
+)
+
+SQLITE_BULK_LOAD = EngineProfile(
+    name="sqlite-bulk-load",
+    poolclass=QueuePool,
+    pool_size=1,
+    max_overflow=0,
+    pool_pre_ping=False,
+    pragmas=WRITE_HEAVY_PRAGMAS,
+    connect_args={"check_same_thread": False},
+)
+
+DEFAULT_PROFILES: dict[str, EngineProfile] = {
+    p.name: p for p in (GENERIC_QUEUEPOOL, SQLITE_WAL_READHEAVY, SQLITE_BULK_LOAD)
+}
@@ -0,0 +1,207 @@
+""" engineregistry.py
+A registry which reuses one engine per URL and profile.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from threading import RLock
+from typing import Any
+
+# Third-Party Packages #
+from sqlalchemy import URL
+from sqlalchemy import Engine
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Local Packages #
+from .engineprofile import EngineProfile
+from .enginetemplate import EngineTemplate
+
+
+# Definitions #
+# Classes #
+class EngineRegistry:
+    """A registry which reuses one engine per URL and profile so each process keeps a single pool per database.
+
+    Attributes:
+        template_type: The template type used to build new engines.
+        engines: The engines built by this registry keyed by URL, profile name, and profile settings.
+        async_engines: The asyncio engines built by this registry keyed by URL, profile name, and profile settings.
+        _lock: The lock which serializes engine creation between threads.
+
+    Args:
+        template_type: The template type used to build new engines.
+        init: Determines if this object will construct.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(self, template_type: type[EngineTemplate] | None = None, *, init: bool = True) -> None:
+        # New Attributes #
+        self.template_type: type[EngineTemplate] = EngineTemplate
+        self.engines: dict[tuple[str, str, tuple[tuple[str, str], ...]], Engine] = {}
+        self.async_engines: dict[tuple[str, str, tuple[tuple[str, str], ...]], AsyncEngine] = {}
+        self._lock: RLock = RLock()
+
+        # Object Construction #
+        if init:
+            self.construct(template_type)
+
+    def __contains__(self, url: str | URL) -> bool:
+        url = make_url(url).render_as_string(hide_password=False)
+        return any(key[0] == url for key in self.engines)
+
+    def __len__(self) -> int:
+        return len(self.engines)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(self, template_type: type[EngineTemplate] | None = None) -> None:
+        """Constructs this object.
+
+        Args:
+            template_type: The template type used to build new engines.
+        """
+        if template_type is not None:
+            self.template_type = template_type
+
+    # Engines
+    def create_key(
+        self,
+        url: str | URL,
+        profile: EngineProfile | str | None = None,
+        kwargs: dict[str, Any] | None = None,
+    ) -> tuple[str, str, tuple[tuple[str, str], ...]]:
+        """Creates the key which identifies an engine in this registry.
+
+        The key holds every setting of the profile after the overrides are applied, so an evolved profile which keeps
+        the name of its original gets its own engine.
+
+        Args:
+            url: The URL of the database.
+            profile: The profile or the name of the profile.
+            kwargs: The keyword arguments which override the profile.
+
+        Returns:
+            The key of the engine.
+        """
+        profile = self.template_type.get_profile(profile)
+        if kwargs:
+            profile = profile.evolve(**kwargs)
+        return make_url(url).render_as_string(hide_password=False), profile.name, profile.create_key()
+
+    def get_engine(self, url: str | URL, profile: EngineProfile | str | None = None, **kwargs: Any) -> Engine:
+        """Gets the engine for a URL and profile, building it if it does not exist yet.
+
+        Args:
+            url: The URL of the database.
+            profile: The profile or the name of the profile.
+            **kwargs: Fields which override the fields of the profile.
+
+        Returns:
+            The engine for the URL and profile.
+        """
+        key = self.create_key(url, profile, kwargs)
+        engine = self.engines.get(key, None)
+        if engine is None:
+            with self._lock:
+                engine = self.engines.get(key, None)
+                if engine is None:
+                    engine = self.engines[key] = self.template_type(profile, **kwargs).build(url)
+        return engine
+
+    def get_async_engine(
+        self,
+        url: str | URL,
+        profile: EngineProfile | str | None = None,
+        **kwargs: Any,
+    ) -> AsyncEngine:
+        """Gets the asyncio engine for a URL and profile, building it if it does not exist yet.
+
+        Args:
+            url: The URL of the database, which must name an asyncio driver such as aiosqlite.
+            profile: The profile or the name of the profile.
+            **kwargs: Fields which override the fields of the profile.
+
+        Returns:
+            The asyncio engine for the URL and profile.
+        """
+        key = self.create_key(url, profile, kwargs)
+        engine = self.async_engines.get(key, None)
+        if engine is None:
+            with self._lock:
+                engine = self.async_engines.get(key, None)
+                if engine is None:
+                    engine = self.async_engines[key] = self.template_type(profile, **kwargs).build_async(url)
+        return engine
+
+    def dispose(self, url: str | URL | None = None, profile: EngineProfile | str | None = None) -> None:
+        """Disposes and removes engines from this registry.
+
+        Args:
+            url: The URL of the engines to dispose, None disposes the engines for all URLs.
+            profile: The profile of the engines to dispose, None disposes the engines for all profiles.
+        """
+        url = None if url is None else make_url(url).render_as_string(hide_password=False)
+        name = None if profile is None else self.template_type.get_profile(profile).name
+        with self._lock:
+            for key in list(self.engines):
+                if (url is None or key[0] == url) and (name is None or key[1] == name):
+                    self.engines.pop(key).dispose()
+
+    async def dispose_async(self, url: str | URL | None = None, profile: EngineProfile | str | None = None) -> None:
+        """Disposes and removes asyncio engines from this registry.
+
+        Args:
+            url: The URL of the engines to dispose, None disposes the engines for all URLs.
+            profile: The profile of the engines to dispose, None disposes the engines for all profiles.
+        """
+        url = None if url is None else make_url(url).render_as_string(hide_password=False)
+        name = None if profile is None else self.template_type.get_profile(profile).name
+        with self._lock:
+            keys = [k for k in self.async_engines if (url is None or k[0] == url) and (name is None or k[1] == name)]
+            engines = [self.async_engines.pop(k) for k in keys]
+        for engine in engines:
+            await engine.dispose()
+
+
+# Definitions #
+default_registry = EngineRegistry()
+
+
+# Functions #
+def get_engine(url: str | URL, profile: EngineProfile | str | None = None, **kwargs: Any) -> Engine:
+    """Gets the shared engine for a URL and profile from the default registry.
+
+    Args:
+        url: The URL of the database.
+        profile: The profile or the name of the profile.
+        **kwargs: Fields which override the fields of the profile.
+
+    Returns:
+        The engine for the URL and profile.
+    """
+    return default_registry.get_engine(url, profile, **kwargs)
+
+
+def get_async_engine(url: str | URL, profile: EngineProfile | str | None = None, **kwargs: Any) -> AsyncEngine:
+    """Gets the shared asyncio engine for a URL and profile from the default registry.
+
+    Args:
+        url: The URL of the database, which must name an asyncio driver such as aiosqlite.
+        profile: The profile or the name of the profile.
+        **kwargs: Fields which override the fields of the profile.
+
+    Returns:
+        The asyncio engine for the URL and profile.
+    """
+    return default_registry.get_async_engine(url, profile, **kwargs)
@@ -0,0 +1,204 @@
+""" enginetemplate.py
+A template which builds SQLAlchemy engines from named profiles.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from typing import Any
+from typing import ClassVar
+
+# Third-Party Packages #
+from sqlalchemy import URL
+from sqlalchemy import Engine
+from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.pool import QueuePool
+
+# Local Packages #
+from .engineprofile import DEFAULT_PROFILES
+from .engineprofile import EngineProfile
+from .sqlitepragmas import SQLitePragmaManager
+
+
+# Definitions #
+# Classes #
+class EngineTemplate:
+    """A template which builds SQLAlchemy engines from named profiles.
+
+    Class Attributes:
+        profiles: The profiles available to all templates by name.
+        default_profile: The name of the profile to use when none is given.
+
+    Attributes:
+        profile: The profile this template builds engines with.
+
+    Args:
+        profile: The profile or the name of the profile to build engines with.
+        init: Determines if this object will construct.
+        **kwargs: Fields which override the fields of the profile.
+    """
+
+    profiles: ClassVar[dict[str, EngineProfile]] = DEFAULT_PROFILES.copy()
+    default_profile: ClassVar[str] = "generic-queuepool"
+
+    # Class Methods #
+    @classmethod
+    def register_profile(cls, profile: EngineProfile) -> EngineProfile:
+        """Adds a profile to the profiles available by name.
+
+        Args:
+            profile: The profile to register.
+
+        Returns:
+            The registered profile.
+        """
+        cls.profiles[profile.name] = profile
+        return profile
+
+    @classmethod
+    def get_profile(cls, profile: EngineProfile | str | None = None) -> EngineProfile:
+        """Resolves a profile or profile name to a profile.
+
+        Args:
+            profile: The profile or the name of the profile, None returns the default profile.
+
+        Returns:
+            The resolved profile.
+        """
+        if isinstance(profile, EngineProfile):
+            return profile
+
+        name = cls.default_profile if profile is None else profile
+        try:
+            return cls.profiles[name]
+        except KeyError:
+            raise ValueError(f"Unknown engine profile {name!r}; available: {sorted(cls.profiles)}") from None
+
+    @staticmethod
+    def is_memory_sqlite(url: URL) -> bool:
+        """Checks if a URL points to an in-memory SQLite database.
+
+        Args:
+            url: The URL to check.
+
+        Returns:
+            True if the URL is an in-memory SQLite database.
+        """
+        return url.get_backend_name() == "sqlite" and url.database in (None, "", ":memory:")
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(self, profile: EngineProfile | str | None = None, *, init: bool = True, **kwargs: Any) -> None:
+        # New Attributes #
+        self.profile: EngineProfile = self.get_profile(None)
+
+        # Object Construction #
+        if init:
+            self.construct(profile, **kwargs)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(self, profile: EngineProfile | str | None = None, **kwargs: Any) -> None:
+        """Constructs this object.
+
+        Args:
+            profile: The profile or the name of the profile to build engines with.
+            **kwargs: Fields which override the fields of the profile.
+        """
+        self.profile = self.get_profile(profile)
+        if kwargs:
+            self.profile = self.profile.evolve(**kwargs)
+
+    # Engine
+    def create_engine_kwargs(self, url: URL) -> dict[str, Any]:
+        """Creates the keyword arguments for create_engine from the profile.
+
+        In-memory SQLite databases keep the pool SQLAlchemy chooses for them because each pooled connection would
+        otherwise open its own empty database.
+
+        Args:
+            url: The URL of the database the engine will connect to.
+
+        Returns:
+            The keyword arguments for create_engine.
+        """
+        profile = self.profile
+        kwargs: dict[str, Any] = {"pool_pre_ping": profile.pool_pre_ping}
+        if not self.is_memory_sqlite(url) and profile.poolclass is not None:
+            kwargs.update(
+                poolclass=profile.poolclass,
+                pool_size=profile.pool_size,
+                max_overflow=profile.max_overflow,
+                pool_timeout=profile.pool_timeout,
+                pool_recycle=profile.pool_recycle,
+            )
+
+        if profile.connect_args:
+            connect_args = dict(profile.connect_args)
+            if url.get_backend_name() != "sqlite":
+                connect_args.pop("check_same_thread", None)
+            kwargs["connect_args"] = connect_args
+
+        kwargs.update(profile.engine_kwargs)
+        return kwargs
+
+    def attach_hooks(self, engine: Engine) -> None:
+        """Attaches the per-connection pragmas and hooks of the profile to an engine.
+
+        Args:
+            engine: The engine to attach the hooks to.
+        """
+        profile = self.profile
+        if profile.pragmas and engine.dialect.name == "sqlite":
+            SQLitePragmaManager(profile.pragmas).attach(engine)
+
+        for hook in profile.connect_hooks:
+            event.listen(engine, "connect", hook)
+
+    def build(self, url: str | URL, **kwargs: Any) -> Engine:
+        """Builds a new engine for a URL using the profile.
+
+        Args:
+            url: The URL of the database to connect to.
+            **kwargs: Additional keyword arguments for create_engine which take precedence over the profile.
+
+        Returns:
+            The new engine.
+        """
+        url = make_url(url)
+        engine = create_engine(url, **(self.create_engine_kwargs(url) | kwargs))
+        self.attach_hooks(engine)
+        return engine
+
+    def build_async(self, url: str | URL, **kwargs: Any) -> AsyncEngine:
+        """Builds a new asyncio engine for a URL using the profile.
+
+        A QueuePool in the profile is swapped for its asyncio adapted counterpart.
+
+        Args:
+            url: The URL of the database to connect to, which must name an asyncio driver such as aiosqlite.
+            **kwargs: Additional keyword arguments for create_async_engine which take precedence over the profile.
+
+        Returns:
+            The new asyncio engine.
+        """
+        url = make_url(url)
+        engine_kwargs = self.create_engine_kwargs(url)
+        if engine_kwargs.get("poolclass", None) is QueuePool:
+            engine_kwargs["poolclass"] = AsyncAdaptedQueuePool
+        engine = create_async_engine(url, **(engine_kwargs | kwargs))
+        self.attach_hooks(engine.sync_engine)
+        return engine
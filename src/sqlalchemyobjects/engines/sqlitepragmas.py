@@ -0,0 +1,230 @@
+""" sqlitepragmas.py
+A manager which applies and verifies SQLite pragmas on every pooled connection.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import logging
+from collections.abc import Mapping
+from typing import Any
+from typing import ClassVar
+
+# Third-Party Packages #
+from sqlalchemy import Engine
+from sqlalchemy import event
+
+# Definitions #
+_logger = logging.getLogger(__name__)
+
+READ_MOSTLY_PRAGMAS: dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 268435456,
+    "cache_size": -65536,
+    "temp_store": "MEMORY",
+    "busy_timeout": 5000,
+}
+
+WRITE_HEAVY_PRAGMAS: dict[str, Any] = {
+    "journal_mode": "WAL",
+    "synchronous": "OFF",
+    "mmap_size": 0,
+    "cache_size": -262144,
+    "temp_store": "MEMORY",
+    "busy_timeout": 30000,
+}
+
+
+# Classes #
+class SQLitePragmaManager:
+    """A manager which applies and verifies SQLite pragmas on every pooled connection.
+
+    The pragmas are applied when a raw connection is checked out for the first time and read back once to verify
+    them. The result is stored in the connection record so later checkouts of the same raw connection cost nothing.
+
+    Class Attributes:
+        presets: The named pragma presets.
+        enumerations: The integer values SQLite reports for enumerated pragmas.
+        info_key: The key in the connection record info which stores the verified pragmas.
+
+    Attributes:
+        pragmas: The pragmas to apply by name.
+        strict: Determines if a pragma which does not take effect raises an error instead of logging a warning.
+
+    Args:
+        pragmas: The pragmas to apply by name.
+        strict: Determines if a pragma which does not take effect raises an error instead of logging a warning.
+        init: Determines if this object will construct.
+    """
+
+    presets: ClassVar[dict[str, dict[str, Any]]] = {
+        "read-mostly": READ_MOSTLY_PRAGMAS,
+        "write-heavy": WRITE_HEAVY_PRAGMAS,
+    }
+    enumerations: ClassVar[dict[str, dict[str, int]]] = {
+        "synchronous": {"OFF": 0, "NORMAL": 1, "FULL": 2, "EXTRA": 3},
+        "temp_store": {"DEFAULT": 0, "FILE": 1, "MEMORY": 2},
+    }
+    info_key: ClassVar[str] = "sqlite_pragmas"
+
+    # Class Methods #
+    @classmethod
+    def from_preset(cls, name: str, strict: bool = False, **kwargs: Any) -> "SQLitePragmaManager":
+        """Creates a manager from a named preset.
+
+        Args:
+            name: The name of the preset, either "read-mostly" or "write-heavy".
+            strict: Determines if a pragma which does not take effect raises an error.
+            **kwargs: Pragmas which override the preset.
+
+        Returns:
+            The new manager.
+        """
+        try:
+            pragmas = cls.presets[name]
+        except KeyError:
+            raise ValueError(f"Unknown pragma preset {name!r}; available: {sorted(cls.presets)}") from None
+        return cls(pragmas | kwargs, strict=strict)
+
+    @classmethod
+    def normalize(cls, name: str, value: Any) -> Any:
+        """Normalizes a pragma value to the form SQLite reports it in.
+
+        Args:
+            name: The name of the pragma.
+            value: The value to normalize.
+
+        Returns:
+            The normalized value.
+        """
+        if isinstance(value, str):
+            enumeration = cls.enumerations.get(name, None)
+            if enumeration is not None:
+                return enumeration.get(value.upper(), value)
+            return int(value) if value.lstrip("-").isdigit() else value.lower()
+        return value
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        pragmas: Mapping[str, Any] | None = None,
+        strict: bool = False,
+        *,
+        init: bool = True,
+    ) -> None:
+        # New Attributes #
+        self.pragmas: dict[str, Any] = {}
+        self.strict: bool = False
+
+        # Object Construction #
+        if init:
+            self.construct(pragmas, strict)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(self, pragmas: Mapping[str, Any] | None = None, strict: bool | None = None) -> None:
+        """Constructs this object.
+
+        Args:
+            pragmas: The pragmas to apply by name.
+            strict: Determines if a pragma which does not take effect raises an error.
+        """
+        if pragmas is not None:
+            self.pragmas.update(pragmas)
+
+        if strict is not None:
+            self.strict = strict
+
+    # Pragmas
+    def apply(self, dbapi_connection: Any) -> dict[str, Any]:
+        """Applies the pragmas to a DBAPI connection and reads back their values.
+
+        Args:
+            dbapi_connection: The DBAPI connection to apply the pragmas to.
+
+        Returns:
+            The values SQLite reports for the pragmas after applying them.
+        """
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in self.pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+            applied = {}
+            for name in self.pragmas:
+                cursor.execute(f"PRAGMA {name}")
+                row = cursor.fetchone()
+                applied[name] = None if row is None else row[0]
+        finally:
+            cursor.close()
+        return applied
+
+    def verify(self, applied: Mapping[str, Any]) -> dict[str, tuple[Any, Any]]:
+        """Compares the applied values of the pragmas to the requested ones.
+
+        Args:
+            applied: The values SQLite reports for the pragmas.
+
+        Returns:
+            The mismatched pragmas mapped to their requested and applied values.
+
+        Raises:
+            ValueError: If strict and any pragma did not take effect.
+        """
+        mismatched = {}
+        for name, value in self.pragmas.items():
+            actual = applied.get(name, None)
+            if self.normalize(name, value) != self.normalize(name, actual):
+                mismatched[name] = (value, actual)
+
+        if mismatched:
+            message = f"SQLite pragmas did not take effect (requested, applied): {mismatched}"
+            if self.strict:
+                raise ValueError(message)
+            _logger.warning(message)
+        return mismatched
+
+    # Events
+    def on_checkout(self, dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        """Applies and verifies the pragmas the first time a raw connection is checked out.
+
+        Args:
+            dbapi_connection: The DBAPI connection being checked out.
+            connection_record: The pool record of the connection.
+            connection_proxy: The pool proxy of the connection.
+        """
+        if self.info_key not in connection_record.info:
+            applied = self.apply(dbapi_connection)
+            self.verify(applied)
+            connection_record.info[self.info_key] = applied
+
+    def attach(self, engine: Engine) -> Engine:
+        """Attaches this manager to the pool events of an engine.
+
+        Args:
+            engine: The engine to attach to.
+
+        Returns:
+            The engine.
+        """
+        if engine.dialect.name != "sqlite":
+            raise ValueError(f"SQLite pragmas cannot be applied to a {engine.dialect.name} engine.")
+        event.listen(engine, "checkout", self.on_checkout)
+        return engine
+
+    def detach(self, engine: Engine) -> None:
+        """Removes this manager from the pool events of an engine.
+
+        Args:
+            engine: The engine to detach from.
+        """
+        event.remove(engine, "checkout", self.on_checkout)
@@ -0,0 +1,327 @@
+""" keysets.py
+Filters selects and deletes by arbitrarily large collections of keys without building giant IN lists.
+"""
+# Package Header #
+from .header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import hashlib
+import json
+from collections.abc import Iterable
+from collections.abc import Sequence
+from types import TracebackType
+from typing import Any
+
+# Third-Party Packages #
+from sqlalchemy import Column
+from sqlalchemy import Connection
+from sqlalchemy import Engine
+from sqlalchemy import MetaData
+from sqlalchemy import Row
+from sqlalchemy import Select
+from sqlalchemy import Table
+from sqlalchemy import bindparam
+from sqlalchemy import delete
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+
+# Local Packages #
+from .bulk import BulkInserter
+from .utilities import as_connection
+from .utilities import as_table
+from .utilities import parameter_limit
+
+# Definitions #
+STRATEGIES = ("in", "json", "temp")
+
+
+# Classes #
+class KeySet:
+    """A collection of keys which filters selects and deletes with one joinable source instead of chunked IN lists.
+
+    Small sets use a single IN list. Larger sets of integers or strings are passed on SQLite as one JSON parameter
+    expanded with json_each, anything else is loaded into an indexed temporary table on the connection. The temporary
+    table is reused per connection and column types, and its keys stay loaded until close is called, so use the KeySet
+    as a context manager.
+
+    Attributes:
+        keys: The distinct keys, tuples when filtering by several columns.
+        columns: The columns the keys are matched against.
+        strategy: The strategy to use, "in", "json", or "temp", None chooses one per connection.
+        in_limit: The largest number of keys matched with a plain IN list.
+        temp_table: The temporary table the keys are loaded into, None if not created.
+        _connection: The connection the temporary table was created on.
+
+    Args:
+        keys: The keys, tuples when filtering by several columns.
+        columns: The column or columns the keys are matched against.
+        strategy: The strategy to use, "in", "json", or "temp", None chooses one per connection.
+        in_limit: The largest number of keys matched with a plain IN list.
+        init: Determines if this object will construct.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        keys: Iterable[Any] | None = None,
+        columns: Any = None,
+        strategy: str | None = None,
+        in_limit: int = 500,
+        *,
+        init: bool = True,
+    ) -> None:
+        # New Attributes #
+        self.keys: list[Any] = []
+        self.columns: tuple[Any, ...] = ()
+        self.strategy: str | None = None
+        self.in_limit: int = 500
+        self.temp_table: Table | None = None
+        self._connection: Connection | None = None
+
+        # Object Construction #
+        if init:
+            self.construct(keys, columns, strategy, in_limit)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __enter__(self) -> "KeySet":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(
+        self,
+        keys: Iterable[Any] | None = None,
+        columns: Any = None,
+        strategy: str | None = None,
+        in_limit: int | None = None,
+    ) -> None:
+        """Constructs this object.
+
+        Args:
+            keys: The keys, tuples when filtering by several columns.
+            columns: The column or columns the keys are matched against.
+            strategy: The strategy to use, "in", "json", or "temp", None chooses one per connection.
+            in_limit: The largest number of keys matched with a plain IN list.
+        """
+        if columns is not None:
+            self.columns = tuple(columns) if isinstance(columns, Sequence) else (columns,)
+
+        if keys is not None:
+            keys = dict.fromkeys(tuple(k) if isinstance(k, list) else k for k in keys)
+            self.keys = list(keys)
+
+        if strategy is not None:
+            if strategy not in STRATEGIES:
+                raise ValueError(f"Unknown key set strategy {strategy!r}; available: {STRATEGIES}")
+            self.strategy = strategy
+
+        if in_limit is not None:
+            self.in_limit = in_limit
+
+    def close(self) -> None:
+        """Empties the temporary table if one was loaded.
+
+        The table itself is kept on the connection and reused, because a DROP inside a transaction which is later
+        rolled back would leave the table behind on the pooled connection anyway.
+        """
+        if self.temp_table is not None and self._connection is not None and not self._connection.closed:
+            self._connection.execute(delete(self.temp_table))
+        self.temp_table = None
+        self._connection = None
+
+    # Strategy
+    def is_json_compatible(self) -> bool:
+        """Checks if every key value round trips through JSON and compares equal to the stored value.
+
+        Returns:
+            True if all key values are integers or strings.
+        """
+        values = (v for k in self.keys for v in (k if len(self.columns) > 1 else (k,)))
+        return all(isinstance(v, (int, str)) and not isinstance(v, bool) for v in values)
+
+    def choose_strategy(self, connection: Connection) -> str:
+        """Chooses the strategy for a connection.
+
+        Args:
+            connection: The connection the filter will be executed on.
+
+        Returns:
+            The strategy, "in", "json", or "temp".
+        """
+        if self.strategy is not None:
+            return self.strategy
+
+        limit = min(self.in_limit, parameter_limit(connection.dialect) // max(len(self.columns), 1))
+        if len(self.keys) <= limit:
+            return "in"
+
+        dialect = connection.dialect
+        version = getattr(dialect.dbapi, "sqlite_version_info", (0,))
+        if dialect.name == "sqlite" and version >= (3, 38) and self.is_json_compatible():
+            return "json"
+        return "temp"
+
+    # Conditions
+    def create_temp_table(self, connection: Connection) -> Table:
+        """Creates a temporary table holding the keys on a connection.
+
+        Args:
+            connection: The connection to create the table on.
+
+        Returns:
+            The temporary table.
+        """
+        if self.temp_table is not None and self._connection is connection:
+            return self.temp_table
+        self.close()
+
+        types = [c.type.compile(connection.dialect) for c in self.columns]
+        name = f"_keyset_{hashlib.sha1(repr(types).encode()).hexdigest()[:12]}"
+        table = Table(
+            name,
+            MetaData(),
+            *(Column(f"key_{i}", c.type, primary_key=True) for i, c in enumerate(self.columns)),
+            prefixes=["TEMPORARY"],
+        )
+        table.create(connection, checkfirst=True)
+        connection.execute(delete(table))
+        self.temp_table = table
+        self._connection = connection
+
+        rows = self.keys if len(self.columns) > 1 else ((k,) for k in self.keys)
+        BulkInserter(table).insert_chunks(connection, rows)
+        return table
+
+    def create_condition(self, connection: Connection) -> Any:
+        """Creates the condition which matches the columns against the keys.
+
+        Args:
+            connection: The connection the condition will be executed on, which holds any temporary table.
+
+        Returns:
+            The condition.
+        """
+        target = self.columns[0] if len(self.columns) == 1 else tuple_(*self.columns)
+        strategy = self.choose_strategy(connection)
+        if strategy == "in":
+            return target.in_(self.keys)
+
+        if strategy == "json":
+            values = func.json_each(bindparam("keyset_json", json.dumps(self.keys))).table_valued("value")
+            if len(self.columns) == 1:
+                return target.in_(select(values.c.value))
+            extracted = (func.json_extract(values.c.value, f"$[{i}]") for i in range(len(self.columns)))
+            return target.in_(select(*extracted))
+
+        table = self.create_temp_table(connection)
+        return target.in_(select(*table.columns))
+
+    # Execution
+    def select(self, bind: Session | Connection, statement: Select[Any]) -> list[Row[Any]]:
+        """Executes a select restricted to the rows matching the keys.
+
+        Args:
+            bind: The Session or Connection to execute with.
+            statement: The select to restrict.
+
+        Returns:
+            The matching rows.
+        """
+        if not self.keys:
+            return []
+        return list(bind.execute(statement.where(self.create_condition(as_connection(bind)))).all())
+
+    def delete(self, bind: Engine | Session | Connection, table: Any) -> int:
+        """Deletes the rows of a table matching the keys.
+
+        An Engine deletes in its own transaction, a Connection or Session uses its current transaction.
+
+        Args:
+            bind: The Engine, Session, or Connection to delete with.
+            table: The Table or mapped class to delete from.
+
+        Returns:
+            The number of rows deleted.
+        """
+        if not self.keys:
+            return 0
+
+        if isinstance(bind, Engine):
+            with bind.begin() as connection:
+                try:
+                    return self.delete(connection, table)
+                finally:
+                    self.close()
+
+        connection = as_connection(bind)
+        return connection.execute(delete(as_table(table)).where(self.create_condition(connection))).rowcount
+
+
+# Functions #
+def select_by_keys(
+    bind: Session | Connection,
+    statement: Select[Any],
+    columns: Any,
+    keys: Iterable[Any],
+    strategy: str | None = None,
+) -> list[Row[Any]]:
+    """Executes a select restricted to the rows whose columns match any of the keys.
+
+    Args:
+        bind: The Session or Connection to execute with.
+        statement: The select to restrict.
+        columns: The column or columns the keys are matched against.
+        keys: The keys, tuples when filtering by several columns.
+        strategy: The strategy to use, "in", "json", or "temp", None chooses one per connection.
+
+    Returns:
+        The matching rows.
+    """
+    with KeySet(keys, columns, strategy) as key_set:
+        return key_set.select(bind, statement)
+
+
+def delete_by_keys(
+    bind: Engine | Session | Connection,
+    table: Any,
+    keys: Iterable[Any],
+    columns: Any = None,
+    strategy: str | None = None,
+) -> int:
+    """Deletes the rows of a table whose columns match any of the keys.
+
+    Args:
+        bind: The Engine, Session, or Connection to delete with.
+        table: The Table or mapped class to delete from.
+        keys: The keys, tuples when filtering by several columns.
+        columns: The column or columns the keys are matched against, defaults to the primary key.
+        strategy: The strategy to use, "in", "json", or "temp", None chooses one per connection.
+
+    Returns:
+        The number of rows deleted.
+    """
+    if columns is None:
+        columns = list(as_table(table).primary_key.columns)
+    with KeySet(keys, columns, strategy) as key_set:
+        return key_set.delete(bind, table)
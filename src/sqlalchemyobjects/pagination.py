@@ -0,0 +1,317 @@
+""" pagination.py
+Keyset (seek) pagination which pages a select by a unique ordered key instead of OFFSET.
+"""
+# Package Header #
+from .header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import base64
+import datetime
+import decimal
+import json
+import uuid
+from collections.abc import Iterator
+from collections.abc import Sequence
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Any
+
+# Third-Party Packages #
+from sqlalchemy import Connection
+from sqlalchemy import Row
+from sqlalchemy import Select
+from sqlalchemy import and_
+from sqlalchemy import or_
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+
+# Definitions #
+_DECODERS = {
+    "datetime": datetime.datetime.fromisoformat,
+    "date": datetime.date.fromisoformat,
+    "time": datetime.time.fromisoformat,
+    "decimal": decimal.Decimal,
+    "uuid": uuid.UUID,
+    "bytes": bytes.fromhex,
+}
+
+
+# Functions #
+def _encode_value(value: Any) -> Any:
+    if isinstance(value, datetime.datetime):
+        return {"datetime": value.isoformat()}
+    elif isinstance(value, datetime.date):
+        return {"date": value.isoformat()}
+    elif isinstance(value, datetime.time):
+        return {"time": value.isoformat()}
+    elif isinstance(value, decimal.Decimal):
+        return {"decimal": str(value)}
+    elif isinstance(value, uuid.UUID):
+        return {"uuid": str(value)}
+    elif isinstance(value, bytes):
+        return {"bytes": value.hex()}
+    else:
+        return value
+
+
+def _decode_value(value: Any) -> Any:
+    if isinstance(value, dict):
+        ((kind, text),) = value.items()
+        return _DECODERS[kind](text)
+    return value
+
+
+def encode_cursor(values: Sequence[Any], backward: bool = False) -> str:
+    """Encodes key values and a direction as an opaque URL-safe cursor token.
+
+    Args:
+        values: The key values of the row the cursor points after.
+        backward: Determines if the cursor pages backward.
+
+    Returns:
+        The cursor token.
+    """
+    payload = json.dumps([int(backward), [_encode_value(v) for v in values]], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(token: str) -> tuple[tuple[Any, ...], bool]:
+    """Decodes a cursor token into its key values and direction.
+
+    Args:
+        token: The cursor token.
+
+    Returns:
+        The key values and if the cursor pages backward.
+    """
+    try:
+        backward, values = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+        return tuple(_decode_value(v) for v in values), bool(backward)
+    except (ValueError, TypeError, KeyError) as error:
+        raise ValueError(f"Invalid pagination cursor {token!r}.") from error
+
+
+# Classes #
+@dataclass
+class Page:
+    """A page of rows returned by a KeysetPager.
+
+    Attributes:
+        rows: The rows of this page in key order.
+        next_cursor: The cursor of the page after this one, None if this is the last page.
+        previous_cursor: The cursor of the page before this one, None if this is the first page.
+    """
+
+    rows: list[Row[Any]] = field(default_factory=list)
+    next_cursor: str | None = None
+    previous_cursor: str | None = None
+
+    # Magic Methods #
+    def __iter__(self) -> Iterator[Row[Any]]:
+        return iter(self.rows)
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+
+class KeysetPager:
+    """Pages a select by a unique ordered key tuple, so every page costs an index seek regardless of its depth.
+
+    The statement is ordered by the keys and each page continues from the key values of the last row of the previous
+    page, which are carried in opaque cursor tokens so paging can resume in another process or request.
+
+    Attributes:
+        statement: The select to page, it must return the key columns or an ORM entity which has them.
+        keys: The columns which form a unique ordered key of the rows.
+        page_size: The number of rows in each page.
+        row_values: Determines if the seek uses a row-value comparison rather than the expanded OR form.
+
+    Args:
+        statement: The select to page, it must return the key columns or an ORM entity which has them.
+        keys: The columns which form a unique ordered key of the rows.
+        page_size: The number of rows in each page.
+        row_values: Determines if the seek uses a row-value comparison rather than the expanded OR form.
+        init: Determines if this object will construct.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        statement: Select[Any] | None = None,
+        keys: Sequence[Any] | None = None,
+        page_size: int = 100,
+        row_values: bool = True,
+        *,
+        init: bool = True,
+    ) -> None:
+        # New Attributes #
+        self.statement: Select[Any] | None = None
+        self.keys: tuple[Any, ...] = ()
+        self.page_size: int = 100
+        self.row_values: bool = True
+
+        # Object Construction #
+        if init:
+            self.construct(statement, keys, page_size, row_values)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(
+        self,
+        statement: Select[Any] | None = None,
+        keys: Sequence[Any] | None = None,
+        page_size: int | None = None,
+        row_values: bool | None = None,
+    ) -> None:
+        """Constructs this object.
+
+        Args:
+            statement: The select to page, it must return the key columns or an ORM entity which has them.
+            keys: The columns which form a unique ordered key of the rows.
+            page_size: The number of rows in each page.
+            row_values: Determines if the seek uses a row-value comparison rather than the expanded OR form.
+        """
+        if statement is not None:
+            self.statement = statement
+
+        if keys is not None:
+            self.keys = tuple(keys)
+
+        if page_size is not None:
+            self.page_size = page_size
+
+        if row_values is not None:
+            self.row_values = row_values
+
+    # Statements
+    def create_seek(self, values: Sequence[Any], backward: bool = False) -> Any:
+        """Creates the condition which selects the rows after (or before) the given key values.
+
+        Args:
+            values: The key values to seek from.
+            backward: Determines if the rows before the key values are selected.
+
+        Returns:
+            The seek condition.
+        """
+        if self.row_values and len(self.keys) > 1:
+            left, right = tuple_(*self.keys), tuple_(*values)
+            return left < right if backward else left > right
+
+        clauses = []
+        for i, (key, value) in enumerate(zip(self.keys, values, strict=True)):
+            equalities = [k == v for k, v in zip(self.keys[:i], values[:i], strict=True)]
+            clauses.append(and_(*equalities, key < value if backward else key > value))
+        return or_(*clauses)
+
+    def create_statement(self, values: Sequence[Any] | None = None, backward: bool = False) -> Select[Any]:
+        """Creates the statement which selects one page.
+
+        One extra row is selected to detect if another page follows.
+
+        Args:
+            values: The key values to seek from, None starts at the first (or last) row.
+            backward: Determines if the page is selected backward.
+
+        Returns:
+            The page statement.
+
+        Raises:
+            ValueError: If no statement was given.
+        """
+        if self.statement is None:
+            raise ValueError("KeysetPager has no statement to page.")
+
+        statement = self.statement.order_by(None)
+        if values is not None:
+            statement = statement.where(self.create_seek(values, backward))
+        ordering = [k.desc() for k in self.keys] if backward else list(self.keys)
+        return statement.order_by(*ordering).limit(self.page_size + 1)
+
+    def key_values(self, row: Row[Any]) -> tuple[Any, ...]:
+        """Gets the key values of a row.
+
+        Args:
+            row: The row to get the key values of.
+
+        Returns:
+            The key values.
+        """
+        mapping = row._mapping
+        values = []
+        for key in self.keys:
+            if key in mapping:
+                values.append(mapping[key])
+            elif key.key in mapping:
+                values.append(mapping[key.key])
+            else:
+                values.append(getattr(row[0], key.key))
+        return tuple(values)
+
+    # Paging
+    def fetch(self, bind: Session | Connection, cursor: str | None = None, backward: bool = False) -> Page:
+        """Fetches one page.
+
+        Args:
+            bind: The Session or Connection to execute with.
+            cursor: The cursor token of the page, None fetches the first page (or the last page if backward).
+            backward: Determines if the first or last page is fetched when no cursor is given.
+
+        Returns:
+            The page.
+        """
+        values = None
+        if cursor is not None:
+            values, backward = decode_cursor(cursor)
+
+        rows = list(bind.execute(self.create_statement(values, backward)))
+        more = len(rows) > self.page_size
+        del rows[self.page_size :]
+        if backward:
+            rows.reverse()
+
+        page = Page(rows)
+        if rows:
+            at_start = not more if backward else values is None
+            at_end = values is None if backward else not more
+            if not at_start:
+                page.previous_cursor = encode_cursor(self.key_values(rows[0]), backward=True)
+            if not at_end:
+                page.next_cursor = encode_cursor(self.key_values(rows[-1]), backward=False)
+        return page
+
+    def iterate(
+        self,
+        bind: Session | Connection,
+        cursor: str | None = None,
+        backward: bool = False,
+    ) -> Iterator[Page]:
+        """Lazily fetches pages until the end (or the start if backward) is reached.
+
+        Args:
+            bind: The Session or Connection to execute with.
+            cursor: The cursor token to resume from, None starts at the first (or last) page.
+            backward: Determines if pages are fetched backward when no cursor is given.
+
+        Yields:
+            The next page.
+        """
+        if cursor is not None:
+            backward = decode_cursor(cursor)[1]
+
+        while True:
+            page = self.fetch(bind, cursor, backward)
+            if page.rows:
+                yield page
+            cursor = page.previous_cursor if backward else page.next_cursor
+            if cursor is None:
+                return
@@ -0,0 +1,394 @@
+""" parallel.py
+Scans a table in primary-key ranges across a process pool and merges the partial results.
+"""
+# Package Header #
+from .header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import functools
+import os
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+# Third-Party Packages #
+from sqlalchemy import URL
+from sqlalchemy import Connection
+from sqlalchemy import Engine
+from sqlalchemy import Row
+from sqlalchemy import Table
+from sqlalchemy import func
+from sqlalchemy import select
+
+# Local Packages #
+from .engines import EngineProfile
+from .engines import default_registry
+from .engines import get_engine
+from .utilities import as_table
+
+# Definitions #
+KeyRange = tuple[Any, Any]
+SAMPLE_SIZE = 10000
+RANDOM_FUNCTIONS: dict[str, str] = {
+    "mysql": "rand",
+    "mariadb": "rand",
+    "mssql": "newid",
+}
+_MISSING = object()
+
+
+# Functions #
+def _reset_registry() -> None:
+    """Drops the engines a forked worker inherited, without closing the parent's connections."""
+    for engine in default_registry.engines.values():
+        engine.dispose(close=False)
+    default_registry.engines.clear()
+
+
+def _scan_range(
+    url: str,
+    profile: EngineProfile | str | None,
+    table: Table,
+    key: str,
+    columns: Sequence[str] | None,
+    key_range: KeyRange,
+    mapper: Callable[[Iterable[Row[Any]]], Any],
+    partition_size: int,
+) -> Any:
+    """Streams the rows of one key range to a mapper inside a worker process.
+
+    Args:
+        url: The URL of the database.
+        profile: The engine profile or the name of the profile.
+        table: The table to scan.
+        key: The name of the key column.
+        columns: The names of the columns to select, None selects all columns.
+        key_range: The inclusive lower and exclusive upper key of the range, None leaves a side unbounded.
+        mapper: The function which reduces the rows of the range to a partial result.
+        partition_size: The number of rows fetched at a time.
+
+    Returns:
+        The partial result of the range.
+    """
+    lower, upper = key_range
+    column = table.c[key]
+    statement = select(*(table.c[c] for c in columns)) if columns else select(table)
+    if lower is not None:
+        statement = statement.where(column >= lower)
+    if upper is not None:
+        statement = statement.where(column < upper)
+
+    with get_engine(url, profile).connect() as connection:
+        result = connection.execution_options(stream_results=True, yield_per=partition_size).execute(statement)
+        return mapper(result)
+
+
+def sample_keys(connection: Connection, column: Any, sample_size: int = SAMPLE_SIZE) -> list[Any]:
+    """Gets a random sample of the keys of a column in ascending order.
+
+    The database only keeps the sample while it scans, so no sort or window over the whole table is needed. Tables
+    with fewer rows than the sample size return all their keys.
+
+    Args:
+        connection: The Connection to query with.
+        column: The key column.
+        sample_size: The maximum number of keys to sample.
+
+    Returns:
+        The sampled keys in ascending order.
+    """
+    random = getattr(func, RANDOM_FUNCTIONS.get(connection.dialect.name, "random"))
+    statement = select(column).order_by(random()).limit(sample_size)
+    return sorted(connection.execute(statement).scalars())
+
+
+def key_ranges(
+    bind: Engine | Connection,
+    table: Any,
+    key: str,
+    partitions: int,
+    quantiles: bool = True,
+    sample_size: int = SAMPLE_SIZE,
+) -> list[KeyRange]:
+    """Splits a table into half-open ranges of its key column.
+
+    Quantiles give each range about the same number of rows by cutting a random sample of the keys into equal parts.
+    Otherwise the span between the minimum and maximum numeric key is split evenly.
+
+    Args:
+        bind: The Engine or Connection to query with.
+        table: The Table or mapped class to split.
+        key: The name of the key column.
+        partitions: The number of ranges.
+        quantiles: Determines if ranges are split at key quantiles rather than evenly between the minimum and maximum.
+        sample_size: The maximum number of keys sampled to find the quantiles.
+
+    Returns:
+        The inclusive lower and exclusive upper key of each range, the first and last ranges are unbounded outside.
+    """
+    if isinstance(bind, Engine):
+        with bind.connect() as connection:
+            return key_ranges(connection, table, key, partitions, quantiles, sample_size)
+
+    column = as_table(table).c[key]
+    if quantiles:
+        sample = sample_keys(bind, column, sample_size)
+        cuts = (sample[len(sample) * i // partitions] for i in range(1, partitions))
+        boundaries = sorted({c for c in cuts if c != sample[0]}) if sample else []
+    else:
+        low, high = bind.execute(select(func.min(column), func.max(column))).one()
+        if low is None:
+            return [(None, None)]
+        step = (high - low) / partitions
+        boundaries = [low + step * i for i in range(1, partitions)]
+        if isinstance(low, int):
+            boundaries = sorted({int(b) for b in boundaries if low < int(b) <= high})
+
+    edges = [None, *boundaries, None]
+    return [(edges[i], edges[i + 1]) for i in range(len(edges) - 1)]
+
+
+# Classes #
+class ParallelScanner:
+    """Scans a table in key ranges across a process pool and merges the partial results with a reducer.
+
+    Each worker opens its own engine from the URL, streams the rows of a range to the mapper, and returns the mapper's
+    partial result, so Python-side aggregation runs on every core instead of behind one GIL. The mapper and reducer
+    must be picklable, such as module-level functions.
+
+    Attributes:
+        url: The URL of the database.
+        table: The table to scan.
+        key: The name of the key column to partition on, defaults to the single primary key column.
+        profile: The engine profile or the name of the profile the workers connect with.
+        partitions: The number of key ranges.
+        max_workers: The number of worker processes, None uses the number of processors.
+        quantiles: Determines if ranges are split at key quantiles rather than evenly between the minimum and maximum.
+        partition_size: The number of rows a worker fetches at a time.
+
+    Args:
+        url: The URL of the database.
+        table: The Table or mapped class to scan.
+        key: The name of the key column to partition on, defaults to the single primary key column.
+        profile: The engine profile or the name of the profile the workers connect with.
+        partitions: The number of key ranges, defaults to four per worker.
+        max_workers: The number of worker processes, None uses the number of processors.
+        quantiles: Determines if ranges are split at key quantiles rather than evenly between the minimum and maximum.
+        partition_size: The number of rows a worker fetches at a time.
+        init: Determines if this object will construct.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        url: str | URL | None = None,
+        table: Any = None,
+        key: str | None = None,
+        profile: EngineProfile | str | None = None,
+        partitions: int | None = None,
+        max_workers: int | None = None,
+        quantiles: bool = True,
+        partition_size: int = 10000,
+        *,
+        init: bool = True,
+    ) -> None:
+        # New Attributes #
+        self.url: str | None = None
+        self.table: Table | None = None
+        self.key: str | None = None
+        self.profile: EngineProfile | str | None = None
+        self.partitions: int | None = None
+        self.max_workers: int | None = None
+        self.quantiles: bool = True
+        self.partition_size: int = 10000
+
+        # Object Construction #
+        if init:
+            self.construct(url, table, key, profile, partitions, max_workers, quantiles, partition_size)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(
+        self,
+        url: str | URL | None = None,
+        table: Any = None,
+        key: str | None = None,
+        profile: EngineProfile | str | None = None,
+        partitions: int | None = None,
+        max_workers: int | None = None,
+        quantiles: bool | None = None,
+        partition_size: int | None = None,
+    ) -> None:
+        """Constructs this object.
+
+        Args:
+            url: The URL of the database.
+            table: The Table or mapped class to scan.
+            key: The name of the key column to partition on, defaults to the single primary key column.
+            profile: The engine profile or the name of the profile the workers connect with.
+            partitions: The number of key ranges, defaults to four per worker.
+            max_workers: The number of worker processes, None uses the number of processors.
+            quantiles: Determines if ranges are split at key quantiles rather than evenly.
+            partition_size: The number of rows a worker fetches at a time.
+        """
+        if url is not None:
+            self.url = url.render_as_string(hide_password=False) if isinstance(url, URL) else url
+
+        if table is not None:
+            self.table = as_table(table)
+
+        if key is not None:
+            self.key = key
+        elif self.key is None and self.table is not None:
+            self.key = self.find_key(self.table)
+
+        if profile is not None:
+            self.profile = profile
+
+        if partitions is not None:
+            self.partitions = partitions
+
+        if max_workers is not None:
+            self.max_workers = max_workers
+
+        if quantiles is not None:
+            self.quantiles = quantiles
+
+        if partition_size is not None:
+            self.partition_size = partition_size
+
+    # Target
+    @staticmethod
+    def find_key(table: Table) -> str:
+        """Finds the key column to partition a table on, which is its single primary key column.
+
+        Args:
+            table: The table to partition.
+
+        Returns:
+            The name of the key column.
+
+        Raises:
+            ValueError: If the table does not have a single primary key column.
+        """
+        primary = table.primary_key.columns.keys()
+        if len(primary) != 1:
+            raise ValueError(f"Table {table.name} needs a key column to partition on.")
+        return primary[0]
+
+    def get_target(self) -> tuple[str, Table, str]:
+        """Gets the URL, table, and key column this scanner scans.
+
+        Returns:
+            The URL of the database, the table, and the name of the key column.
+
+        Raises:
+            ValueError: If the URL or table was not given.
+        """
+        if self.url is None or self.table is None or self.key is None:
+            raise ValueError(f"{type(self).__name__} needs a URL and a table to scan.")
+        return self.url, self.table, self.key
+
+    # Scanning
+    def create_ranges(self, workers: int) -> list[KeyRange]:
+        """Splits the table into key ranges.
+
+        Args:
+            workers: The number of workers the ranges are spread over.
+
+        Returns:
+            The key ranges.
+        """
+        url, table, key = self.get_target()
+        partitions = self.partitions or workers * 4
+        return key_ranges(get_engine(url, self.profile), table, key, partitions, self.quantiles)
+
+    def map(
+        self,
+        mapper: Callable[[Iterable[Row[Any]]], Any],
+        columns: Sequence[str] | None = None,
+    ) -> list[Any]:
+        """Runs a mapper over every key range in the process pool.
+
+        Args:
+            mapper: The function which reduces the rows of a range to a partial result.
+            columns: The names of the columns to select, None selects all columns.
+
+        Returns:
+            The partial results in key order.
+        """
+        url, table, key = self.get_target()
+        ranges = self.create_ranges(self.max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(self.max_workers, initializer=_reset_registry) as executor:
+            scan = functools.partial(
+                _scan_range,
+                url,
+                self.profile,
+                table,
+                key,
+                columns,
+                mapper=mapper,
+                partition_size=self.partition_size,
+            )
+            return list(executor.map(scan, ranges))
+
+    def aggregate(
+        self,
+        mapper: Callable[[Iterable[Row[Any]]], Any],
+        reducer: Callable[[Any, Any], Any],
+        initial: Any = _MISSING,
+        columns: Sequence[str] | None = None,
+    ) -> Any:
+        """Runs a mapper over every key range in the process pool and merges the partial results.
+
+        Args:
+            mapper: The function which reduces the rows of a range to a partial result.
+            reducer: The function which merges two partial results.
+            initial: The initial value of the reduction, omitted starts from the first partial result.
+            columns: The names of the columns to select, None selects all columns.
+
+        Returns:
+            The merged result.
+        """
+        partials = self.map(mapper, columns)
+        if initial is _MISSING:
+            return functools.reduce(reducer, partials)
+        return functools.reduce(reducer, partials, initial)
+
+
+# Functions #
+def parallel_aggregate(
+    url: str | URL,
+    table: Any,
+    mapper: Callable[[Iterable[Row[Any]]], Any],
+    reducer: Callable[[Any, Any], Any],
+    initial: Any = _MISSING,
+    columns: Sequence[str] | None = None,
+    **kwargs: Any,
+) -> Any:
+    """Scans a table in key ranges across a process pool and merges the partial results.
+
+    Args:
+        url: The URL of the database.
+        table: The Table or mapped class to scan.
+        mapper: The function which reduces the rows of a range to a partial result.
+        reducer: The function which merges two partial results.
+        initial: The initial value of the reduction, omitted starts from the first partial result.
+        columns: The names of the columns to select, None selects all columns.
+        **kwargs: The keyword arguments for the ParallelScanner.
+
+    Returns:
+        The merged result.
+    """
+    return ParallelScanner(url, table, **kwargs).aggregate(mapper, reducer, initial, columns)
@@ -0,0 +1,27 @@
+""" __init__.py
+Templates for declaratively mapped tables.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Local Packages #
+from .basetable import BaseTable
+from .fulltexttable import FullTextTable
+from .intervaltable import IntervalTable
+from .timeseriestable import TimeSeriesTable
+
+
+__all__ = [
+    "BaseTable",
+    "FullTextTable",
+    "IntervalTable",
+    "TimeSeriesTable",
+]
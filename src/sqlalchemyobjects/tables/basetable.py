@@ -0,0 +1,194 @@
+""" basetable.py
+A template for declaratively mapped tables which adds class-level query helpers.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections import namedtuple
+from collections.abc import Iterator
+from collections.abc import Sequence
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import ClassVar
+from typing import Self
+
+# Third-Party Packages #
+from sqlalchemy import Connection
+from sqlalchemy import FromClause
+from sqlalchemy import Row
+from sqlalchemy import Select
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import class_mapper
+
+# Local Packages #
+from ..utilities import as_table
+from ..utilities import expunge_partition
+
+
+# Definitions #
+# Classes #
+class BaseTable:
+    """A template for declaratively mapped tables which adds class-level query helpers.
+
+    Mix this class into a declarative class before the declarative base, e.g. ``class Sample(BaseTable, Base)``.
+
+    Class Attributes:
+        default_partition_size: The number of rows fetched per partition when streaming.
+        _record_types: The generated record class of each mapped class.
+    """
+
+    default_partition_size: ClassVar[int] = 1000
+    _record_types: ClassVar[dict[type, type[tuple[Any, ...]]]] = {}
+
+    if TYPE_CHECKING:
+        # The declarative directives of the mapped class this template is mixed into.
+        __tablename__: Any
+        __table__: ClassVar[FromClause]
+
+    # Class Methods #
+    @classmethod
+    def stream(
+        cls,
+        session: Session,
+        statement: Select[Any] | None = None,
+        partition_size: int | None = None,
+        expunge: bool = True,
+    ) -> Iterator[Sequence[Self]]:
+        """Streams ORM objects of this table in partitions using a server-side cursor.
+
+        Objects of a partition are expunged from the session once the next partition is requested, so the identity
+        map stays bounded by one partition no matter how many rows are streamed.
+
+        Args:
+            session: The session to stream with.
+            statement: The select of this entity to stream, defaults to all rows.
+            partition_size: The number of objects per partition.
+            expunge: Determines if the objects of a partition are expunged after it is consumed.
+
+        Yields:
+            The next partition of objects.
+        """
+        if statement is None:
+            statement = select(cls)
+        partition_size = partition_size or cls.default_partition_size
+
+        result = session.execute(
+            statement,
+            execution_options={"stream_results": True, "yield_per": partition_size},
+        )
+        try:
+            for partition in result.scalars().partitions():
+                yield partition
+                if expunge:
+                    expunge_partition(session, partition)
+        finally:
+            result.close()
+
+    @classmethod
+    def stream_rows(
+        cls,
+        bind: Session | Connection,
+        statement: Select[Any] | None = None,
+        partition_size: int | None = None,
+    ) -> Iterator[Sequence[Row[Any]]]:
+        """Streams plain row tuples of this table in partitions using a server-side cursor.
+
+        Rows are not ORM objects, so nothing is added to the identity map.
+
+        Args:
+            bind: The Session or Connection to stream with.
+            statement: The Core select to stream, defaults to all columns of all rows.
+            partition_size: The number of rows per partition.
+
+        Yields:
+            The next partition of rows.
+        """
+        if statement is None:
+            statement = select(*as_table(cls).columns)
+        partition_size = partition_size or cls.default_partition_size
+
+        result = bind.execute(
+            statement,
+            execution_options={"stream_results": True, "yield_per": partition_size},
+        )
+        try:
+            yield from result.partitions()
+        finally:
+            result.close()
+
+    # Records
+    @classmethod
+    def get_record_type(cls) -> type[tuple[Any, ...]]:
+        """Gets the read-only record class of this table, generating it on first use.
+
+        Records are named tuples with a field for each mapped column attribute, so they need no instrumentation or
+        identity map and take only the memory of a tuple.
+
+        Returns:
+            The record class.
+        """
+        record_type = cls._record_types.get(cls, None)
+        if record_type is None:
+            keys = [p.key for p in class_mapper(cls).column_attrs]
+            record_type = cls._record_types[cls] = namedtuple(f"{cls.__name__}Record", keys, rename=True)
+        return record_type
+
+    @classmethod
+    def create_record_statement(cls, statement: Select[Any] | None = None) -> Select[Any]:
+        """Creates a select of the column attributes of this table in record field order.
+
+        Args:
+            statement: The select of this entity whose criteria and ordering are kept, defaults to all rows.
+
+        Returns:
+            The select of the columns.
+        """
+        if statement is None:
+            statement = select(cls)
+        columns = [getattr(cls, p.key) for p in class_mapper(cls).column_attrs]
+        return statement.with_only_columns(*columns, maintain_column_froms=True)
+
+    @classmethod
+    def get_records(cls, bind: Session | Connection, statement: Select[Any] | None = None) -> list[tuple[Any, ...]]:
+        """Gets read-only records of this table rather than ORM objects.
+
+        Args:
+            bind: The Session or Connection to query with.
+            statement: The select of this entity whose criteria and ordering are kept, defaults to all rows.
+
+        Returns:
+            The records.
+        """
+        make = cls.get_record_type()._make  # type: ignore[attr-defined]
+        return list(map(make, bind.execute(cls.create_record_statement(statement))))
+
+    @classmethod
+    def stream_records(
+        cls,
+        bind: Session | Connection,
+        statement: Select[Any] | None = None,
+        partition_size: int | None = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """Streams read-only records of this table in partitions using a server-side cursor.
+
+        Args:
+            bind: The Session or Connection to stream with.
+            statement: The select of this entity whose criteria and ordering are kept, defaults to all rows.
+            partition_size: The number of records per partition.
+
+        Yields:
+            The next partition of records.
+        """
+        make = cls.get_record_type()._make  # type: ignore[attr-defined]
+        for partition in cls.stream_rows(bind, cls.create_record_statement(statement), partition_size):
+            yield list(map(make, partition))
@@ -0,0 +1,251 @@
+""" fulltexttable.py
+A template for tables with text columns indexed by a trigger-maintained SQLite FTS5 external-content table.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections.abc import Sequence
+from typing import Any
+from typing import ClassVar
+from typing import Self
+
+# Third-Party Packages #
+from sqlalchemy import Column
+from sqlalchemy import ColumnElement
+from sqlalchemy import Connection
+from sqlalchemy import Float
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Select
+from sqlalchemy import Table
+from sqlalchemy import Text
+from sqlalchemy import event
+from sqlalchemy import func
+from sqlalchemy import or_
+from sqlalchemy import select
+from sqlalchemy.orm import Mapper
+from sqlalchemy.orm import Session
+
+# Local Packages #
+from ..utilities import as_table
+from .basetable import BaseTable
+
+
+# Definitions #
+# Functions #
+def quote_terms(text: str) -> str:
+    """Quotes each whitespace separated term of plain text so FTS5 matches them literally and all of them.
+
+    Args:
+        text: The plain text to quote.
+
+    Returns:
+        The FTS5 query.
+    """
+    return " ".join('"' + term.replace('"', '""') + '"' for term in text.split())
+
+
+# Classes #
+class FullTextTable(BaseTable):
+    """A template for tables whose text columns are searched with a SQLite FTS5 external-content table.
+
+    Mix this class into a declarative class before the declarative base, e.g. ``class Note(FullTextTable, Base)``, and
+    name the columns to index in fts_columns. The subclass must have a single integer primary key, which is the rowid
+    of the FTS5 table. The FTS5 table stores only the index, it is created and dropped with the table and kept in sync
+    by insert, update, and delete triggers. Other dialects fall back to unranked substring matching.
+
+    Class Attributes:
+        fts_columns: The names of the text columns to index.
+        fts_tokenizer: The FTS5 tokenizer, e.g. "porter unicode61", None uses the FTS5 default.
+        fts_weights: The bm25 weights of the columns in the order of fts_columns, None weighs them equally.
+        fts_table: The Core table of the FTS5 table, set on each mapped subclass.
+    """
+
+    fts_columns: ClassVar[tuple[str, ...]] = ()
+    fts_tokenizer: ClassVar[str | None] = None
+    fts_weights: ClassVar[tuple[float, ...] | None] = None
+    fts_table: ClassVar[Table | None] = None
+
+    # Static Methods #
+    @staticmethod
+    def _instrument_class(mapper: Mapper[Any], class_: type["FullTextTable"]) -> None:
+        """Creates the FTS5 table of a subclass when it is mapped, which is when its table exists.
+
+        Args:
+            mapper: The mapper of the subclass.
+            class_: The mapped subclass.
+        """
+        table = class_.__dict__.get("__table__", None)
+        if table is not None and class_.fts_columns:
+            name = f"{table.name}_fts"
+            class_.fts_table = Table(
+                name,
+                MetaData(),
+                Column("rowid", Integer, primary_key=True),
+                Column(name, Text),
+                Column("rank", Float),
+                *(Column(c, Text) for c in class_.fts_columns),
+            )
+            event.listen(table, "after_create", class_._after_create)
+            event.listen(table, "before_drop", class_._before_drop)
+
+    # Class Methods #
+    # FTS5
+    @classmethod
+    def get_fts_table(cls) -> Table:
+        """Gets the Core table of the FTS5 table.
+
+        Returns:
+            The FTS5 table.
+
+        Raises:
+            ValueError: If this class has no FTS5 table.
+        """
+        if cls.fts_table is None:
+            raise ValueError(f"{cls.__name__} has no FTS5 table.")
+        return cls.fts_table
+
+    @classmethod
+    def create_fts_ddl(cls) -> list[str]:
+        """Creates the statements which create the FTS5 table and the triggers which keep it in sync.
+
+        Returns:
+            The DDL statements.
+        """
+        table = as_table(cls).name
+        fts = cls.get_fts_table().name
+        key = as_table(cls).primary_key.columns[0].name
+        names = ", ".join(f'"{c}"' for c in cls.fts_columns)
+        new = ", ".join(f'new."{c}"' for c in cls.fts_columns)
+        old = ", ".join(f'old."{c}"' for c in cls.fts_columns)
+        options = f"content='{table}', content_rowid='{key}'"
+        if cls.fts_tokenizer is not None:
+            options += f", tokenize='{cls.fts_tokenizer}'"
+        insert = f'INSERT INTO "{fts}" (rowid, {names}) VALUES (new."{key}", {new});'
+        delete = f'INSERT INTO "{fts}" ("{fts}", rowid, {names}) VALUES (\'delete\', old."{key}", {old});'
+        return [
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS "{fts}" USING fts5({names}, {options})',
+            f'CREATE TRIGGER IF NOT EXISTS "{fts}_insert" AFTER INSERT ON "{table}" BEGIN {insert} END',
+            f'CREATE TRIGGER IF NOT EXISTS "{fts}_update" AFTER UPDATE OF "{key}", {names} ON "{table}" '
+            f"BEGIN {delete} {insert} END",
+            f'CREATE TRIGGER IF NOT EXISTS "{fts}_delete" AFTER DELETE ON "{table}" BEGIN {delete} END',
+        ]
+
+    @classmethod
+    def create_fts(cls, connection: Connection) -> None:
+        """Creates the FTS5 table and its triggers for an existing table and indexes the existing rows.
+
+        Args:
+            connection: The SQLite connection to create the FTS5 table on.
+        """
+        for statement in cls.create_fts_ddl():
+            connection.exec_driver_sql(statement)
+        cls.rebuild_fts(connection)
+
+    @classmethod
+    def rebuild_fts(cls, connection: Connection) -> None:
+        """Rebuilds the FTS5 index from the rows of the table.
+
+        Args:
+            connection: The SQLite connection to rebuild on.
+        """
+        fts = cls.get_fts_table().name
+        connection.exec_driver_sql(f'INSERT INTO "{fts}" ("{fts}") VALUES (\'rebuild\')')
+
+    @classmethod
+    def _after_create(cls, table: Table, connection: Connection, **kwargs: Any) -> None:
+        if connection.dialect.name == "sqlite":
+            for statement in cls.create_fts_ddl():
+                connection.exec_driver_sql(statement)
+
+    @classmethod
+    def _before_drop(cls, table: Table, connection: Connection, **kwargs: Any) -> None:
+        if connection.dialect.name == "sqlite":
+            connection.exec_driver_sql(f'DROP TABLE IF EXISTS "{cls.get_fts_table().name}"')
+
+    @classmethod
+    def uses_fts(cls, bind: Session | Connection) -> bool:
+        """Checks if queries on a bind can use the FTS5 table.
+
+        Args:
+            bind: The Session or Connection to query with.
+
+        Returns:
+            True if the FTS5 table is maintained and the bind is SQLite.
+        """
+        dialect = (bind.get_bind(cls) if isinstance(bind, Session) else bind).dialect
+        return cls.fts_table is not None and dialect.name == "sqlite"
+
+    # Statements
+    @classmethod
+    def create_search_statement(
+        cls,
+        query: str,
+        fts: bool = True,
+        statement: Select[Any] | None = None,
+    ) -> Select[Any]:
+        """Creates a select of the rows matching a query, best matches first.
+
+        Args:
+            query: The FTS5 query, or the substring to match when fts is False.
+            fts: Determines if the FTS5 table is queried rather than matching substrings.
+            statement: The select to restrict, defaults to this entity.
+
+        Returns:
+            The search statement.
+        """
+        if statement is None:
+            statement = select(cls)
+
+        if not fts or cls.fts_table is None:
+            columns = as_table(cls).c
+            return statement.where(or_(*(columns[c].contains(query, autoescape=True) for c in cls.fts_columns)))
+
+        fts_table = cls.fts_table
+        rank: ColumnElement[Any]
+        if cls.fts_weights is None:
+            rank = fts_table.c.rank
+        else:
+            rank = func.bm25(fts_table.c[fts_table.name], *cls.fts_weights)
+        key = as_table(cls).primary_key.columns[0]
+        return (
+            statement.join(fts_table, fts_table.c.rowid == key)
+            .where(fts_table.c[fts_table.name].match(query))
+            .order_by(rank)
+        )
+
+    # Queries
+    @classmethod
+    def search(cls, session: Session, query: str, limit: int | None = None, quote: bool = False) -> Sequence[Self]:
+        """Gets the objects matching a full-text query, best matches first.
+
+        Args:
+            session: The session to query with.
+            query: The FTS5 query, or plain text when quote is True.
+            limit: The largest number of objects to return, None returns all matches.
+            quote: Determines if the query is plain text whose terms must all match literally.
+
+        Returns:
+            The matching objects.
+        """
+        fts = cls.uses_fts(session)
+        if quote and fts:
+            query = quote_terms(query)
+        statement = cls.create_search_statement(query, fts)
+        if limit is not None:
+            statement = statement.limit(limit)
+        return session.scalars(statement).all()
+
+
+# The legacy declarative_base only creates the table of a subclass after __init_subclass__, so the FTS5 table is
+# created when the subclass is mapped.
+event.listen(FullTextTable, "instrument_class", FullTextTable._instrument_class, propagate=True)
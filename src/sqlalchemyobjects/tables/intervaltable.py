@@ -0,0 +1,363 @@
+""" intervaltable.py
+A template for tables of intervals which answers overlap and containment queries with a SQLite R*Tree index.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections.abc import Sequence
+from typing import Any
+from typing import ClassVar
+from typing import Self
+
+# Third-Party Packages #
+from sqlalchemy import Column
+from sqlalchemy import Connection
+from sqlalchemy import Float
+from sqlalchemy import Index
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Select
+from sqlalchemy import Table
+from sqlalchemy import event
+from sqlalchemy import select
+from sqlalchemy import types
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Mapper
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import declared_attr
+from sqlalchemy.orm import mapped_column
+
+# Local Packages #
+from ..utilities import as_table
+from .basetable import BaseTable
+
+
+# Definitions #
+# Classes #
+class IntervalTable(BaseTable):
+    """A template for tables of closed intervals [start, end] with overlap and containment queries.
+
+    Mix this class into a declarative class before the declarative base, e.g. ``class Segment(IntervalTable, Base)``.
+    The subclass must have a single integer primary key. On SQLite a companion R*Tree virtual table is created with
+    the table and kept in sync by triggers, and queries join it to find candidates. Other dialects, or SQLite when
+    use_rtree is False, fall back to a B-tree index on (start, end).
+
+    Intervals of 32-bit integers are stored exactly in an rtree_i32 R*Tree. Other numeric types, including BigInteger
+    whose values would wrap around in 32 bits, are stored in a float R*Tree whose boxes are conservatively rounded
+    outward, so its candidates are always rechecked against the exact bounds in the table. An R*Tree can only store
+    numbers, so intervals of other types, such as DateTime, use the B-tree index.
+
+    Class Attributes:
+        interval_type: The type of the start and end columns.
+        use_rtree: Determines if a companion R*Tree is maintained and queried on SQLite.
+        rtree_table: The Core table of the companion R*Tree, set on each mapped subclass.
+    """
+
+    interval_type: ClassVar[Any] = Float
+    use_rtree: ClassVar[bool] = True
+    rtree_table: ClassVar[Table | None] = None
+
+    # Columns #
+    @declared_attr
+    def start(cls) -> Mapped[Any]:
+        return mapped_column(cls.interval_type, nullable=False)
+
+    @declared_attr
+    def end(cls) -> Mapped[Any]:
+        return mapped_column(cls.interval_type, nullable=False)
+
+    @declared_attr.directive
+    def __table_args__(cls) -> tuple[Any, ...]:
+        return (Index(f"ix_{cls.__tablename__}_start_end", "start", "end"),)
+
+    # Static Methods #
+    @staticmethod
+    def is_rtree_type(type_: Any) -> bool:
+        """Checks if an R*Tree can store the values of a type, which must be numbers.
+
+        Args:
+            type_: The type of the interval columns.
+
+        Returns:
+            True if the type is an integer, float, or numeric type.
+        """
+        return isinstance(type_, (types.Integer, types.Float, types.Numeric))
+
+    @staticmethod
+    def _instrument_class(mapper: Mapper[Any], class_: type["IntervalTable"]) -> None:
+        """Creates the R*Tree table of a subclass when it is mapped, which is when its table exists.
+
+        Args:
+            mapper: The mapper of the subclass.
+            class_: The mapped subclass.
+        """
+        table = class_.__dict__.get("__table__", None)
+        if table is not None and class_.use_rtree and class_.is_rtree_type(table.c.start.type):
+            class_.rtree_table = Table(
+                f"{table.name}_rtree",
+                MetaData(),
+                Column("id", Integer, primary_key=True),
+                Column("start", class_.interval_type),
+                Column("end", class_.interval_type),
+            )
+            event.listen(table, "after_create", class_._after_create)
+            event.listen(table, "before_drop", class_._before_drop)
+
+    # Class Methods #
+    # R*Tree
+    @classmethod
+    def get_rtree_table(cls) -> Table:
+        """Gets the Core table of the companion R*Tree.
+
+        Returns:
+            The R*Tree table.
+
+        Raises:
+            ValueError: If this class has no R*Tree.
+        """
+        if cls.rtree_table is None:
+            raise ValueError(f"{cls.__name__} has no R*Tree.")
+        return cls.rtree_table
+
+    @classmethod
+    def get_rtree_module(cls) -> str:
+        """Gets the R*Tree module which can store the intervals without losing an overlap.
+
+        Returns:
+            rtree_i32 for 32-bit integer intervals, otherwise the float rtree.
+        """
+        interval_type = as_table(cls).c.start.type
+        is_int32 = isinstance(interval_type, types.Integer) and not isinstance(interval_type, types.BigInteger)
+        return "rtree_i32" if is_int32 else "rtree"
+
+    @classmethod
+    def create_rtree_ddl(cls) -> list[str]:
+        """Creates the statements which create the R*Tree and the triggers which keep it in sync.
+
+        Returns:
+            The DDL statements.
+        """
+        table = as_table(cls)
+        rtree = cls.get_rtree_table().name
+        key = table.primary_key.columns[0].name
+        module = cls.get_rtree_module()
+        insert = f'INSERT INTO "{rtree}" (id, start, "end") VALUES (new."{key}", new.start, new."end");'
+        delete = f'DELETE FROM "{rtree}" WHERE id = old."{key}";'
+        return [
+            f'CREATE VIRTUAL TABLE IF NOT EXISTS "{rtree}" USING {module}(id, start, "end")',
+            f'CREATE TRIGGER IF NOT EXISTS "{rtree}_insert" AFTER INSERT ON "{table.name}" BEGIN {insert} END',
+            f'CREATE TRIGGER IF NOT EXISTS "{rtree}_update" AFTER UPDATE OF "{key}", start, "end" ON "{table.name}" '
+            f"BEGIN {delete} {insert} END",
+            f'CREATE TRIGGER IF NOT EXISTS "{rtree}_delete" AFTER DELETE ON "{table.name}" BEGIN {delete} END',
+        ]
+
+    @classmethod
+    def create_rtree(cls, connection: Connection) -> None:
+        """Creates the R*Tree and its triggers for an existing table and loads the existing intervals into it.
+
+        Args:
+            connection: The SQLite connection to create the R*Tree on.
+        """
+        for statement in cls.create_rtree_ddl():
+            connection.exec_driver_sql(statement)
+        table = as_table(cls)
+        rtree = cls.get_rtree_table().name
+        key = table.primary_key.columns[0].name
+        connection.exec_driver_sql(f'DELETE FROM "{rtree}"')
+        connection.exec_driver_sql(
+            f'INSERT INTO "{rtree}" (id, start, "end") SELECT "{key}", start, "end" FROM "{table.name}"'
+        )
+
+    @classmethod
+    def _after_create(cls, table: Table, connection: Connection, **kwargs: Any) -> None:
+        if connection.dialect.name == "sqlite":
+            for statement in cls.create_rtree_ddl():
+                connection.exec_driver_sql(statement)
+
+    @classmethod
+    def _before_drop(cls, table: Table, connection: Connection, **kwargs: Any) -> None:
+        if connection.dialect.name == "sqlite":
+            connection.exec_driver_sql(f'DROP TABLE IF EXISTS "{cls.get_rtree_table().name}"')
+
+    @classmethod
+    def uses_rtree(cls, bind: Session | Connection) -> bool:
+        """Checks if queries on a bind can use the R*Tree.
+
+        Args:
+            bind: The Session or Connection to query with.
+
+        Returns:
+            True if the R*Tree is maintained and the bind is SQLite.
+        """
+        dialect = (bind.get_bind(cls) if isinstance(bind, Session) else bind).dialect
+        return cls.rtree_table is not None and dialect.name == "sqlite"
+
+    # Statements
+    @classmethod
+    def create_search_statement(
+        cls,
+        exact: Sequence[Any],
+        candidates: Sequence[Any],
+        rtree: bool = True,
+        statement: Select[Any] | None = None,
+    ) -> Select[Any]:
+        """Creates a select restricted by exact conditions, joining the R*Tree restricted by candidate conditions.
+
+        Args:
+            exact: The conditions on the table.
+            candidates: The conditions on the R*Tree, as functions of its table.
+            rtree: Determines if the R*Tree is joined.
+            statement: The select to restrict, defaults to this entity.
+
+        Returns:
+            The search statement.
+        """
+        if statement is None:
+            statement = select(cls)
+        if rtree and cls.rtree_table is not None:
+            rtree_table = cls.rtree_table
+            key = as_table(cls).primary_key.columns[0]
+            statement = statement.join(rtree_table, rtree_table.c.id == key)
+            statement = statement.where(*(c(rtree_table) for c in candidates))
+        return statement.where(*exact)
+
+    @classmethod
+    def create_overlap_statement(
+        cls,
+        start: Any,
+        end: Any,
+        rtree: bool = True,
+        statement: Select[Any] | None = None,
+    ) -> Select[Any]:
+        """Creates a select of the intervals which overlap [start, end].
+
+        Args:
+            start: The start of the interval to overlap.
+            end: The end of the interval to overlap.
+            rtree: Determines if the R*Tree is joined.
+            statement: The select to restrict, defaults to this entity.
+
+        Returns:
+            The overlap statement.
+        """
+        return cls.create_search_statement(
+            (cls.start <= end, cls.end >= start),
+            (lambda r: r.c.start <= end, lambda r: r.c.end >= start),
+            rtree,
+            statement,
+        )
+
+    @classmethod
+    def create_containing_statement(
+        cls,
+        start: Any,
+        end: Any = None,
+        rtree: bool = True,
+        statement: Select[Any] | None = None,
+    ) -> Select[Any]:
+        """Creates a select of the intervals which contain [start, end] or the point start.
+
+        Args:
+            start: The start of the interval or the point to be contained.
+            end: The end of the interval to be contained, None uses the point start.
+            rtree: Determines if the R*Tree is joined.
+            statement: The select to restrict, defaults to this entity.
+
+        Returns:
+            The containing statement.
+        """
+        end = start if end is None else end
+        return cls.create_search_statement(
+            (cls.start <= start, cls.end >= end),
+            (lambda r: r.c.start <= start, lambda r: r.c.end >= end),
+            rtree,
+            statement,
+        )
+
+    @classmethod
+    def create_within_statement(
+        cls,
+        start: Any,
+        end: Any,
+        rtree: bool = True,
+        statement: Select[Any] | None = None,
+    ) -> Select[Any]:
+        """Creates a select of the intervals which lie within [start, end].
+
+        The R*Tree is searched for overlapping boxes because its rounded boxes may extend past the exact bounds.
+
+        Args:
+            start: The start of the containing interval.
+            end: The end of the containing interval.
+            rtree: Determines if the R*Tree is joined.
+            statement: The select to restrict, defaults to this entity.
+
+        Returns:
+            The within statement.
+        """
+        return cls.create_search_statement(
+            (cls.start >= start, cls.end <= end),
+            (lambda r: r.c.start <= end, lambda r: r.c.end >= start),
+            rtree,
+            statement,
+        )
+
+    # Queries
+    @classmethod
+    def get_overlapping(cls, session: Session, start: Any, end: Any) -> Sequence[Self]:
+        """Gets the intervals which overlap [start, end] ordered by start.
+
+        Args:
+            session: The session to query with.
+            start: The start of the interval to overlap.
+            end: The end of the interval to overlap.
+
+        Returns:
+            The overlapping intervals.
+        """
+        statement = cls.create_overlap_statement(start, end, cls.uses_rtree(session))
+        return session.scalars(statement.order_by(cls.start)).all()
+
+    @classmethod
+    def get_containing(cls, session: Session, start: Any, end: Any = None) -> Sequence[Self]:
+        """Gets the intervals which contain [start, end] or the point start ordered by start.
+
+        Args:
+            session: The session to query with.
+            start: The start of the interval or the point to be contained.
+            end: The end of the interval to be contained, None uses the point start.
+
+        Returns:
+            The containing intervals.
+        """
+        statement = cls.create_containing_statement(start, end, cls.uses_rtree(session))
+        return session.scalars(statement.order_by(cls.start)).all()
+
+    @classmethod
+    def get_within(cls, session: Session, start: Any, end: Any) -> Sequence[Self]:
+        """Gets the intervals which lie within [start, end] ordered by start.
+
+        Args:
+            session: The session to query with.
+            start: The start of the containing interval.
+            end: The end of the containing interval.
+
+        Returns:
+            The intervals within.
+        """
+        statement = cls.create_within_statement(start, end, cls.uses_rtree(session))
+        return session.scalars(statement.order_by(cls.start)).all()
+
+
+# The legacy declarative_base only creates the table of a subclass after __init_subclass__, so the R*Tree table is
+# created when the subclass is mapped.
+event.listen(IntervalTable, "instrument_class", IntervalTable._instrument_class, propagate=True)
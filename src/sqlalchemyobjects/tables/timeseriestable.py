@@ -0,0 +1,299 @@
+""" timeseriestable.py
+A template for time-series tables with a composite (series, timestamp) index and range, nearest, and downsample queries.
+"""
+# Package Header #
+from ..header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import datetime
+from collections.abc import Sequence
+from typing import Any
+from typing import ClassVar
+from typing import Self
+
+# Third-Party Packages #
+from sqlalchemy import Connection
+from sqlalchemy import Float
+from sqlalchemy import Index
+from sqlalchemy import Integer
+from sqlalchemy import Row
+from sqlalchemy import Select
+from sqlalchemy import extract
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy import type_coerce
+from sqlalchemy import types
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import declared_attr
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.sql.functions import FunctionElement
+
+# Local Packages #
+from ..utilities import as_table
+from .basetable import BaseTable
+
+
+# Definitions #
+# Classes #
+class time_bucket(FunctionElement[float]):  # noqa: N801
+    """The start of the fixed-width bucket a numeric value falls in, floor(value / width) * width.
+
+    SQLite has no floor function before its optional math functions, so it is compiled as an exact integer floor.
+
+    Args:
+        value: The numeric expression to bucket.
+        width: The width of the buckets.
+    """
+
+    inherit_cache = True
+    type = Float()
+
+
+@compiles(time_bucket)
+def _compile_time_bucket(element: time_bucket, compiler: Any, **kwargs: Any) -> str:
+    value, width = (compiler.process(c, **kwargs) for c in element.clauses)
+    return f"(floor(({value}) / ({width})) * ({width}))"
+
+
+@compiles(time_bucket, "sqlite")
+def _compile_time_bucket_sqlite(element: time_bucket, compiler: Any, **kwargs: Any) -> str:
+    value, width = (compiler.process(c, **kwargs) for c in element.clauses)
+    quotient = f"(({value}) * 1.0 / ({width}))"
+    return f"((CAST({quotient} AS INTEGER) - ({quotient} < CAST({quotient} AS INTEGER))) * ({width}))"
+
+
+class EpochDateTime(types.TypeDecorator[datetime.datetime]):
+    """A type which returns seconds since the epoch as UTC datetimes.
+
+    Attributes:
+        timezone: Determines if the datetimes are timezone aware.
+
+    Args:
+        timezone: Determines if the datetimes are timezone aware.
+    """
+
+    impl = types.Float
+    cache_ok = True
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(self, timezone: bool = False) -> None:
+        super().__init__()
+
+        # New Attributes #
+        self.timezone: bool = timezone
+
+    # Instance Methods #
+    def process_result_value(self, value: Any, dialect: Any) -> datetime.datetime | None:
+        """Converts seconds since the epoch into a datetime.
+
+        Args:
+            value: The seconds since the epoch.
+            dialect: The dialect of the connection.
+
+        Returns:
+            The datetime.
+        """
+        if value is None:
+            return None
+        result = datetime.datetime.fromtimestamp(float(value), datetime.timezone.utc)
+        return result if self.timezone else result.replace(tzinfo=None)
+
+
+class TimeSeriesTable(BaseTable):
+    """A template for time-series tables with a composite (series, timestamp) index.
+
+    Mix this class into a declarative class before the declarative base, e.g. ``class Sample(TimeSeriesTable, Base)``.
+    It adds a timestamp column, a series key column unless series_type is None, and an index which leads with the
+    series key so per-series range queries are index range scans. The primary key is left to the subclass.
+
+    Numeric timestamps are bucketed in their own unit, DateTime timestamps are bucketed in seconds since the epoch.
+
+    Class Attributes:
+        timestamp_type: The type of the timestamp column.
+        series_type: The type of the series key column, None omits the column.
+    """
+
+    timestamp_type: ClassVar[Any] = Float
+    series_type: ClassVar[Any] = Integer
+
+    # Columns #
+    @declared_attr
+    def timestamp(cls) -> Mapped[Any]:
+        return mapped_column(cls.timestamp_type, nullable=False)
+
+    @declared_attr
+    def series(cls) -> Mapped[Any]:
+        if cls.series_type is None:
+            return None  # type: ignore[return-value]  # A None series_type leaves the column out of the table.
+        return mapped_column(cls.series_type, nullable=False)
+
+    @declared_attr.directive
+    def __table_args__(cls) -> tuple[Any, ...]:
+        columns = ("timestamp",) if cls.series_type is None else ("series", "timestamp")
+        return (Index(f"ix_{cls.__tablename__}_{'_'.join(columns)}", *columns),)
+
+    # Class Methods #
+    @classmethod
+    def is_datetime(cls) -> bool:
+        """Checks if the timestamp column is a DateTime.
+
+        Returns:
+            True if the timestamps are datetimes.
+        """
+        return isinstance(as_table(cls).c.timestamp.type, types.DateTime)
+
+    @classmethod
+    def create_range_statement(
+        cls,
+        start: Any = None,
+        stop: Any = None,
+        series: Any = None,
+        statement: Select[Any] | None = None,
+    ) -> Select[Any]:
+        """Creates a select of the rows in the half-open range [start, stop) ordered by timestamp.
+
+        Args:
+            start: The first timestamp of the range, None leaves the range open.
+            stop: The timestamp after the range, None leaves the range open.
+            series: The series key to select, None selects all series.
+            statement: The select to restrict, defaults to this entity.
+
+        Returns:
+            The range statement.
+        """
+        if statement is None:
+            statement = select(cls)
+        if series is not None:
+            statement = statement.where(cls.series == series)
+        if start is not None:
+            statement = statement.where(cls.timestamp >= start)
+        if stop is not None:
+            statement = statement.where(cls.timestamp < stop)
+        return statement.order_by(cls.timestamp)
+
+    @classmethod
+    def get_range(cls, session: Session, start: Any = None, stop: Any = None, series: Any = None) -> Sequence[Self]:
+        """Gets the objects in the half-open range [start, stop) ordered by timestamp.
+
+        Args:
+            session: The session to query with.
+            start: The first timestamp of the range, None leaves the range open.
+            stop: The timestamp after the range, None leaves the range open.
+            series: The series key to select, None selects all series.
+
+        Returns:
+            The objects in the range.
+        """
+        return session.scalars(cls.create_range_statement(start, stop, series)).all()
+
+    @classmethod
+    def get_nearest(cls, session: Session, timestamp: Any, series: Any = None) -> Self | None:
+        """Gets the object with the timestamp nearest to the given one.
+
+        The samples at or before and after the timestamp are each found with one index seek.
+
+        Args:
+            session: The session to query with.
+            timestamp: The timestamp to find the nearest sample to.
+            series: The series key to search, None searches all series.
+
+        Returns:
+            The nearest object or None if there are no samples.
+        """
+        statement = select(cls) if series is None else select(cls).where(cls.series == series)
+        before = session.scalars(
+            statement.where(cls.timestamp <= timestamp).order_by(cls.timestamp.desc()).limit(1)
+        ).first()
+        after = session.scalars(statement.where(cls.timestamp > timestamp).order_by(cls.timestamp).limit(1)).first()
+
+        if before is None or after is None:
+            return before if after is None else after
+        return before if timestamp - before.timestamp <= after.timestamp - timestamp else after
+
+    @classmethod
+    def create_bucket(cls, width: float) -> Any:
+        """Creates the expression of the bucket start each row falls in, which DateTime timestamps return as datetimes.
+
+        Args:
+            width: The width of the buckets, in seconds for DateTime timestamps.
+
+        Returns:
+            The bucket expression.
+        """
+        column = as_table(cls).c.timestamp
+        if isinstance(column.type, types.DateTime):
+            return type_coerce(time_bucket(extract("epoch", column), width), EpochDateTime(column.type.timezone))
+        return time_bucket(column, width)
+
+    @classmethod
+    def create_downsample_statement(
+        cls,
+        width: float,
+        columns: Sequence[Any] = (),
+        start: Any = None,
+        stop: Any = None,
+        series: Any = None,
+        by_series: bool = True,
+    ) -> Select[Any]:
+        """Creates a select which aggregates the rows per fixed-width time bucket in SQL.
+
+        The rows are (bucket, series, *columns) or (bucket, *columns) when not grouped by series.
+
+        Args:
+            width: The width of the buckets, in seconds for DateTime timestamps.
+            columns: The aggregate expressions to compute per bucket, defaults to the count of rows.
+            start: The first timestamp of the range, None leaves the range open.
+            stop: The timestamp after the range, None leaves the range open.
+            series: The series key to select, None selects all series.
+            by_series: Determines if the buckets are grouped per series.
+
+        Returns:
+            The downsample statement.
+        """
+        bucket = cls.create_bucket(width).label("bucket")
+        groups = [bucket]
+        if by_series and cls.series_type is not None:
+            groups.insert(0, cls.series)
+        statement = select(bucket, *groups[:-1], *(columns or (func.count().label("count"),)))
+        statement = cls.create_range_statement(start, stop, series, statement)
+        return statement.group_by(*groups).order_by(None).order_by(*groups)
+
+    @classmethod
+    def downsample(
+        cls,
+        bind: Session | Connection,
+        width: float,
+        columns: Sequence[Any] = (),
+        start: Any = None,
+        stop: Any = None,
+        series: Any = None,
+        by_series: bool = True,
+    ) -> Sequence[Row[Any]]:
+        """Aggregates the rows per fixed-width time bucket in SQL.
+
+        Bucket starts of DateTime timestamps are returned as datetimes, otherwise in the unit of the timestamps.
+
+        Args:
+            bind: The Session or Connection to query with.
+            width: The width of the buckets, in seconds for DateTime timestamps.
+            columns: The aggregate expressions to compute per bucket, defaults to the count of rows.
+            start: The first timestamp of the range, None leaves the range open.
+            stop: The timestamp after the range, None leaves the range open.
+            series: The series key to select, None selects all series.
+            by_series: Determines if the buckets are grouped per series.
+
+        Returns:
+            The rows of (bucket, series, *columns) or (bucket, *columns) when not grouped by series.
+        """
+        return bind.execute(cls.create_downsample_statement(width, columns, start, stop, series, by_series)).all()
@@ -0,0 +1,279 @@
+""" upserts.py
+A dialect-aware insert-or-update of rows executed in large batches.
+"""
+# Package Header #
+from .header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections.abc import Collection
+from collections.abc import Iterable
+from collections.abc import Mapping
+from collections.abc import Sequence
+from itertools import count
+from typing import Any
+from typing import ClassVar
+
+# Third-Party Packages #
+from sqlalchemy import Column
+from sqlalchemy import Connection
+from sqlalchemy import Engine
+from sqlalchemy import MetaData
+from sqlalchemy import Table
+from sqlalchemy import and_
+from sqlalchemy import delete
+from sqlalchemy import exists
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import Session
+
+# Local Packages #
+from .bulk import BulkInserter
+from .bulk import BulkReport
+from .utilities import split_by_columns
+
+# Definitions #
+_stage_ids = count()
+
+
+# Classes #
+class Upserter(BulkInserter):
+    """Inserts rows into a table, updating the existing rows which conflict on a set of key columns.
+
+    SQLite and PostgreSQL compile to INSERT ... ON CONFLICT DO UPDATE and MySQL to ON DUPLICATE KEY UPDATE, each
+    executed as executemany per chunk. Other dialects stage each chunk in a temporary table and merge it into the
+    table with one UPDATE and one INSERT ... SELECT, so every chunk costs a fixed number of round trips.
+
+    Class Attributes:
+        native_dialects: The dialects which upsert with a native statement, the others use a staged merge.
+
+    Attributes:
+        conflict_keys: The names of the columns which identify a row, they must have a unique constraint or index.
+        update_columns: The names of the columns to update on conflict, empty ignores conflicting rows.
+
+    Args:
+        table: The Table or mapped class to upsert into.
+        conflict_keys: The names of the columns which identify a row, defaults to the primary key.
+        update_columns: The names of the columns to update on conflict, defaults to all other columns.
+        *args: The arguments for the BulkInserter.
+        init: Determines if this object will construct.
+        **kwargs: The keyword arguments for the BulkInserter.
+    """
+
+    native_dialects: ClassVar[frozenset[str]] = frozenset({"sqlite", "postgresql", "mysql", "mariadb"})
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        table: Any = None,
+        conflict_keys: Sequence[str] | None = None,
+        update_columns: Sequence[str] | None = None,
+        *args: Any,
+        init: bool = True,
+        **kwargs: Any,
+    ) -> None:
+        # New Attributes #
+        self.conflict_keys: tuple[str, ...] = ()
+        self.update_columns: tuple[str, ...] = ()
+
+        # Parent Attributes #
+        super().__init__(*args, init=False, **kwargs)
+
+        # Object Construction #
+        if init:
+            self.construct(table, *args, conflict_keys=conflict_keys, update_columns=update_columns, **kwargs)
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(
+        self,
+        table: Any = None,
+        *args: Any,
+        conflict_keys: Sequence[str] | None = None,
+        update_columns: Sequence[str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Constructs this object.
+
+        Args:
+            table: The Table or mapped class to upsert into.
+            *args: The arguments for the BulkInserter.
+            conflict_keys: The names of the columns which identify a row, defaults to the primary key.
+            update_columns: The names of the columns to update on conflict, defaults to all other columns.
+            **kwargs: The keyword arguments for the BulkInserter.
+        """
+        super().construct(table, *args, **kwargs)
+
+        if conflict_keys is not None:
+            self.conflict_keys = tuple(conflict_keys)
+        elif table is not None:
+            self.conflict_keys = tuple(self.get_table().primary_key.columns.keys())
+
+        if update_columns is not None:
+            self.update_columns = tuple(update_columns)
+        elif table is not None or conflict_keys is not None:
+            self.update_columns = tuple(c for c in self.get_table().columns.keys() if c not in self.conflict_keys)
+
+        if self.table is not None:
+            unknown = set(self.conflict_keys + self.update_columns).difference(self.table.columns.keys())
+            if unknown:
+                raise ValueError(f"Columns {sorted(unknown)} are not in table {self.table.name}.")
+            if not self.conflict_keys:
+                raise ValueError(f"Upserts into {self.table.name} need conflict keys or a primary key.")
+
+    # Statements
+    def create_statement(self, connection: Connection) -> Any:
+        """Creates the native insert for the dialect of the connection, which each chunk adds its conflict clause to.
+
+        Args:
+            connection: The connection the chunks will be executed on.
+
+        Returns:
+            The native insert statement or None if the dialect needs a staged merge.
+        """
+        name = connection.dialect.name
+        if name not in self.native_dialects:
+            return None
+        elif name == "sqlite":
+            return sqlite.insert(self.get_table())
+        elif name == "postgresql":
+            return postgresql.insert(self.get_table())
+        elif name in ("mysql", "mariadb"):
+            return mysql.insert(self.get_table())
+        else:
+            return None
+
+    def create_upsert(self, statement: Any, names: Collection[str]) -> Any:
+        """Adds the conflict clause for the columns of a chunk to a native insert.
+
+        Only the update columns present in the chunk are updated, so columns missing from the rows keep their values
+        like they do in a staged merge.
+
+        Args:
+            statement: The native insert statement.
+            names: The names of the columns in the chunk.
+
+        Returns:
+            The native upsert statement.
+        """
+        updating = [c for c in self.update_columns if c in names]
+        if isinstance(statement, mysql.Insert):
+            if not updating:
+                return statement.prefix_with("IGNORE")
+            return statement.on_duplicate_key_update({c: statement.inserted[c] for c in updating})
+        if not updating:
+            return statement.on_conflict_do_nothing(index_elements=self.conflict_keys)
+        return statement.on_conflict_do_update(
+            index_elements=self.conflict_keys,
+            set_={c: statement.excluded[c] for c in updating},
+        )
+
+    def create_stage(self) -> Table:
+        """Creates a temporary table with the columns of the table to stage chunks in.
+
+        Returns:
+            The staging table.
+        """
+        table = self.get_table()
+        return Table(
+            f"_stage_{table.name}_{next(_stage_ids)}",
+            MetaData(),
+            *(Column(c.name, c.type) for c in table.columns),
+            prefixes=["TEMPORARY"],
+        )
+
+    def merge_chunk(self, connection: Connection, chunk: list[Mapping[str, Any]]) -> None:
+        """Upserts a chunk by staging it in a temporary table and merging it into the table.
+
+        Args:
+            connection: The connection to execute on.
+            chunk: The parameter dictionaries of the rows.
+        """
+        table = self.get_table()
+        stage = self.create_stage()
+        stage.create(connection)
+        try:
+            connection.execute(insert(stage), chunk)
+            matches = and_(*(stage.c[k] == table.c[k] for k in self.conflict_keys))
+            names = list(chunk[0].keys())
+
+            updating = [c for c in self.update_columns if c in names]
+            if updating:
+                values = {c: select(stage.c[c]).where(matches).scalar_subquery() for c in updating}
+                connection.execute(update(table).values(values).where(exists().where(matches)))
+
+            source = select(*(stage.c[n] for n in names)).where(~exists().where(matches))
+            connection.execute(insert(table).from_select(names, source))
+            connection.execute(delete(stage))
+        finally:
+            stage.drop(connection)
+
+    def execute_chunk(self, connection: Connection, statement: Any, chunk: list[Mapping[str, Any]]) -> None:
+        """Executes the upsert for one chunk of rows, once per run of rows with the same columns.
+
+        Args:
+            connection: The connection to execute on.
+            statement: The native insert statement or None to use a staged merge.
+            chunk: The parameter dictionaries of the rows.
+        """
+        for run in split_by_columns(chunk):
+            if statement is None:
+                self.merge_chunk(connection, run)
+            else:
+                connection.execute(self.create_upsert(statement, run[0].keys()), run)
+
+    def upsert(
+        self,
+        bind: Engine | Connection | Session,
+        rows: Iterable[Mapping[str, Any] | Sequence[Any]],
+    ) -> BulkReport:
+        """Upserts rows into the table.
+
+        An Engine upserts all rows in one transaction, a Connection or Session uses its current transaction.
+
+        Args:
+            bind: The Engine, Connection, or Session to upsert with.
+            rows: The rows as dictionaries or tuples.
+
+        Returns:
+            The totals of this upsert.
+        """
+        return self.insert(bind, rows)
+
+
+# Functions #
+def upsert(
+    bind: Engine | Connection | Session,
+    table_or_model: Any,
+    rows: Iterable[Mapping[str, Any] | Sequence[Any]],
+    conflict_keys: Sequence[str] | None = None,
+    update_columns: Sequence[str] | None = None,
+    **kwargs: Any,
+) -> BulkReport:
+    """Inserts rows into a table, updating the existing rows which conflict on a set of key columns.
+
+    Args:
+        bind: The Engine, Connection, or Session to upsert with.
+        table_or_model: The Table or mapped class to upsert into.
+        rows: The rows as dictionaries or tuples.
+        conflict_keys: The names of the columns which identify a row, defaults to the primary key.
+        update_columns: The names of the columns to update on conflict, defaults to all other columns.
+        **kwargs: The keyword arguments for the BulkInserter.
+
+    Returns:
+        The totals of this upsert.
+    """
+    upserter = Upserter(table_or_model, conflict_keys=conflict_keys, update_columns=update_columns, **kwargs)
+    return upserter.upsert(bind, rows)
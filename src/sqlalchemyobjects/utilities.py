@@ -0,0 +1,172 @@
+""" utilities.py
+Small helpers shared by the table operations of this package.
+"""
+# Package Header #
+from .header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+from collections.abc import Iterable
+from collections.abc import Iterator
+from collections.abc import Mapping
+from typing import Any
+
+# Third-Party Packages #
+from sqlalchemy import Column
+from sqlalchemy import Connection
+from sqlalchemy import Dialect
+from sqlalchemy import Label
+from sqlalchemy import Row
+from sqlalchemy import Select
+from sqlalchemy import Table
+from sqlalchemy import inspect
+from sqlalchemy.orm import InstanceState
+from sqlalchemy.orm import Session
+
+# Definitions #
+PARAMETER_LIMITS: dict[str, int] = {
+    "sqlite": 32766,
+    "postgresql": 32767,
+    "mysql": 65535,
+    "mariadb": 65535,
+    "mssql": 2100,
+    "oracle": 65535,
+}
+LEGACY_SQLITE_PARAMETER_LIMIT = 999
+DEFAULT_PARAMETER_LIMIT = 999
+
+
+# Functions #
+def as_table(table_or_model: Any) -> Table:
+    """Gets the Table of a Table or a mapped class.
+
+    Args:
+        table_or_model: The Table or mapped class.
+
+    Returns:
+        The Table.
+    """
+    if isinstance(table_or_model, Table):
+        return table_or_model
+
+    table = getattr(inspect(table_or_model, raiseerr=False), "local_table", None)
+    if not isinstance(table, Table):
+        raise TypeError(f"{table_or_model!r} is not a Table or a mapped class.")
+    return table
+
+
+def selected_columns(statement: Select[Any]) -> list[tuple[str, Any]]:
+    """Gets the names and expressions of the columns a select returns.
+
+    Names are the unique keys of the selected columns, expressions without a name such as ``t.c.value + 1`` are named
+    by their position, e.g. ``column_0``.
+
+    Args:
+        statement: The select to get the columns of.
+
+    Returns:
+        The name and expression of each selected column.
+    """
+    return [
+        (key if getattr(column, "name", None) is not None else f"column_{index}", column)
+        for index, (key, column) in enumerate(statement.selected_columns.items())
+    ]
+
+
+def is_nullable(column: Any) -> bool:
+    """Determines if a selected column expression can return NULL.
+
+    Labels are resolved to the expression they name. Only table columns can be proven not null, any other expression
+    such as an aggregate may return NULL.
+
+    Args:
+        column: The selected column expression.
+
+    Returns:
+        True if the column can return NULL.
+    """
+    while isinstance(column, Label):
+        column = column.element
+    if isinstance(column, Column):
+        return bool(column.nullable) and not column.primary_key
+    return True
+
+
+def parameter_limit(dialect: Dialect) -> int:
+    """Gets the maximum number of bound parameters a single statement may use on a dialect.
+
+    SQLite builds before 3.32 only allow 999 parameters per statement.
+
+    Args:
+        dialect: The dialect to get the limit of.
+
+    Returns:
+        The maximum number of bound parameters.
+    """
+    if dialect.name == "sqlite":
+        version = getattr(dialect.dbapi, "sqlite_version_info", (0,))
+        if version < (3, 32):
+            return LEGACY_SQLITE_PARAMETER_LIMIT
+    return PARAMETER_LIMITS.get(dialect.name, DEFAULT_PARAMETER_LIMIT)
+
+
+def as_connection(bind: Connection | Session) -> Connection:
+    """Gets the Connection of a Connection or Session.
+
+    Args:
+        bind: The Connection or Session.
+
+    Returns:
+        The Connection.
+    """
+    if isinstance(bind, Session):
+        return bind.connection()
+    if isinstance(bind, Connection):
+        return bind
+    raise TypeError(f"Expected a Connection or Session, got {type(bind).__name__}.")
+
+
+def split_by_columns(rows: Iterable[Mapping[str, Any]]) -> Iterator[list[Mapping[str, Any]]]:
+    """Splits rows into consecutive runs of rows which have values for the same columns.
+
+    An executemany compiles its statement from the columns of the first row, so each run must be executed on its own
+    for the values of the other rows not to be lost. The runs keep the order of the rows.
+
+    Args:
+        rows: The rows as dictionaries.
+
+    Yields:
+        The next run of rows with the same columns.
+    """
+    run: list[Mapping[str, Any]] = []
+    for row in rows:
+        if run and row.keys() != run[0].keys():
+            yield run
+            run = []
+        run.append(row)
+    if run:
+        yield run
+
+
+def expunge_partition(session: Session, partition: Iterable[Any]) -> None:
+    """Expunges the ORM objects in a partition of streamed results from a session.
+
+    Objects are expunged one by one because replacing the whole identity map would break a result which is still
+    loading with yield_per.
+
+    Args:
+        session: The session the objects belong to.
+        partition: The objects or rows of objects.
+    """
+    for item in partition:
+        for value in item if isinstance(item, Row) else (item,):
+            state = inspect(value, raiseerr=False)
+            if isinstance(state, InstanceState) and state.session_id == session.hash_key:
+                session.expunge(value)
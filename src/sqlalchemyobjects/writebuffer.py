@@ -0,0 +1,518 @@
+""" writebuffer.py
+A write-behind buffer which coalesces changes to rows and flushes them in batches.
+"""
+# Package Header #
+from .header import *
+
+# Header #
+__author__ = __author__
+__credits__ = __credits__
+__maintainer__ = __maintainer__
+__email__ = __email__
+
+
+# Imports #
+# Standard Libraries #
+import logging
+import threading
+import time
+from collections.abc import Mapping
+from types import TracebackType
+from typing import Any
+
+# Third-Party Packages #
+from sqlalchemy import Connection
+from sqlalchemy import Engine
+from sqlalchemy import Table
+from sqlalchemy import and_
+from sqlalchemy import bindparam
+from sqlalchemy import delete
+from sqlalchemy import insert
+from sqlalchemy import inspect
+from sqlalchemy.orm import InstanceState
+from sqlalchemy.schema import sort_tables
+
+# Local Packages #
+from .bulk import BulkUpdater
+from .utilities import as_table
+
+# Definitions #
+_logger = logging.getLogger(__name__)
+_MISSING = object()
+
+
+# Classes #
+class TableBuffer:
+    """The coalesced pending changes to one table.
+
+    Inserts followed by updates of the same key merge into one insert, repeated updates merge into one update, and a
+    delete drops the pending insert and update of its key. At flush deletes run first, then inserts, then updates.
+    Each step is a separate method so a flush of several tables can order the steps by the foreign keys between them.
+
+    Attributes:
+        table: The table the changes are for.
+        keys: The names of the primary key columns.
+        inserts: The rows to insert by primary key.
+        unkeyed: The rows to insert which have no primary key value yet.
+        updates: The values to update by primary key.
+        deletes: The primary keys of the rows to delete.
+
+    Args:
+        table: The table the changes are for.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(self, table: Table) -> None:
+        # New Attributes #
+        self.table: Table = table
+        self.keys: tuple[str, ...] = tuple(table.primary_key.columns.keys())
+        self.inserts: dict[tuple[Any, ...], dict[str, Any]] = {}
+        self.unkeyed: list[dict[str, Any]] = []
+        self.updates: dict[tuple[Any, ...], dict[str, Any]] = {}
+        self.deletes: dict[tuple[Any, ...], dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self.inserts) + len(self.unkeyed) + len(self.updates) + len(self.deletes)
+
+    # Instance Methods #
+    # Keys
+    def key_of(self, values: Mapping[str, Any]) -> tuple[Any, ...] | None:
+        """Gets the primary key of a row.
+
+        Args:
+            values: The values of the row.
+
+        Returns:
+            The primary key or None if any part of it is missing.
+        """
+        key = tuple(values.get(k, None) for k in self.keys)
+        return None if None in key else key
+
+    # Changes
+    def insert(self, values: Mapping[str, Any]) -> None:
+        """Adds a row to insert.
+
+        Args:
+            values: The values of the row.
+        """
+        key = self.key_of(values)
+        if key is None:
+            self.unkeyed.append(dict(values))
+        else:
+            self.updates.pop(key, None)
+            self.inserts[key] = dict(values)
+
+    def update(self, values: Mapping[str, Any]) -> None:
+        """Adds values to update, merging them into a pending insert or update of the same row.
+
+        Args:
+            values: The values to update, including the primary key.
+        """
+        key = self.key_of(values)
+        if key is None:
+            raise ValueError(f"Updates to {self.table.name} need values for the primary key {self.keys}.")
+
+        pending = self.inserts.get(key, None)
+        if pending is None:
+            pending = self.updates.setdefault(key, {})
+        pending.update(values)
+
+    def delete(self, values: Mapping[str, Any]) -> None:
+        """Adds a row to delete, dropping its pending insert and update.
+
+        Args:
+            values: The primary key values of the row.
+        """
+        key = self.key_of(values)
+        if key is None:
+            raise ValueError(f"Deletes from {self.table.name} need values for the primary key {self.keys}.")
+        self.inserts.pop(key, None)
+        self.updates.pop(key, None)
+        self.deletes[key] = {k: values[k] for k in self.keys}
+
+    def merge(self, newer: "TableBuffer") -> None:
+        """Applies the changes of a newer buffer of the same table on top of the changes of this buffer.
+
+        Args:
+            newer: The buffer whose changes were added after the changes of this buffer.
+        """
+        for values in newer.deletes.values():
+            self.delete(values)
+        for values in newer.inserts.values():
+            self.insert(values)
+        self.unkeyed.extend(newer.unkeyed)
+        for values in newer.updates.values():
+            self.update(values)
+
+    # Flush
+    def execute(self, connection: Connection) -> None:
+        """Executes the pending changes as executemany statements on a connection.
+
+        Args:
+            connection: The connection to execute on.
+        """
+        self.execute_deletes(connection)
+        self.execute_inserts(connection)
+        self.execute_updates(connection)
+
+    def execute_deletes(self, connection: Connection) -> None:
+        """Executes the pending deletes as one executemany statement.
+
+        Args:
+            connection: The connection to execute on.
+        """
+        if self.deletes:
+            table = self.table
+            matches = and_(*(table.c[k] == bindparam(f"_key_{k}") for k in self.keys))
+            parameters = [{f"_key_{k}": v for k, v in row.items()} for row in self.deletes.values()]
+            connection.execute(delete(table).where(matches), parameters)
+
+    def execute_inserts(self, connection: Connection) -> None:
+        """Executes the pending inserts as one executemany statement per set of columns.
+
+        Args:
+            connection: The connection to execute on.
+        """
+        inserts = list(self.inserts.values()) + self.unkeyed
+        for rows in group_by_columns(inserts).values():
+            connection.execute(insert(self.table), rows)
+
+    def execute_updates(self, connection: Connection) -> None:
+        """Executes the pending updates as executemany statements.
+
+        Args:
+            connection: The connection to execute on.
+        """
+        table = self.table
+        if self.updates:
+            BulkUpdater(table, chunk_size=len(self.updates), adaptive=False).update_chunks(
+                connection, self.updates.values()
+            )
+
+
+class WriteBuffer:
+    """A write-behind buffer which coalesces changes to rows and flushes them in batches.
+
+    Changes are flushed in one transaction, as executemany statements grouped by table and column set, when the
+    number of pending changes reaches max_size, when the oldest pending change is older than max_age, or when
+    flush is called. Tables are flushed in foreign key order, deletes from dependent tables first and inserts and
+    updates into referenced tables first. A writer which finds max_pending changes waiting flushes them itself,
+    blocking until the database catches up, which bounds memory when the database falls behind.
+
+    The changes of a failed flush are kept, under any changes added since, and written by the next flush. The error of
+    a failed background flush is raised by the next call to write, flush, or close.
+
+    Attributes:
+        engine: The engine to flush to.
+        max_size: The number of pending changes which triggers a flush.
+        max_age: The seconds a change may wait before a background flush, None disables timed flushes.
+        max_pending: The number of pending changes at which writers block until a flush completes.
+        buffers: The pending changes by table.
+        pending: The number of pending changes.
+        oldest: The monotonic time the oldest pending change was added at.
+        error: The error of a failed background flush which has not been raised yet.
+        _lock: The lock which guards the buffers.
+        _flush_lock: The lock which serializes flushes.
+        _stop: The event which stops the background flusher.
+        _thread: The background flusher.
+
+    Args:
+        engine: The engine to flush to.
+        max_size: The number of pending changes which triggers a flush.
+        max_age: The seconds a change may wait before a background flush, None disables timed flushes.
+        max_pending: The number of pending changes at which writers block, defaults to four times max_size.
+        init: Determines if this object will construct.
+    """
+
+    # Magic Methods #
+    # Construction/Destruction
+    def __init__(
+        self,
+        engine: Engine | None = None,
+        max_size: int = 10000,
+        max_age: float | None = 1.0,
+        max_pending: int | None = None,
+        *,
+        init: bool = True,
+    ) -> None:
+        # New Attributes #
+        self.engine: Engine | None = None
+        self.max_size: int = 10000
+        self.max_age: float | None = 1.0
+        self.max_pending: int = 40000
+        self.buffers: dict[Table, TableBuffer] = {}
+        self.pending: int = 0
+        self.oldest: float | None = None
+        self.error: BaseException | None = None
+        self._lock: threading.Lock = threading.Lock()
+        self._flush_lock: threading.Lock = threading.Lock()
+        self._stop: threading.Event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        # Object Construction #
+        if init:
+            self.construct(engine, max_size, max_age, max_pending)
+
+    def __enter__(self) -> "WriteBuffer":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return self.pending
+
+    # Instance Methods #
+    # Constructors/Destructors
+    def construct(
+        self,
+        engine: Engine | None = None,
+        max_size: int | None = None,
+        max_age: Any = _MISSING,
+        max_pending: int | None = None,
+    ) -> None:
+        """Constructs this object.
+
+        Args:
+            engine: The engine to flush to.
+            max_size: The number of pending changes which triggers a flush.
+            max_age: The seconds a change may wait before a background flush, None disables timed flushes.
+            max_pending: The number of pending changes at which writers block, defaults to four times max_size.
+
+        Raises:
+            ValueError: If max_pending is less than max_size.
+        """
+        if engine is not None:
+            self.engine = engine
+
+        if max_size is not None:
+            self.max_size = max_size
+
+        if max_age is not _MISSING:
+            self.max_age = max_age
+
+        self.max_pending = max_pending if max_pending is not None else self.max_size * 4
+        if self.max_pending < self.max_size:
+            raise ValueError(f"max_pending ({self.max_pending}) must be at least max_size ({self.max_size}).")
+
+        if self.max_age is not None and (self._thread is None or not self._thread.is_alive()):
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run_flusher, name="WriteBufferFlusher", daemon=True)
+            self._thread.start()
+
+    def close(self) -> None:
+        """Stops the background flusher and flushes the remaining changes.
+
+        Raises:
+            BaseException: The error of a failed background flush which has not been raised yet.
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self.flush()
+
+    # Engine
+    def get_engine(self) -> Engine:
+        """Gets the engine to flush to.
+
+        Returns:
+            The engine.
+
+        Raises:
+            ValueError: If no engine was given.
+        """
+        if self.engine is None:
+            raise ValueError(f"{type(self).__name__} has no engine to flush to.")
+        return self.engine
+
+    # Errors
+    def raise_error(self) -> None:
+        """Raises the error of a failed background flush once.
+
+        Raises:
+            BaseException: The error of a failed background flush which has not been raised yet.
+        """
+        error, self.error = self.error, None
+        if error is not None:
+            raise error
+
+    # Changes
+    def resolve(self, target: Any, values: Mapping[str, Any] | None) -> tuple[TableBuffer, dict[str, Any]]:
+        """Resolves a mapped object or a table and values into the table buffer and the column values.
+
+        Args:
+            target: A mapped object, or a Table or mapped class when values are given.
+            values: The column values, None takes them from the mapped object.
+
+        Returns:
+            The table buffer and the column values.
+        """
+        state = inspect(target, raiseerr=False)
+        if isinstance(state, InstanceState):
+            mapper = state.mapper
+            table = as_table(mapper.local_table)
+            if values is None:
+                values = {p.columns[0].name: getattr(target, p.key) for p in mapper.column_attrs}
+        else:
+            table = as_table(target)
+            if values is None:
+                raise ValueError("Values are required when the target is not a mapped object.")
+
+        buffer = self.buffers.get(table, None)
+        if buffer is None:
+            buffer = self.buffers[table] = TableBuffer(table)
+        return buffer, dict(values)
+
+    def write(self, operation: str, target: Any, values: Mapping[str, Any] | None) -> None:
+        """Adds a change, blocking while the buffer is full and flushing once it reaches max_size.
+
+        Args:
+            operation: The name of the change, "insert", "update", or "delete".
+            target: A mapped object, or a Table or mapped class when values are given.
+            values: The column values, None takes them from the mapped object.
+
+        Raises:
+            BaseException: The error of a failed background flush which has not been raised yet.
+        """
+        with self._lock:
+            self.raise_error()
+            blocked = self.pending >= self.max_pending
+
+        if blocked:
+            self.flush()
+
+        with self._lock:
+            buffer, values = self.resolve(target, values)
+            before = len(buffer)
+            getattr(buffer, operation)(values)
+            self.pending += len(buffer) - before
+            if self.oldest is None:
+                self.oldest = time.monotonic()
+            full = self.pending >= self.max_size
+
+        if full:
+            self.flush()
+
+    def insert(self, target: Any, values: Mapping[str, Any] | None = None) -> None:
+        """Buffers a row to insert.
+
+        Args:
+            target: A mapped object, or a Table or mapped class when values are given.
+            values: The column values, None takes them from the mapped object.
+        """
+        self.write("insert", target, values)
+
+    def update(self, target: Any, values: Mapping[str, Any] | None = None) -> None:
+        """Buffers values to update, coalescing them with pending changes to the same primary key.
+
+        Args:
+            target: A mapped object, or a Table or mapped class when values are given.
+            values: The column values including the primary key, None takes them from the mapped object.
+        """
+        self.write("update", target, values)
+
+    def delete(self, target: Any, values: Mapping[str, Any] | None = None) -> None:
+        """Buffers a row to delete.
+
+        Args:
+            target: A mapped object, or a Table or mapped class when values are given.
+            values: The primary key values, None takes them from the mapped object.
+        """
+        self.write("delete", target, values)
+
+    # Flush
+    def flush(self) -> int:
+        """Writes the pending changes in one transaction.
+
+        If the transaction fails its changes are kept for the next flush and the error is raised.
+
+        Returns:
+            The number of changes written.
+
+        Raises:
+            BaseException: The error of a failed background flush which has not been raised yet.
+        """
+        with self._flush_lock:
+            with self._lock:
+                self.raise_error()
+                buffers, self.buffers = self.buffers, {}
+                pending, self.pending = self.pending, 0
+                oldest, self.oldest = self.oldest, None
+
+            if buffers:
+                try:
+                    self.execute(buffers)
+                except BaseException:
+                    self.restore(buffers, oldest)
+                    raise
+            return pending
+
+    def execute(self, buffers: Mapping[Table, TableBuffer]) -> None:
+        """Writes the changes of table buffers in one transaction in foreign key order.
+
+        Args:
+            buffers: The table buffers to write.
+        """
+        ordered = [buffers[t] for t in sort_tables(buffers)]
+        with self.get_engine().begin() as connection:
+            for buffer in reversed(ordered):
+                buffer.execute_deletes(connection)
+            for buffer in ordered:
+                buffer.execute_inserts(connection)
+            for buffer in ordered:
+                buffer.execute_updates(connection)
+
+    def restore(self, buffers: dict[Table, TableBuffer], oldest: float | None) -> None:
+        """Puts the changes of a failed flush back under the changes added since it started.
+
+        Args:
+            buffers: The table buffers of the failed flush.
+            oldest: The monotonic time the oldest change of the failed flush was added at.
+        """
+        with self._lock:
+            for table, newer in self.buffers.items():
+                buffer = buffers.get(table, None)
+                if buffer is None:
+                    buffers[table] = newer
+                else:
+                    buffer.merge(newer)
+            self.buffers = buffers
+            self.pending = sum(len(b) for b in buffers.values())
+            self.oldest = oldest if oldest is not None else self.oldest
+
+    def _run_flusher(self) -> None:
+        """Flushes in the background whenever the oldest pending change is older than max_age."""
+        max_age = self.max_age
+        while max_age is not None and not self._stop.wait(max_age / 4.0):
+            oldest = self.oldest
+            if oldest is not None and time.monotonic() - oldest >= max_age:
+                try:
+                    self.flush()
+                except Exception as error:  # noqa: B902
+                    with self._lock:
+                        self.error = error
+                    _logger.exception("WriteBuffer background flush failed.")
+            max_age = self.max_age
+
+
+# Functions #
+def group_by_columns(rows: Any) -> dict[tuple[str, ...], list[dict[str, Any]]]:
+    """Groups rows by the set of columns they have values for.
+
+    Args:
+        rows: The rows as dictionaries.
+
+    Returns:
+        The rows grouped by their sorted column names.
+    """
+    groups: dict[tuple[str, ...], list[dict[str, Any]]] = {}
+    for row in rows:
+        groups.setdefault(tuple(sorted(row)), []).append(row)
+    return groups
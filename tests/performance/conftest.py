@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" conftest.py
+Fixtures of the performance suite which time operations and compare them against a baseline.
+"""
+# Imports #
+# Standard Libraries #
+import json
+import pathlib
+import platform
+import sqlite3
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Optional
+
+import pytest
+import sqlalchemy
+
+# Third-Party Packages #
+
+# Local Packages #
+
+
+# Definitions #
+# Classes #
+class PerformanceRecorder:
+    """Times operations, records the results, and fails measurements which regress past a baseline."""
+
+    def __init__(self, repeat: int, threshold: float, baseline: Optional[Dict[str, float]] = None) -> None:
+        self.repeat = repeat
+        self.threshold = threshold
+        self.baseline = baseline or {}
+        self.results: Dict[str, float] = {}
+
+    def measure(
+        self,
+        name: str,
+        rows: int,
+        operation: Callable[[], Any],
+        setup: Optional[Callable[[], Any]] = None,
+    ) -> float:
+        """Times an operation, keeping the best of the repeats, and records it under name[rows]."""
+        best = float("inf")
+        for _ in range(self.repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            operation()
+            best = min(best, time.perf_counter() - start)
+
+        key = f"{name}[{rows}]"
+        self.results[key] = best
+        previous = self.baseline.get(key, None)
+        if previous is not None and best > previous * (1.0 + self.threshold):
+            pytest.fail(f"{key} regressed: {best:.6f}s against a baseline of {previous:.6f}s")
+        return best
+
+    def dump(self, path: pathlib.Path) -> None:
+        """Saves the results and the environment they were measured in as JSON."""
+        document = {
+            "python": platform.python_version(),
+            "sqlalchemy": sqlalchemy.__version__,
+            "sqlite": sqlite3.sqlite_version,
+            "machine": platform.machine(),
+            "results": self.results,
+        }
+        path.write_text(json.dumps(document, indent=2, sort_keys=True))
+
+
+# Functions #
+def pytest_generate_tests(metafunc):
+    """Parametrizes the rows fixture with the sizes given by --perf-sizes."""
+    if "rows" in metafunc.fixturenames:
+        sizes = [int(float(s)) for s in metafunc.config.getoption("--perf-sizes").split(",") if s.strip()]
+        metafunc.parametrize("rows", sizes, scope="module")
+
+
+@pytest.fixture(scope="session")
+def recorder(request):
+    """The session-wide recorder which writes the results when the suite finishes."""
+    config = request.config
+    baseline_path = config.getoption("--perf-baseline")
+    baseline = None
+    if baseline_path is not None:
+        baseline = json.loads(pathlib.Path(baseline_path).read_text())["results"]
+
+    recorder = PerformanceRecorder(config.getoption("--perf-repeat"), config.getoption("--perf-threshold"), baseline)
+    yield recorder
+
+    output = config.getoption("--perf-output")
+    if output is not None:
+        recorder.dump(pathlib.Path(output))
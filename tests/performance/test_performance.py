@@ -0,0 +1,213 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_performance.py
+Benchmarks of the hot paths of the package on SQLite.
+
+Run with ``pytest tests/performance --perf-sizes=1e3,1e5,1e7 --perf-output=results.json`` and compare a later run
+with ``--perf-baseline=results.json``.
+"""
+# Imports #
+# Standard Libraries #
+from typing import List
+from typing import Optional
+
+import pytest
+from sqlalchemy import ForeignKey
+from sqlalchemy import bindparam
+from sqlalchemy import select
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import sessionmaker
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects import BaseTable
+from src.sqlalchemyobjects import BulkInserter
+from src.sqlalchemyobjects import EagerLoadPlanner
+from src.sqlalchemyobjects import EngineRegistry
+from src.sqlalchemyobjects import KeysetPager
+from src.sqlalchemyobjects import bulk_update
+from src.sqlalchemyobjects import upsert
+from src.sqlalchemyobjects.pagination import encode_cursor
+
+
+# Definitions #
+PAGE_SIZE = 1000
+CHILDREN_PER_PARENT = 10
+
+
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Parent(BaseTable, Base):
+    __tablename__ = "parent"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str]
+    children: Mapped[List["Child"]] = relationship(back_populates="parent")
+
+
+class Child(BaseTable, Base):
+    __tablename__ = "child"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    parent_id: Mapped[int] = mapped_column(ForeignKey("parent.id"), index=True)
+    value: Mapped[float]
+    label: Mapped[Optional[str]]
+    parent: Mapped[Parent] = relationship(back_populates="children")
+
+
+# Functions #
+def parent_rows(rows):
+    return ((i, f"parent-{i}") for i in range(max(rows // CHILDREN_PER_PARENT, 1)))
+
+
+def child_rows(rows, offset=0):
+    parents = max(rows // CHILDREN_PER_PARENT, 1)
+    return ((i + offset, i % parents, float(i), None) for i in range(rows))
+
+
+def reset(engine):
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+
+
+# Fixtures #
+@pytest.fixture(scope="module")
+def registry():
+    registry = EngineRegistry()
+    yield registry
+    registry.dispose()
+
+
+@pytest.fixture(scope="module")
+def engine(registry, tmp_path_factory):
+    """An empty file database with the bulk load profile."""
+    path = tmp_path_factory.mktemp("performance") / "empty.db"
+    return registry.get_engine(f"sqlite:///{path}", "sqlite-bulk-load")
+
+
+@pytest.fixture(scope="module")
+def populated(registry, tmp_path_factory, rows):
+    """A file database with the read heavy profile holding rows children and a tenth as many parents."""
+    path = tmp_path_factory.mktemp("performance") / f"populated-{rows}.db"
+    engine = registry.get_engine(f"sqlite:///{path}", "sqlite-wal-readheavy")
+    reset(engine)
+    with engine.begin() as connection:
+        BulkInserter(Parent).insert(connection, parent_rows(rows))
+        BulkInserter(Child).insert(connection, child_rows(rows))
+    return engine
+
+
+# Tests #
+class TestWrites:
+    def test_bulk_insert(self, recorder, engine, rows):
+        recorder.measure(
+            "bulk_insert",
+            rows,
+            lambda: BulkInserter(Child).insert(engine, child_rows(rows)),
+            setup=lambda: reset(engine),
+        )
+
+    def test_upsert(self, recorder, engine, rows):
+        def setup():
+            reset(engine)
+            BulkInserter(Parent).insert(engine, parent_rows(rows))
+            BulkInserter(Child).insert(engine, child_rows(rows))
+
+        recorder.measure("upsert", rows, lambda: upsert(engine, Child, child_rows(rows, rows // 2)), setup=setup)
+
+    def test_bulk_update(self, recorder, engine, rows):
+        def setup():
+            reset(engine)
+            BulkInserter(Parent).insert(engine, parent_rows(rows))
+            BulkInserter(Child).insert(engine, child_rows(rows))
+
+        def update():
+            changes = ({"id": i, "value": -float(i)} if i % 2 else {"id": i, "label": "even"} for i in range(rows))
+            bulk_update(engine, Child, changes)
+
+        recorder.measure("bulk_update", rows, update, setup=setup)
+
+    def test_session_flush(self, recorder, engine, rows):
+        def setup():
+            reset(engine)
+            BulkInserter(Parent).insert(engine, parent_rows(rows))
+
+        def flush():
+            with Session(engine) as session:
+                session.add_all(Child(id=i, parent_id=p, value=v, label=l) for i, p, v, l in child_rows(rows))
+                session.commit()
+
+        recorder.measure("session_flush", rows, flush, setup=setup)
+
+
+class TestReads:
+    def test_keyset_page(self, recorder, populated, rows):
+        pager = KeysetPager(select(Child.id, Child.value), [Child.id], PAGE_SIZE)
+        cursor = encode_cursor((rows - PAGE_SIZE - 1,))
+        with populated.connect() as connection:
+            recorder.measure("keyset_deep_page", rows, lambda: pager.fetch(connection, cursor))
+
+    def test_offset_page(self, recorder, populated, rows):
+        statement = select(Child.id, Child.value).order_by(Child.id).limit(PAGE_SIZE)
+        with populated.connect() as connection:
+            offset = max(rows - PAGE_SIZE, 0)
+            recorder.measure("offset_deep_page", rows, lambda: connection.execute(statement.offset(offset)).all())
+
+    def test_stream_objects(self, recorder, populated, rows):
+        def stream():
+            with Session(populated) as session:
+                for _ in Child.stream(session, partition_size=PAGE_SIZE):
+                    pass
+
+        recorder.measure("stream_objects", rows, stream)
+
+    def test_stream_rows(self, recorder, populated, rows):
+        def stream():
+            with populated.connect() as connection:
+                for _ in Child.stream_rows(connection, partition_size=PAGE_SIZE):
+                    pass
+
+        recorder.measure("stream_rows", rows, stream)
+
+    def test_stream_records(self, recorder, populated, rows):
+        def stream():
+            with populated.connect() as connection:
+                for _ in Child.stream_records(connection, partition_size=PAGE_SIZE):
+                    pass
+
+        recorder.measure("stream_records", rows, stream)
+
+    @pytest.mark.parametrize("loader", [selectinload, joinedload], ids=["selectinload", "joinedload"])
+    def test_relationship_loading(self, recorder, populated, rows, loader):
+        def load():
+            with Session(populated) as session:
+                session.execute(select(Parent).options(loader(Parent.children))).unique().scalars().all()
+
+        recorder.measure(f"relationship_{loader.__name__}", rows, load)
+
+    def test_relationship_planned(self, recorder, populated, rows):
+        planner = EagerLoadPlanner(resample_interval=0)
+        sessions = sessionmaker(populated)
+        planner.attach(sessions)
+        statement = select(Parent).where(Parent.id < bindparam("limit"))
+
+        def load(limit):
+            with sessions() as session:
+                for parent in session.scalars(statement, {"limit": limit}):
+                    parent.children
+
+        # Learn on a few parents, the plan applies to every execution of the same statement.
+        for _ in range(planner.min_samples):
+            load(10)
+        recorder.measure("relationship_planned", rows, lambda: load(rows))
+        planner.detach(sessions)
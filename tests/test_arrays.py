@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_arrays.py
+Tests of converting query results into NumPy structured arrays and column arrays.
+"""
+# Imports #
+# Standard Libraries #
+import datetime
+from typing import Optional
+
+import numpy as np
+import pytest
+from sqlalchemy import String
+from sqlalchemy import create_engine
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import mapped_column
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.arrays import NumpyFetcher
+from src.sqlalchemyobjects.arrays import dtype_for
+from src.sqlalchemyobjects.arrays import fetch_numpy
+from src.sqlalchemyobjects.arrays import statement_dtype
+
+
+# Definitions #
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Sample(Base):
+    __tablename__ = "sample"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    count: Mapped[Optional[int]]
+    value: Mapped[float]
+    flag: Mapped[bool]
+    code: Mapped[str] = mapped_column(String(2))
+    stamp: Mapped[Optional[datetime.datetime]]
+
+
+# Fixtures #
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Sample),
+            [
+                {"id": i, "count": None if i % 2 else i, "value": i / 2, "flag": bool(i % 2), "code": "abc" * i}
+                for i in range(5)
+            ],
+        )
+    yield engine
+    engine.dispose()
+
+
+# Tests #
+class TestDtypes:
+    def test_dtype_for(self):
+        assert dtype_for(Sample.__table__.c.id) == np.dtype("int64")
+        assert dtype_for(Sample.__table__.c.count) == np.dtype("float64")
+        assert dtype_for(Sample.__table__.c.flag) == np.dtype("bool")
+        assert dtype_for(Sample.__table__.c.stamp) == np.dtype("datetime64[us]")
+        assert dtype_for(Sample.__table__.c.code) == np.dtype("object")
+
+    def test_statement_dtype(self):
+        dtype = statement_dtype(select(Sample.id, Sample.value), {"value": "float32"})
+        assert dtype.names == ("id", "value")
+        assert dtype["value"] == np.dtype("float32")
+
+    def test_unnamed_expressions(self):
+        dtype = statement_dtype(select(func.max(Sample.id), Sample.value + 1, Sample.id.label("key")))
+        assert dtype.names == ("max", "column_1", "key")
+        assert dtype["max"] == np.dtype("float64")
+        assert dtype["key"] == np.dtype("int64")
+
+    def test_labeled_nullable(self):
+        assert statement_dtype(select(Sample.count.label("total")))["total"] == np.dtype("float64")
+
+
+class TestNumpyFetcher:
+    def test_no_init(self):
+        fetcher = NumpyFetcher(5, True, {"id": "int32"}, init=False)
+        assert fetcher.chunk_size == 10000
+        fetcher.construct()
+        assert not fetcher.columnar
+        assert fetcher.dtypes == {}
+
+    def test_construct(self):
+        fetcher = NumpyFetcher(500, True, {"id": "int32"})
+        assert fetcher.chunk_size == 500
+        assert fetcher.columnar
+        assert fetcher.dtypes == {"id": "int32"}
+
+    def test_structured(self, engine):
+        statement = select(Sample.id, Sample.count, Sample.code).order_by(Sample.id)
+        with engine.connect() as connection:
+            array = NumpyFetcher(chunk_size=2).fetch(connection, statement)
+        assert array.shape == (5,)
+        assert array["id"].tolist() == [0, 1, 2, 3, 4]
+        assert np.isnan(array["count"][1])
+        assert array["code"][3] == "abcabcabc"
+
+    def test_columnar(self, engine):
+        with Session(engine) as session:
+            columns = fetch_numpy(session, select(Sample.value, Sample.flag), columnar=True, chunk_size=2, size=5)
+        assert set(columns) == {"value", "flag"}
+        assert columns["value"].tolist() == [0.0, 0.5, 1.0, 1.5, 2.0]
+        assert columns["flag"].dtype == np.dtype("bool")
+
+    def test_aggregates(self, engine):
+        statement = select(func.count(Sample.id), func.max(Sample.count), Sample.value * 2).where(Sample.id > 10)
+        with engine.connect() as connection:
+            array = fetch_numpy(connection, statement)
+        assert array.dtype.names == ("count", "max", "column_2")
+        assert array["count"][0] == 0
+        assert np.isnan(array["max"][0])
+
+    def test_empty(self, engine):
+        with engine.connect() as connection:
+            array = fetch_numpy(connection, select(Sample.id).where(Sample.id < 0), size=3)
+        assert array.shape == (0,)
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_arrowio.py
+Tests of streaming tables between databases and Arrow record batches or Parquet files.
+"""
+# Imports #
+# Standard Libraries #
+import uuid
+from typing import Optional
+
+import pyarrow as pa
+import pytest
+from sqlalchemy import Date
+from sqlalchemy import DateTime
+from sqlalchemy import LargeBinary
+from sqlalchemy import Numeric
+from sqlalchemy import PickleType
+from sqlalchemy import Uuid
+from sqlalchemy import create_engine
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import mapped_column
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.arrowio import ArrowStreamer
+from src.sqlalchemyobjects.arrowio import arrow_type_for
+from src.sqlalchemyobjects.arrowio import as_statement
+from src.sqlalchemyobjects.arrowio import from_arrow
+from src.sqlalchemyobjects.arrowio import import_converter
+from src.sqlalchemyobjects.arrowio import read_parquet
+from src.sqlalchemyobjects.arrowio import statement_schema
+from src.sqlalchemyobjects.arrowio import to_arrow
+from src.sqlalchemyobjects.arrowio import write_parquet
+from src.sqlalchemyobjects.bulk import BulkInserter
+
+
+# Definitions #
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Sample(Base):
+    __tablename__ = "sample"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    value: Mapped[float]
+    label: Mapped[Optional[str]]
+    key: Mapped[Optional[uuid.UUID]] = mapped_column(Uuid)
+
+
+class Copy(Base):
+    __tablename__ = "copy"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    value: Mapped[float]
+    label: Mapped[Optional[str]]
+    key: Mapped[Optional[uuid.UUID]] = mapped_column(Uuid)
+
+
+# Functions #
+def read_copy(engine):
+    with engine.connect() as connection:
+        return connection.execute(select(Copy.id, Copy.value, Copy.label, Copy.key).order_by(Copy.id)).all()
+
+
+# Fixtures #
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(
+            insert(Sample),
+            [
+                {"id": i, "value": i / 2, "label": None if i % 2 else f"s{i}", "key": uuid.UUID(int=i)}
+                for i in range(5)
+            ],
+        )
+    yield engine
+    engine.dispose()
+
+
+# Tests #
+class TestSchema:
+    @pytest.mark.parametrize(
+        ("type_", "expected"),
+        [
+            (DateTime(timezone=True), pa.timestamp("us", tz="UTC")),
+            (DateTime(), pa.timestamp("us")),
+            (Numeric(10, 2), pa.decimal128(10, 2)),
+            (Numeric(asdecimal=False), pa.float64()),
+            (Date(), pa.date32()),
+            (Uuid(), pa.string()),
+            (LargeBinary(), pa.binary()),
+            (PickleType(), pa.string()),
+        ],
+    )
+    def test_arrow_type_for(self, type_, expected):
+        assert arrow_type_for(func.coalesce(None, type_=type_)) == expected
+
+    def test_statement_schema(self):
+        schema = statement_schema(select(Sample.id, Sample.label.label("text"), func.count(Sample.id), Sample.id + 1))
+        assert schema.names == ["id", "text", "count", "column_3"]
+        assert not schema.field("id").nullable
+        assert schema.field("text").nullable
+        assert schema.field("count").type == pa.int64()
+
+    def test_import_converter(self):
+        assert import_converter(Sample.__table__.c.key) is uuid.UUID
+        assert import_converter(Sample.__table__.c.label) is None
+
+    def test_as_statement(self):
+        statement = select(Sample.id)
+        assert as_statement(statement) is statement
+        assert len(as_statement(Sample).selected_columns) == 4
+
+
+class TestArrowStreamer:
+    def test_no_init(self):
+        streamer = ArrowStreamer(10, init=False)
+        assert streamer.batch_size == 65536
+        streamer.construct()
+        assert streamer.batch_size == 65536
+
+    def test_iterate_batches(self, engine):
+        with engine.connect() as connection:
+            batches = list(ArrowStreamer(2).iterate_batches(connection, Sample))
+        assert [b.num_rows for b in batches] == [2, 2, 1]
+        assert batches[0].column(3).to_pylist() == [str(uuid.UUID(int=0)), str(uuid.UUID(int=1))]
+
+    def test_to_arrow(self, engine):
+        with Session(engine) as session:
+            table = to_arrow(session, select(Sample.id, Sample.label).order_by(Sample.id), batch_size=3)
+        assert table.column("label").to_pylist() == ["s0", None, "s2", None, "s4"]
+
+    def test_to_arrow_aggregate(self, engine):
+        with engine.connect() as connection:
+            table = to_arrow(connection, select(func.count(Sample.id), func.max(Sample.value)))
+        assert table.to_pylist() == [{"count": 5, "max": 2.0}]
+
+    def test_round_trip(self, engine):
+        with engine.connect() as connection:
+            table = to_arrow(connection, Sample)
+        report = from_arrow(engine, Copy, table, batch_size=2)
+        assert report.rows == 5
+        assert read_copy(engine)[1] == (1, 0.5, None, uuid.UUID(int=1))
+
+    def test_from_batches(self, engine):
+        with engine.connect() as connection:
+            batches = list(ArrowStreamer(2).iterate_batches(connection, select(Sample.id, Sample.value)))
+        ArrowStreamer().from_arrow(engine, Copy, batches[0])
+        ArrowStreamer().from_arrow(engine, Copy, iter(batches[1:]), BulkInserter(Copy))
+        assert [row[:2] for row in read_copy(engine)] == [(i, i / 2) for i in range(5)]
+
+    def test_from_nothing(self, engine):
+        assert from_arrow(engine, Copy, []).rows == 0
+
+    def test_parquet(self, engine, tmp_path):
+        path = tmp_path / "sample.parquet"
+        with engine.connect() as connection:
+            assert write_parquet(connection, Sample, path, batch_size=2) == 5
+        assert read_parquet(engine, Copy, path, batch_size=2).rows == 5
+        assert read_copy(engine)[4] == (4, 2.0, "s4", uuid.UUID(int=4))
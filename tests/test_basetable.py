@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_basetable.py
+Tests of the class-level query helpers of the base table.
+"""
+# Imports #
+# Standard Libraries #
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import mapped_column
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.tables import BaseTable
+
+
+# Definitions #
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Sample(BaseTable, Base):
+    __tablename__ = "sample"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    value: Mapped[float]
+
+
+class Labeled(BaseTable, Base):
+    __tablename__ = "labeled"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    kind: Mapped[str] = mapped_column("class")
+    _hidden: Mapped[int] = mapped_column(default=0)
+
+
+# Fixtures #
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(Sample), [{"id": i, "value": float(i)} for i in range(10)])
+        connection.execute(insert(Labeled), [{"id": 1, "class": "a"}, {"id": 2, "class": "b"}])
+    yield engine
+    engine.dispose()
+
+
+# Tests #
+class TestStream:
+    def test_partitions(self, engine):
+        with Session(engine) as session:
+            sizes = []
+            for partition in Sample.stream(session, partition_size=4):
+                assert all(item in session for item in partition)
+                sizes.append(len(partition))
+            assert sizes == [4, 4, 2]
+            assert len(session.identity_map) == 0
+
+    def test_expunge_previous_partition(self, engine):
+        with Session(engine) as session:
+            partitions = Sample.stream(session, partition_size=5)
+            first = next(partitions)
+            second = next(partitions)
+            assert not any(item in session for item in first)
+            assert all(item in session for item in second)
+            partitions.close()
+
+    def test_keep(self, engine):
+        with Session(engine) as session:
+            statement = select(Sample).where(Sample.value >= 5.0)
+            partitions = list(Sample.stream(session, statement, partition_size=2, expunge=False))
+            assert [item.id for partition in partitions for item in partition] == [5, 6, 7, 8, 9]
+            assert len(session.identity_map) == 5
+
+    def test_default_partition_size(self, engine):
+        with Session(engine) as session:
+            assert [len(p) for p in Sample.stream(session)] == [10]
+
+
+class TestStreamRows:
+    def test_connection(self, engine):
+        with engine.connect() as connection:
+            partitions = list(Sample.stream_rows(connection, partition_size=6))
+        assert [len(p) for p in partitions] == [6, 4]
+        assert tuple(partitions[0][0]) == (0, 0.0)
+
+    def test_session_statement(self, engine):
+        with Session(engine) as session:
+            statement = select(Sample.value).where(Sample.id < 3)
+            partitions = list(Sample.stream_rows(session, statement))
+            assert [tuple(r) for r in partitions[0]] == [(0.0,), (1.0,), (2.0,)]
+            assert len(session.identity_map) == 0
+
+
+class TestRecords:
+    def test_record_type(self):
+        record_type = Sample.get_record_type()
+        assert record_type is Sample.get_record_type()
+        assert record_type.__name__ == "SampleRecord"
+        assert record_type._fields == ("id", "value")
+        assert Labeled.get_record_type()._fields == ("id", "kind", "_2")
+
+    def test_create_record_statement(self):
+        statement = Labeled.create_record_statement(select(Labeled).where(Labeled.id > 1).order_by(Labeled.id))
+        assert [c.key for c in statement.selected_columns] == ["id", "class", "_hidden"]
+        assert statement.whereclause is not None
+
+    def test_get_records(self, engine):
+        with Session(engine) as session:
+            records = Sample.get_records(session, select(Sample).where(Sample.id < 3).order_by(Sample.id.desc()))
+            assert records == [(2, 2.0), (1, 1.0), (0, 0.0)]
+            assert records[0].value == 2.0
+            assert len(session.identity_map) == 0
+        with engine.connect() as connection:
+            records = Labeled.get_records(connection)
+        assert [(r.id, r.kind, r._2) for r in records] == [(1, "a", 0), (2, "b", 0)]
+
+    def test_stream_records(self, engine):
+        with engine.connect() as connection:
+            partitions = list(Sample.stream_records(connection, partition_size=4))
+        assert [len(p) for p in partitions] == [4, 4, 2]
+        assert partitions[2][1].id == 9
@@ -0,0 +1,96 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_benchmarks.py
+Tests of the standard insert, select, update, and delete benchmark workload.
+"""
+# Imports #
+# Standard Libraries #
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import inspect
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.benchmarks import BenchmarkWorkload
+from src.sqlalchemyobjects.benchmarks import OperationStats
+from src.sqlalchemyobjects.benchmarks import percentiles
+
+
+# Definitions #
+# Fixtures #
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+# Tests #
+class TestPercentiles:
+    def test_samples(self):
+        cuts = percentiles([float(i) for i in range(101)])
+        assert cuts == {"p50": 50.0, "p90": 90.0, "p95": 95.0, "p99": 99.0}
+
+    def test_few_samples(self):
+        assert percentiles([2.0], (50,)) == {"p50": 2.0}
+        assert percentiles([], (50,)) == {"p50": 0.0}
+
+
+class TestOperationStats:
+    def test_summary(self):
+        summary = OperationStats("select", 4, 2.0, [0.5] * 4).summary()
+        assert summary["operation"] == "select"
+        assert summary["throughput"] == 2.0
+        assert summary["p99"] == 0.5
+
+    def test_no_time(self):
+        assert OperationStats("select").throughput == 0.0
+
+
+class TestBenchmarkWorkload:
+    def test_construct(self):
+        workload = BenchmarkWorkload(10, 5, "scratch", 3)
+        assert (workload.rows, workload.operations, workload.seed) == (10, 5, 3)
+        assert workload.get_table().name == "scratch"
+        assert [c.name for c in workload.table.columns] == ["id", "name", "value"]
+
+    def test_no_init(self):
+        workload = BenchmarkWorkload(10, init=False)
+        assert workload.rows == 100000
+        with pytest.raises(ValueError, match="has no scratch table"):
+            workload.get_table()
+        workload.construct()
+        assert workload.get_table().name == "sqlalchemyobjects_bench"
+
+    def test_generate_rows(self):
+        rows = list(BenchmarkWorkload(3).generate_rows())
+        assert [r[:2] for r in rows] == [(0, "name-0"), (1, "name-1"), (2, "name-2")]
+        assert rows == list(BenchmarkWorkload(3).generate_rows())
+
+    def test_time_operations(self):
+        keys = []
+        stats = BenchmarkWorkload(init=False).time_operations("noop", [1, 2, 3], keys.append)
+        assert keys == [1, 2, 3]
+        assert stats.operations == 3
+        assert len(stats.latencies) == 3
+
+    def test_run(self, engine):
+        results = BenchmarkWorkload(200, 20).run(engine)
+        assert [s.name for s in results] == ["insert", "select", "update", "delete"]
+        assert results[0].operations == 200
+        assert all(s.operations == 20 for s in results[1:])
+        assert not inspect(engine).has_table("sqlalchemyobjects_bench")
+
+    def test_run_keep(self, engine):
+        BenchmarkWorkload(10, 50, "kept").run(engine, keep=True)
+        assert inspect(engine).has_table("kept")
+
+    def test_existing_table(self, engine):
+        with engine.begin() as connection:
+            connection.exec_driver_sql("CREATE TABLE users (id INTEGER PRIMARY KEY)")
+            connection.exec_driver_sql("INSERT INTO users (id) VALUES (1)")
+        with pytest.raises(ValueError, match="Table 'users' already exists"):
+            BenchmarkWorkload(10, 5, "users").run(engine)
+        with engine.connect() as connection:
+            assert connection.exec_driver_sql("SELECT id FROM users").all() == [(1,)]
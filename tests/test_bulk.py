@@ -0,0 +1,222 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_bulk.py
+Tests of the bulk writers which use Core executemany in adaptively sized chunks.
+"""
+# Imports #
+# Standard Libraries #
+from typing import Optional
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import select
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import mapped_column
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.bulk import BulkInserter
+from src.sqlalchemyobjects.bulk import BulkReport
+from src.sqlalchemyobjects.bulk import BulkUpdater
+from src.sqlalchemyobjects.bulk import bulk_insert
+from src.sqlalchemyobjects.bulk import bulk_update
+
+
+# Definitions #
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Sample(Base):
+    __tablename__ = "sample"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    value: Mapped[float]
+    label: Mapped[Optional[str]]
+
+
+# Functions #
+def read_all(engine):
+    with engine.connect() as connection:
+        return connection.execute(select(Sample.id, Sample.value, Sample.label).order_by(Sample.id)).all()
+
+
+# Fixtures #
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def filled(engine):
+    bulk_insert(engine, Sample, [(i, float(i), None) for i in range(10)])
+    return engine
+
+
+# Tests #
+class TestBulkReport:
+    def test_rows_per_second(self):
+        assert BulkReport(rows=100, seconds=2.0).rows_per_second == 50.0
+        assert BulkReport(rows=100).rows_per_second == 0.0
+
+
+class TestBulkInserter:
+    def test_construct(self):
+        inserter = BulkInserter(Sample, columns=["id", "value"], max_chunk_size=50, adaptive=False)
+        assert inserter.table is Sample.__table__
+        assert inserter.columns == ("id", "value")
+        assert inserter.max_chunk_size == 50
+        assert not inserter.adaptive
+        assert BulkInserter(Sample).columns == ("id", "value", "label")
+
+    def test_no_init(self):
+        inserter = BulkInserter(Sample, init=False)
+        assert inserter.table is None
+        inserter.construct()
+        assert inserter.table is None
+
+    def test_no_table(self, engine):
+        with pytest.raises(ValueError, match="BulkInserter has no table"):
+            BulkInserter().insert(engine, [(1, 1.0, None)])
+
+    def test_chunk_limit(self, engine):
+        with engine.connect() as connection:
+            assert BulkInserter(Sample).chunk_limit(connection) == 32766 // 3
+            assert BulkInserter(Sample, max_chunk_size=10).chunk_limit(connection) == 10
+            assert BulkInserter(Sample, columns=()).chunk_limit(connection) == 32766
+
+    def test_adapt_chunk_size(self):
+        inserter = BulkInserter(Sample, chunk_size=1000, min_chunk_size=100, target_seconds=1.0)
+        assert inserter.adapt_chunk_size(1000, 0.1, 100000) == 2000
+        assert inserter.adapt_chunk_size(2000, 100.0, 100000) == 1000
+        assert inserter.adapt_chunk_size(1000, 0.001, 1500) == 1500
+        inserter.chunk_size = 150
+        assert inserter.adapt_chunk_size(150, 100.0, 1500) == 100
+        assert inserter.adapt_chunk_size(150, 0.0, 1500) == 100
+
+    def test_not_adaptive(self):
+        inserter = BulkInserter(Sample, chunk_size=500, adaptive=False)
+        assert inserter.adapt_chunk_size(500, 0.0001, 100000) == 500
+
+    def test_iterate_chunks(self):
+        inserter = BulkInserter(Sample, chunk_size=2)
+        rows = iter([(1, 1.0, None), {"id": 2, "value": 2.0, "label": "b"}, (3, 3.0, "c")])
+        chunks = list(inserter.iterate_chunks(rows, 10))
+        assert chunks == [
+            [{"id": 1, "value": 1.0, "label": None}, {"id": 2, "value": 2.0, "label": "b"}],
+            [{"id": 3, "value": 3.0, "label": "c"}],
+        ]
+
+    def test_insert_engine(self, engine):
+        inserter = BulkInserter(Sample, chunk_size=100, min_chunk_size=10)
+        report = inserter.insert(engine, ((i, float(i), None) for i in range(1050)))
+        assert report.rows == 1050
+        assert report.chunks >= 2
+        assert inserter.report.rows == 1050
+        assert len(read_all(engine)) == 1050
+
+    def test_insert_connection_transaction(self, engine):
+        with engine.connect() as connection:
+            BulkInserter(Sample).insert(connection, [(1, 1.0, "a")])
+            connection.rollback()
+        assert read_all(engine) == []
+
+    def test_insert_session(self, engine):
+        with Session(engine) as session:
+            BulkInserter(Sample).insert(session, [{"id": 1, "value": 1.0, "label": "a"}])
+            assert session.get(Sample, 1).label == "a"
+            session.commit()
+        assert read_all(engine) == [(1, 1.0, "a")]
+
+    def test_insert_mixed_columns(self, engine):
+        rows = [{"id": 1, "value": 1.0}, {"id": 2, "value": 2.0, "label": "b"}, {"id": 3, "value": 3.0}]
+        report = BulkInserter(Sample).insert(engine, rows)
+        assert (report.rows, report.chunks) == (3, 1)
+        assert read_all(engine) == [(1, 1.0, None), (2, 2.0, "b"), (3, 3.0, None)]
+
+    def test_report_accumulates(self, engine):
+        inserter = BulkInserter(Sample)
+        inserter.insert(engine, [(1, 1.0, None)])
+        inserter.insert(engine, [(2, 2.0, None), (3, 3.0, None)])
+        assert inserter.report.rows == 3
+        assert inserter.report.chunks == 2
+
+    def test_bulk_insert(self, engine):
+        report = bulk_insert(engine, Sample.__table__, [(1, 1.0, None), (2, 2.0, "b")], chunk_size=1)
+        assert report.chunks == 2
+        assert read_all(engine) == [(1, 1.0, None), (2, 2.0, "b")]
+
+
+class TestBulkUpdater:
+    def test_construct(self):
+        updater = BulkUpdater(Sample, chunk_size=10)
+        assert updater.keys == ("id",)
+        assert updater.chunk_size == 10
+        updater = BulkUpdater(Sample, init=False)
+        assert updater.keys == ()
+        updater.construct()
+        assert updater.keys == ()
+
+    def test_no_table(self, engine):
+        with pytest.raises(ValueError, match="BulkUpdater has no table"):
+            BulkUpdater().update(engine, [{"id": 1, "value": 1.0}])
+
+    def test_chunk_limit(self, engine):
+        with engine.connect() as connection:
+            assert BulkUpdater(Sample).chunk_limit(connection) > 32766
+            assert BulkUpdater(Sample, max_chunk_size=10).chunk_limit(connection) == 10
+
+    def test_create_update(self):
+        statement = str(BulkUpdater(Sample).create_update(["value"]))
+        assert statement == "UPDATE sample SET value=:value WHERE sample.id = :_key_id"
+
+    def test_update_engine(self, filled):
+        rows = [{"id": i, "value": -float(i)} for i in range(4)]
+        rows += [{"id": 5, "label": "e"}, {"id": 6, "value": 0.5, "label": "f"}, {"id": 7}]
+        report = BulkUpdater(Sample, chunk_size=2, min_chunk_size=1, adaptive=False).update(filled, rows)
+        assert report.rows == 6
+        assert report.chunks == 4
+        assert read_all(filled)[:8] == [
+            (0, 0.0, None),
+            (1, -1.0, None),
+            (2, -2.0, None),
+            (3, -3.0, None),
+            (4, 4.0, None),
+            (5, 5.0, "e"),
+            (6, 0.5, "f"),
+            (7, 7.0, None),
+        ]
+
+    def test_update_order(self, filled):
+        rows = [{"id": 1, "value": 5.0}, {"id": 1, "value": 6.0, "label": "a"}, {"id": 2, "value": 0.0, "label": "b"}]
+        rows += [{"id": 3, "label": "c"}, {"id": 4, "value": 0.0}, {"id": 3, "label": "d"}, {"id": 3, "value": 0.0}]
+        report = BulkUpdater(Sample, chunk_size=2, min_chunk_size=1, adaptive=False).update(filled, rows)
+        assert report.rows == 7
+        assert read_all(filled)[1:5] == [(1, 6.0, "a"), (2, 0.0, "b"), (3, 0.0, "d"), (4, 0.0, None)]
+
+    def test_missing_key(self, filled):
+        with pytest.raises(ValueError, match="Updates to sample need values for the primary key"):
+            BulkUpdater(Sample).update(filled, [{"value": 1.0}])
+
+    def test_update_session(self, filled):
+        updater = BulkUpdater(Sample)
+        with Session(filled) as session:
+            updater.update(session, [{"id": 1, "label": "a"}])
+            session.rollback()
+        with filled.connect() as connection:
+            updater.update(connection, [{"id": 2, "label": "b"}])
+            connection.commit()
+        assert [r.label for r in read_all(filled)[1:3]] == [None, "b"]
+        assert updater.report.rows == 2
+
+    def test_bulk_update(self, filled):
+        report = bulk_update(filled, Sample.__table__, [{"id": 9, "value": 90.0}])
+        assert report.rows == 1
+        assert read_all(filled)[9] == (9, 90.0, None)
@@ -0,0 +1,94 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_compiledcachemonitor.py
+Tests of tracking the compiled statement cache hit ratio of an engine over time.
+"""
+# Imports #
+# Standard Libraries #
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import literal_column
+from sqlalchemy import select
+from sqlalchemy import text
+from sqlalchemy.engine.interfaces import CacheStats
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.cache import CacheSample
+from src.sqlalchemyobjects.cache import CompiledCacheMonitor
+
+
+# Fixtures #
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    yield engine
+    engine.dispose()
+
+
+# Tests #
+class TestCacheSample:
+    def test_hit_ratio(self):
+        assert CacheSample(hits=3, misses=1).hit_ratio == 0.75
+        assert CacheSample().hit_ratio == 0.0
+
+
+class TestCompiledCacheMonitor:
+    def test_construct(self, engine):
+        monitor = CompiledCacheMonitor(engine, window=5.0, max_samples=3)
+        assert (monitor.engine, monitor.window, monitor.samples.maxlen) == (engine, 5.0, 3)
+        other = create_engine("sqlite://")
+        monitor.attach(other)
+        assert monitor.engine is other
+        monitor.detach()
+        monitor.detach()
+        assert monitor.engine is None
+
+    def test_no_init(self):
+        monitor = CompiledCacheMonitor(init=False)
+        monitor.construct()
+        assert (monitor.engine, monitor.window, monitor.cache_size) == (None, 60.0, 0)
+
+    def test_counts(self, engine):
+        monitor = CompiledCacheMonitor(engine)
+        statement = select(literal_column("1"))
+        with engine.connect() as connection:
+            connection.execute(statement)
+            connection.execute(statement)
+            connection.execute(text("SELECT 1"))
+            monitor.after_execute(connection, "SELECT 1", (), {}, {}, None)
+        assert (monitor.total.hits, monitor.total.misses, monitor.total.uncached) == (1, 2, 0)
+        assert monitor.hit_ratio == 1 / 3
+        assert monitor.cache_size == 2
+        monitor.detach()
+
+    def test_record(self):
+        monitor = CompiledCacheMonitor()
+        for cache_hit in (CacheStats.CACHE_HIT, CacheStats.CACHE_MISS, CacheStats.CACHING_DISABLED):
+            monitor.record(cache_hit)
+        assert (monitor.current.hits, monitor.current.misses, monitor.current.uncached) == (1, 1, 1)
+
+    def test_windows(self):
+        monitor = CompiledCacheMonitor(window=10.0, max_samples=2)
+        start = monitor.current.start
+        monitor.roll(start + 5.0)
+        assert len(monitor.samples) == 0
+        for offset in (10.0, 20.0, 30.0):
+            monitor.roll(start + offset)
+        assert [s.start for s in monitor.samples] == [start + 10.0, start + 20.0]
+        assert monitor.samples[0].seconds == 10.0
+
+    def test_report(self, engine):
+        monitor = CompiledCacheMonitor(engine, window=0.0)
+        with engine.connect() as connection:
+            connection.execute(select(literal_column("1")))
+        report = monitor.report()
+        assert json.loads(json.dumps(report)) == report
+        assert report["misses"] == 1
+        assert all("hit_ratio" in s for s in report["samples"])
+        monitor.reset()
+        assert (monitor.total.misses, len(monitor.samples)) == (0, 0)
+        monitor.detach()
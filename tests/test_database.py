@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_database.py
+Tests of the databases which pair a shared engine with a session factory.
+"""
+# Imports #
+# Standard Libraries #
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import create_async_engine
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.databases import AsyncDatabase
+from src.sqlalchemyobjects.databases import Database
+from src.sqlalchemyobjects.engines import EngineRegistry
+
+
+# Definitions #
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Sample(Base):
+    __tablename__ = "sample"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    value: Mapped[float]
+
+
+# Functions #
+async def collect(iterator):
+    return [item async for item in iterator]
+
+
+async def generate_rows(count):
+    for i in range(count):
+        yield {"id": i, "value": float(i)}
+
+
+# Fixtures #
+@pytest.fixture
+def database():
+    engine = create_engine("sqlite://")
+    database = Database(engine=engine)
+    database.create_all(Base.metadata)
+    yield database
+    engine.dispose()
+
+
+@pytest.fixture
+def async_database(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'async.db'}")
+    database = AsyncDatabase(engine=engine)
+    asyncio.run(database.create_all(Base.metadata))
+    yield database
+    asyncio.run(engine.dispose())
+
+
+# Tests #
+class TestDatabase:
+    def test_registry(self, tmp_path):
+        registry = EngineRegistry()
+        database = Database(f"sqlite:///{tmp_path / 'shared.db'}", "sqlite-wal-readheavy", registry=registry)
+        assert database.get_engine() is registry.get_engine(f"sqlite:///{tmp_path / 'shared.db'}", "sqlite-wal-readheavy")
+        assert database.session_factory.kw["bind"] is database.engine
+        registry.dispose()
+
+    def test_no_engine(self):
+        database = Database(autoflush=False)
+        assert database.session_factory.kw["autoflush"] is False
+        with pytest.raises(ValueError, match="Database has no engine"):
+            database.get_engine()
+
+    def test_no_init(self):
+        database = Database("sqlite://", init=False)
+        assert database.engine is None
+        database.construct()
+        assert database.engine is None
+
+    def test_session(self, database):
+        with database.session() as session:
+            session.add(Sample(id=1, value=1.0))
+        with pytest.raises(RuntimeError):
+            with database.session() as session:
+                session.add(Sample(id=2, value=2.0))
+                session.flush()
+                raise RuntimeError()
+        with database.session() as session:
+            assert session.scalars(select(Sample.id)).all() == [1]
+
+    def test_bulk_insert(self, database):
+        report = database.bulk_insert(Sample, ((i, float(i)) for i in range(25)), chunk_size=10)
+        assert report.rows == 25
+        with database.session() as session:
+            assert session.scalar(select(Sample.value).where(Sample.id == 24)) == 24.0
+
+    def test_stream(self, database):
+        database.bulk_insert(Sample, [(i, float(i)) for i in range(5)])
+        partitions = list(database.stream(select(Sample).order_by(Sample.id), partition_size=2))
+        assert [[s.id for s in p] for p in partitions] == [[0, 1], [2, 3], [4]]
+        rows = list(database.stream(select(Sample.id, Sample.value), scalars=False))
+        assert [tuple(r) for r in rows[0]] == [(i, float(i)) for i in range(5)]
+
+
+class TestAsyncDatabase:
+    def test_registry(self, tmp_path):
+        registry = EngineRegistry()
+        url = f"sqlite+aiosqlite:///{tmp_path / 'shared.db'}"
+        database = AsyncDatabase(url, registry=registry, expire_on_commit=True)
+        assert database.get_engine() is registry.get_async_engine(url)
+        assert database.session_factory.kw["expire_on_commit"] is True
+        asyncio.run(database.get_engine().dispose())
+
+    def test_no_engine(self):
+        with pytest.raises(ValueError, match="AsyncDatabase has no engine"):
+            AsyncDatabase().get_engine()
+
+    def test_no_init(self):
+        database = AsyncDatabase("sqlite+aiosqlite://", init=False)
+        database.construct()
+        assert database.engine is None
+
+    def test_session(self, async_database):
+        async def run():
+            async with async_database.session() as session:
+                session.add(Sample(id=1, value=1.0))
+            with pytest.raises(RuntimeError):
+                async with async_database.session() as session:
+                    session.add(Sample(id=2, value=2.0))
+                    await session.flush()
+                    raise RuntimeError()
+            async with async_database.session() as session:
+                return (await session.scalars(select(Sample.id))).all()
+
+        assert asyncio.run(run()) == [1]
+
+    def test_bulk_insert(self, async_database):
+        report = asyncio.run(async_database.bulk_insert(Sample, [(i, float(i)) for i in range(5)]))
+        assert report.rows == 5
+
+    def test_bulk_insert_async_rows(self, async_database):
+        report = asyncio.run(async_database.bulk_insert(Sample, generate_rows(25), chunk_size=10))
+        assert report.rows == 25
+        report = asyncio.run(async_database.bulk_insert(Sample, generate_rows(0)))
+        assert report.rows == 0
+
+    def test_stream(self, async_database):
+        asyncio.run(async_database.bulk_insert(Sample, [(i, float(i)) for i in range(5)]))
+        statement = select(Sample).order_by(Sample.id)
+        partitions = asyncio.run(collect(async_database.stream(statement, partition_size=2)))
+        assert [[s.id for s in p] for p in partitions] == [[0, 1], [2, 3], [4]]
+        rows = asyncio.run(collect(async_database.stream(select(Sample.id), scalars=False)))
+        assert [tuple(r) for r in rows[0]] == [(i,) for i in range(5)]
@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_eagerloadplanner.py
+Tests of learning which relationships are accessed after each query and eager loading them.
+"""
+# Imports #
+# Standard Libraries #
+import json
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import ForeignKey
+from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlalchemy import text
+from sqlalchemy import update
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm.interfaces import UserDefinedOption
+from sqlalchemy.sql.elements import ColumnClause
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.databases import Database
+from src.sqlalchemyobjects.databases import EagerLoadPlanner
+from src.sqlalchemyobjects.databases.eagerloadplanner import QuerySite
+from src.sqlalchemyobjects.databases.eagerloadplanner import SampleOption
+
+
+# Definitions #
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Parent(Base):
+    __tablename__ = "parent"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    children: Mapped[list["Child"]] = relationship(back_populates="parent")
+
+
+class Child(Base):
+    __tablename__ = "child"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    parent_id: Mapped[int] = mapped_column(ForeignKey("parent.id"))
+    parent: Mapped[Parent] = relationship(back_populates="children")
+    toys: Mapped[list["Toy"]] = relationship()
+
+
+class Toy(Base):
+    __tablename__ = "toy"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    child_id: Mapped[int] = mapped_column(ForeignKey("child.id"))
+
+
+class Uncached(ColumnClause):
+    inherit_cache = False
+
+
+class Marker(UserDefinedOption):
+    propagate_to_loaders = True
+
+
+class StatementCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self.before_cursor_execute)
+
+    def before_cursor_execute(self, *args):
+        self.count += 1
+
+
+# Functions #
+def load_children(session):
+    return [len(p.children) for p in session.scalars(select(Parent).order_by(Parent.id))]
+
+
+def load_toys(session):
+    return [sum(len(c.toys) for c in p.children) for p in session.scalars(select(Parent).order_by(Parent.id))]
+
+
+# Fixtures #
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(Parent), [{"id": i} for i in range(5)])
+        connection.execute(insert(Child), [{"id": i, "parent_id": i % 5} for i in range(10)])
+        connection.execute(insert(Toy), [{"id": i, "child_id": i % 10} for i in range(20)])
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def factory(engine):
+    return sessionmaker(engine)
+
+
+@pytest.fixture
+def counter(engine):
+    return StatementCounter(engine)
+
+
+# Tests #
+class TestQuerySite:
+    def test_frequencies(self):
+        site = QuerySite("query")
+        site.samples.extend([{("a",)}, {("a",), ("b",)}])
+        assert site.get_frequencies() == {("a",): 1.0, ("b",): 0.5}
+
+
+class TestEagerLoadPlanner:
+    def test_construct(self):
+        planner = EagerLoadPlanner(5, 2, 0.25, 10, 50)
+        assert (planner.window, planner.min_samples, planner.ratio) == (5, 2, 0.25)
+        assert (planner.resample_interval, planner.max_sites) == (10, 50)
+        planner = EagerLoadPlanner(init=False)
+        planner.construct()
+        assert (planner.window, planner.min_samples, planner.ratio, planner.max_sites) == (20, 3, 0.5, 1000)
+
+    def test_describe(self):
+        path = (Parent.children.property, Child.toys.property)
+        assert EagerLoadPlanner.describe_path(path) == "Parent.children.toys"
+        assert EagerLoadPlanner.describe_option((Child.parent.property,)) == "joinedload(Child.parent)"
+        assert EagerLoadPlanner.describe_option(path) == "selectinload(Parent.children).selectinload(Child.toys)"
+        option = EagerLoadPlanner.create_option((Child.parent.property, Parent.children.property))
+        assert option.path.natural_path == selectinload(Child.parent).selectinload(Parent.children).path.natural_path
+
+    def test_learn(self, factory, counter):
+        planner = EagerLoadPlanner(min_samples=2)
+        planner.attach(factory)
+        with factory() as session:
+            for _ in range(2):
+                counter.count = 0
+                assert load_children(session) == [2] * 5
+                assert counter.count == 6
+                session.expunge_all()
+            counter.count = 0
+            assert load_children(session) == [2] * 5
+            assert counter.count == 2
+        site = next(iter(planner.sites.values()))
+        assert (site.executions, len(site.samples), site.plan) == (3, 2, ((Parent.children.property,),))
+        planner.detach(factory)
+
+    def test_nested_paths(self, factory, counter):
+        planner = EagerLoadPlanner(min_samples=1)
+        planner.attach(factory)
+        with factory() as session:
+            assert load_toys(session) == [4] * 5
+            session.expunge_all()
+            counter.count = 0
+            assert load_toys(session) == [4] * 5
+            assert counter.count == 3
+        report = planner.report()
+        assert report[0]["accesses"] == {"Parent.children": 1.0, "Parent.children.toys": 1.0}
+        nested = "selectinload(Parent.children).selectinload(Child.toys)"
+        assert report[0]["plan"] == ["selectinload(Parent.children)", nested]
+        planner.detach(factory)
+
+    def test_ratio(self, factory):
+        planner = EagerLoadPlanner(window=3, min_samples=3, ratio=0.5)
+        planner.attach(factory)
+        with factory() as session:
+            for access in (True, False, False, False):
+                parents = session.scalars(select(Parent).order_by(Parent.id)).all()
+                if access:
+                    [p.children for p in parents]
+                session.expunge_all()
+        site = next(iter(planner.sites.values()))
+        assert (len(site.samples), site.plan) == (3, ())
+        assert site.get_frequencies() == {}
+        planner.detach(factory)
+
+    def test_resample(self, factory, counter):
+        planner = EagerLoadPlanner(min_samples=1, resample_interval=3)
+        planner.attach(factory)
+        with factory() as session:
+            counts = []
+            for _ in range(4):
+                counter.count = 0
+                load_children(session)
+                counts.append(counter.count)
+                session.expunge_all()
+        assert counts == [6, 2, 6, 2]
+        site = next(iter(planner.sites.values()))
+        assert len(site.samples) == 2
+        planner.detach(factory)
+
+    def test_explicit_options(self, factory, counter):
+        planner = EagerLoadPlanner(min_samples=1)
+        planner.attach(factory)
+        with factory() as session:
+            statement = select(Parent).options(selectinload(Parent.children)).order_by(Parent.id)
+            for _ in range(2):
+                counter.count = 0
+                assert [sum(len(c.toys) for c in p.children) for p in session.scalars(statement)] == [4] * 5
+                assert counter.count == 12
+                session.expunge_all()
+        site = next(iter(planner.sites.values()))
+        assert (len(site.samples), site.plan) == (2, ((Parent.children.property, Child.toys.property),))
+        planner.detach(factory)
+
+    def test_ignored(self, factory):
+        planner = EagerLoadPlanner(max_sites=1)
+        planner.attach(factory)
+        with factory() as session:
+            session.execute(update(Parent).where(Parent.id == 0).values(id=0))
+            session.execute(text("SELECT 1"))
+            session.get(Child, 1).parent
+            assert len(planner.sites) == 1
+            session.scalars(select(Parent.id, Uncached("1"))).all()
+            load_children(session)
+            site = next(iter(planner.sites.values()))
+            session.scalars(select(Parent).options(SampleOption((site, set())))).all()
+        assert len(planner.sites) == 1
+        planner.record(SimpleNamespace(loader_strategy_path=None, user_defined_options=[]))
+        planner.detach(factory)
+
+    def test_other_options(self, factory):
+        planner = EagerLoadPlanner(min_samples=1)
+        planner.attach(factory)
+        with factory() as session:
+            statement = select(Parent).options(Marker("mine")).order_by(Parent.id)
+            assert [len(p.children) for p in session.scalars(statement)] == [2] * 5
+            session.expunge_all()
+            assert [len(c.toys) for p in session.scalars(statement) for c in p.children] == [2] * 10
+        site = next(iter(planner.sites.values()))
+        assert (len(site.samples), site.plan) == (1, ((Parent.children.property,),))
+        planner.detach(factory)
+
+    def test_report(self, factory):
+        planner = EagerLoadPlanner(min_samples=1)
+        planner.attach(factory)
+        with factory() as session:
+            load_children(session)
+            session.scalars(select(Child)).all()
+            session.scalars(select(Child)).all()
+        report = planner.report()
+        assert json.loads(json.dumps(report)) == report
+        assert [r["executions"] for r in report] == [2, 1]
+        assert (report[1]["accesses"], report[1]["plan"]) == ({"Parent.children": 1.0}, [])
+        planner.reset()
+        assert planner.report() == []
+        planner.detach(factory)
+
+
+class TestDatabasePlanner:
+    def test_planner(self, engine, counter):
+        first = EagerLoadPlanner(min_samples=1)
+        database = Database(engine=engine, planner=first)
+        second = EagerLoadPlanner(min_samples=1)
+        database.construct(planner=second)
+        assert database.planner is second
+        with database.session() as session:
+            load_children(session)
+            session.expunge_all()
+            counter.count = 0
+            load_children(session)
+            assert counter.count == 2
+        assert (len(first.sites), len(second.sites)) == (0, 1)
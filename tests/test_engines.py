@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_engines.py
+Tests of the engine profiles, template, and registry.
+"""
+# Imports #
+# Standard Libraries #
+import asyncio
+import threading
+import time
+from typing import ClassVar
+
+import pytest
+from sqlalchemy import make_url
+from sqlalchemy import text
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import StaticPool
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.engines import EngineProfile
+from src.sqlalchemyobjects.engines import EngineRegistry
+from src.sqlalchemyobjects.engines import EngineTemplate
+from src.sqlalchemyobjects.engines import default_registry
+from src.sqlalchemyobjects.engines import get_async_engine
+from src.sqlalchemyobjects.engines import get_engine
+from src.sqlalchemyobjects.engines.engineprofile import DEFAULT_PROFILES
+
+
+# Definitions #
+# Classes #
+class IsolatedTemplate(EngineTemplate):
+    profiles: ClassVar[dict[str, EngineProfile]] = DEFAULT_PROFILES.copy()
+
+
+# Fixtures #
+@pytest.fixture
+def url(tmp_path):
+    return f"sqlite:///{tmp_path / 'engines.db'}"
+
+
+@pytest.fixture
+def registry():
+    registry = EngineRegistry(IsolatedTemplate)
+    yield registry
+    registry.dispose()
+
+
+# Tests #
+class TestEngineProfile:
+    def test_evolve(self):
+        profile = EngineProfile("base", pool_size=3)
+        evolved = profile.evolve(pool_size=7)
+        assert evolved.name == "base"
+        assert evolved.pool_size == 7
+        assert profile.pool_size == 3
+
+    def test_create_key(self):
+        first = EngineProfile("base", connect_args={"a": 1, "b": 2})
+        second = EngineProfile("base", connect_args={"b": 2, "a": 1})
+        assert first.create_key() == second.create_key()
+        assert first.create_key() != first.evolve(pool_size=1).create_key()
+        hash(first.create_key())
+
+
+class TestEngineTemplate:
+    def test_get_profile(self):
+        assert IsolatedTemplate.get_profile(None).name == IsolatedTemplate.default_profile
+        assert IsolatedTemplate.get_profile("sqlite-bulk-load").name == "sqlite-bulk-load"
+        profile = EngineProfile("custom")
+        assert IsolatedTemplate.get_profile(profile) is profile
+
+    def test_unknown_profile(self):
+        with pytest.raises(ValueError, match="Unknown engine profile"):
+            IsolatedTemplate.get_profile("missing")
+
+    def test_register_profile(self):
+        profile = IsolatedTemplate.register_profile(EngineProfile("registered", pool_size=2))
+        assert IsolatedTemplate.get_profile("registered") is profile
+        assert "registered" not in EngineTemplate.profiles
+
+    def test_is_memory_sqlite(self):
+        assert EngineTemplate.is_memory_sqlite(make_url("sqlite://"))
+        assert EngineTemplate.is_memory_sqlite(make_url("sqlite:///:memory:"))
+        assert not EngineTemplate.is_memory_sqlite(make_url("sqlite:///file.db"))
+        assert not EngineTemplate.is_memory_sqlite(make_url("postgresql://localhost/db"))
+
+    def test_no_init(self):
+        template = IsolatedTemplate("sqlite-bulk-load", init=False)
+        assert template.profile.name == IsolatedTemplate.default_profile
+
+    def test_overrides(self):
+        template = IsolatedTemplate("sqlite-bulk-load", pool_size=4)
+        assert template.profile.name == "sqlite-bulk-load"
+        assert template.profile.pool_size == 4
+
+    def test_engine_kwargs(self, url):
+        template = IsolatedTemplate("sqlite-wal-readheavy")
+        kwargs = template.create_engine_kwargs(make_url(url))
+        assert kwargs["poolclass"] is QueuePool
+        assert kwargs["pool_size"] == template.profile.pool_size
+        assert kwargs["connect_args"] == {"check_same_thread": False}
+
+    def test_memory_engine_kwargs(self):
+        kwargs = IsolatedTemplate("sqlite-wal-readheavy").create_engine_kwargs(make_url("sqlite://"))
+        assert "poolclass" not in kwargs
+
+    def test_non_sqlite_connect_args(self):
+        template = IsolatedTemplate(EngineProfile("remote", connect_args={"check_same_thread": False, "timeout": 5}))
+        kwargs = template.create_engine_kwargs(make_url("postgresql://localhost/db"))
+        assert kwargs["connect_args"] == {"timeout": 5}
+
+    def test_engine_kwargs_override(self, url):
+        template = IsolatedTemplate(EngineProfile("echo", engine_kwargs={"echo": True}))
+        assert template.create_engine_kwargs(make_url(url))["echo"] is True
+
+    def test_build(self, url):
+        calls = []
+        profile = EngineProfile(
+            "hooked",
+            pragmas={"journal_mode": "wal"},
+            connect_hooks=(lambda dbapi_connection, record: calls.append(dbapi_connection),),
+        )
+        engine = IsolatedTemplate(profile).build(url)
+        try:
+            with engine.connect() as connection:
+                assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert len(calls) == 1
+        finally:
+            engine.dispose()
+
+    def test_build_kwargs_take_precedence(self):
+        engine = IsolatedTemplate().build("sqlite://", poolclass=StaticPool)
+        assert isinstance(engine.pool, StaticPool)
+        engine.dispose()
+
+    def test_build_async(self, url):
+        engine = IsolatedTemplate("sqlite-wal-readheavy").build_async(url.replace("sqlite", "sqlite+aiosqlite"))
+
+        async def query():
+            async with engine.connect() as connection:
+                value = (await connection.execute(text("PRAGMA journal_mode"))).scalar()
+            await engine.dispose()
+            return value
+
+        assert isinstance(engine.pool, AsyncAdaptedQueuePool)
+        assert asyncio.run(query()) == "wal"
+
+    def test_build_async_pool(self):
+        engine = IsolatedTemplate(EngineProfile("static", poolclass=StaticPool)).build_async("sqlite+aiosqlite://")
+        assert isinstance(engine.pool, StaticPool)
+        asyncio.run(engine.dispose())
+
+
+class TestEngineRegistry:
+    def test_default_template(self):
+        assert EngineRegistry().template_type is EngineTemplate
+        assert EngineRegistry(IsolatedTemplate, init=False).template_type is EngineTemplate
+
+    @pytest.mark.parametrize("method", ["get_engine", "get_async_engine"])
+    def test_concurrent_creation(self, registry, method):
+        # A thread which waits on the lock must reuse the engine the lock holder created.
+        url = "sqlite+aiosqlite://" if method == "get_async_engine" else "sqlite://"
+        results = []
+        with registry._lock:
+            thread = threading.Thread(target=lambda: results.append(getattr(registry, method)(url)))
+            thread.start()
+            time.sleep(0.05)
+            engine = getattr(registry, method)(url)
+        thread.join()
+        assert results == [engine]
+        asyncio.run(registry.dispose_async())
+
+    def test_reuse(self, registry, url):
+        engine = registry.get_engine(url, "sqlite-wal-readheavy")
+        assert registry.get_engine(url, "sqlite-wal-readheavy") is engine
+        assert registry.get_engine(url, "sqlite-bulk-load") is not engine
+        assert url in registry
+        assert "sqlite:///other.db" not in registry
+        assert len(registry) == 2
+
+    def test_evolved_profile(self, registry, url):
+        profile = IsolatedTemplate.get_profile("sqlite-wal-readheavy")
+        engine = registry.get_engine(url, profile)
+        evolved = registry.get_engine(url, profile.evolve(pool_size=1))
+        assert evolved is not engine
+        assert evolved.pool.size() == 1
+        assert registry.get_engine(url, profile.evolve(pool_size=1)) is evolved
+
+    def test_overrides(self, registry, url):
+        engine = registry.get_engine(url, "sqlite-wal-readheavy", pool_size=2)
+        assert engine is not registry.get_engine(url, "sqlite-wal-readheavy")
+        assert engine is registry.get_engine(url, "sqlite-wal-readheavy", pool_size=2)
+        assert engine is registry.get_engine(
+            url, IsolatedTemplate.get_profile("sqlite-wal-readheavy").evolve(pool_size=2)
+        )
+
+    def test_dispose(self, registry, url, tmp_path):
+        other = f"sqlite:///{tmp_path / 'other.db'}"
+        registry.get_engine(url, "sqlite-wal-readheavy")
+        registry.get_engine(url, "sqlite-bulk-load")
+        registry.get_engine(other, "sqlite-bulk-load")
+        registry.dispose(url, "sqlite-bulk-load")
+        assert len(registry) == 2
+        registry.dispose(url)
+        assert url not in registry
+        assert other in registry
+        registry.dispose(profile="sqlite-bulk-load")
+        assert len(registry) == 0
+
+    def test_async_engines(self, registry, url):
+        url = url.replace("sqlite", "sqlite+aiosqlite")
+        engine = registry.get_async_engine(url, "sqlite-wal-readheavy")
+        assert registry.get_async_engine(url, "sqlite-wal-readheavy") is engine
+        asyncio.run(registry.dispose_async(url, "sqlite-bulk-load"))
+        assert registry.async_engines
+        asyncio.run(registry.dispose_async(url))
+        assert not registry.async_engines
+
+    def test_default_registry(self, url):
+        try:
+            assert get_engine(url) is default_registry.get_engine(url)
+            async_url = url.replace("sqlite", "sqlite+aiosqlite")
+            assert get_async_engine(async_url) is default_registry.get_async_engine(async_url)
+        finally:
+            default_registry.dispose(url)
+            asyncio.run(default_registry.dispose_async())
@@ -0,0 +1,189 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_fulltexttable.py
+Tests of the full-text table template and its trigger-maintained FTS5 index.
+"""
+# Imports #
+# Standard Libraries #
+import pytest
+from sqlalchemy import Integer
+from sqlalchemy import Text
+from sqlalchemy import create_engine
+from sqlalchemy import create_mock_engine
+from sqlalchemy import delete
+from sqlalchemy import insert
+from sqlalchemy import inspect
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import mapped_column
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.tables import FullTextTable
+from src.sqlalchemyobjects.tables.fulltexttable import quote_terms
+
+
+# Definitions #
+NOTES = [
+    {"id": 1, "title": "Running", "body": "The runner runs every morning."},
+    {"id": 2, "title": "Cooking", "body": "Boil the water, then add the pasta."},
+    {"id": 3, "title": "Running shoes", "body": "Shoes for running long distances on roads."},
+]
+
+
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Note(FullTextTable, Base):
+    __tablename__ = "note"
+    fts_columns = ("title", "body")
+    fts_tokenizer = "porter unicode61"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str]
+    body: Mapped[str]
+
+
+class Weighted(FullTextTable, Base):
+    __tablename__ = "weighted"
+    fts_columns = ("title", "body")
+    fts_weights = (10.0, 1.0)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str]
+    body: Mapped[str]
+
+
+class Unindexed(FullTextTable, Base):
+    __tablename__ = "unindexed"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+LegacyBase = declarative_base()
+
+
+class LegacyNote(FullTextTable, LegacyBase):
+    __tablename__ = "legacy_note"
+    fts_columns = ("body",)
+
+    id = mapped_column(Integer, primary_key=True)
+    body = mapped_column(Text)
+
+
+# Functions #
+def ids(notes):
+    return [n.id for n in notes]
+
+
+# Fixtures #
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(Note), NOTES)
+        connection.execute(insert(Weighted), NOTES)
+    yield engine
+    engine.dispose()
+
+
+# Tests #
+class TestQuoteTerms:
+    def test_quote(self):
+        assert quote_terms('say "hi"  there') == '"say" """hi""" "there"'
+        assert quote_terms("") == ""
+
+
+class TestFullTextTable:
+    def test_fts_table(self):
+        assert Note.get_fts_table().name == "note_fts"
+        assert list(Note.get_fts_table().c.keys()) == ["rowid", "note_fts", "rank", "title", "body"]
+        assert Unindexed.fts_table is None
+        with pytest.raises(ValueError, match="Unindexed has no FTS5 table"):
+            Unindexed.get_fts_table()
+
+    def test_ddl(self):
+        ddl = Note.create_fts_ddl()
+        assert "content='note', content_rowid='id', tokenize='porter unicode61'" in ddl[0]
+        assert "tokenize" not in Weighted.create_fts_ddl()[0]
+        assert len(ddl) == 4
+
+    def test_schema(self, engine):
+        names = inspect(engine).get_table_names()
+        assert {"note_fts", "weighted_fts"} <= set(names)
+
+    def test_uses_fts(self, engine):
+        with Session(engine) as session:
+            assert Note.uses_fts(session)
+            assert not Unindexed.uses_fts(session)
+        with engine.connect() as connection:
+            assert Weighted.uses_fts(connection)
+
+    def test_search(self, engine):
+        with Session(engine) as session:
+            assert sorted(ids(Note.search(session, "run"))) == [1, 3]
+            assert ids(Note.search(session, "running shoes", quote=True)) == [3]
+            assert ids(Note.search(session, "run", limit=1)) in ([1], [3])
+            assert ids(Note.search(session, "title:cooking")) == [2]
+
+    def test_weights(self, engine):
+        with Session(engine) as session:
+            assert ids(Weighted.search(session, "running")) == [1, 3]
+            assert "bm25" in str(Weighted.create_search_statement("running"))
+
+    def test_substring(self, engine):
+        with Session(engine) as session:
+            statement = Note.create_search_statement("pasta", fts=False)
+            assert ids(session.scalars(statement)) == [2]
+            assert ids(session.scalars(Note.create_search_statement("100%", fts=False))) == []
+            statement = Note.create_search_statement("pasta", statement=select(Note.id).where(Note.id > 1))
+            assert session.scalars(statement).all() == [2]
+
+    def test_triggers(self, engine):
+        with engine.begin() as connection:
+            connection.execute(update(Note).where(Note.id == 2).values(body="Sprinting after the bus."))
+            connection.execute(delete(Note).where(Note.id == 1))
+        with Session(engine) as session:
+            assert ids(Note.search(session, "pasta")) == []
+            assert ids(Note.search(session, "sprinting")) == [2]
+            assert ids(Note.search(session, "morning")) == []
+
+    def test_create_fts(self, engine):
+        with engine.begin() as connection:
+            connection.exec_driver_sql('DROP TABLE "note_fts"')
+            for name in ("insert", "update", "delete"):
+                connection.exec_driver_sql(f'DROP TRIGGER "note_fts_{name}"')
+            Note.create_fts(connection)
+        with Session(engine) as session:
+            assert sorted(ids(Note.search(session, "run"))) == [1, 3]
+
+    def test_drop(self, engine):
+        Base.metadata.drop_all(engine)
+        assert inspect(engine).get_table_names() == []
+
+    def test_declarative_base(self):
+        assert LegacyNote.get_fts_table().name == "legacy_note_fts"
+        engine = create_engine("sqlite://")
+        LegacyBase.metadata.create_all(engine)
+        assert "legacy_note_fts" in inspect(engine).get_table_names()
+        with Session(engine) as session:
+            session.add_all([LegacyNote(id=1, body="running shoes"), LegacyNote(id=2, body="pasta")])
+            session.flush()
+            assert LegacyNote.uses_fts(session)
+            assert ids(LegacyNote.search(session, "running")) == [1]
+        engine.dispose()
+
+    def test_other_dialects(self):
+        statements = []
+        engine = create_mock_engine("postgresql://", lambda sql, *args, **kwargs: statements.append(str(sql)))
+        Note.__table__.create(engine)
+        Note.__table__.drop(engine)
+        assert not any("fts" in s for s in statements)
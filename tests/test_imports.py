@@ -0,0 +1,71 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_imports.py
+Checks that importing the package stays cheap by deferring its heavy dependencies until a feature is used.
+"""
+# Imports #
+# Standard Libraries #
+import pathlib
+import re
+import subprocess
+import sys
+
+# Third-Party Packages #
+
+# Local Packages #
+import src.sqlalchemyobjects
+
+
+# Definitions #
+ROOT = pathlib.Path(__file__).parent.parent
+HEAVY_MODULES = ("sqlalchemy", "numpy", "pyarrow")
+IMPORT_BUDGET_SECONDS = 0.1
+
+
+# Functions #
+def run_python(code: str) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+
+# Classes #
+class TestImports:
+    def test_heavy_modules_deferred(self):
+        code = f"import sys, src.sqlalchemyobjects; print([m for m in {HEAVY_MODULES!r} if m in sys.modules])"
+        assert run_python(code).stdout.strip() == "[]"
+
+    def test_import_time_budget(self):
+        process = run_python("import src.sqlalchemyobjects")
+        match = re.search(r"\|\s*(\d+)\s*\|\s*src\.sqlalchemyobjects\s*$", process.stderr, re.MULTILINE)
+        assert match is not None
+        assert int(match.group(1)) / 1e6 < IMPORT_BUDGET_SECONDS
+
+    def test_lazy_attribute(self):
+        code = "import sys, src.sqlalchemyobjects as s; s.BulkInserter; print('sqlalchemy' in sys.modules)"
+        assert run_python(code).stdout.strip() == "True"
+
+    def test_unknown_attribute(self):
+        code = "import src.sqlalchemyobjects as s; print(hasattr(s, 'missing'))"
+        assert run_python(code).stdout.strip() == "False"
+
+    def test_all(self):
+        names = [n for n, m in src.sqlalchemyobjects._LAZY_ATTRIBUTES.items() if m not in (".arrays", ".arrowio")]
+        assert src.sqlalchemyobjects.__all__ == names
+        assert "fetch_numpy" not in names and "to_arrow" not in names
+
+    def test_star_import_without_extras(self):
+        code = (
+            "import sys; sys.modules.update(numpy=None, pyarrow=None); "
+            "from src.sqlalchemyobjects import *; print(BulkInserter.__name__)"
+        )
+        assert run_python(code).stdout.strip() == "BulkInserter"
+
+    def test_dir(self):
+        names = dir(src.sqlalchemyobjects)
+        assert set(src.sqlalchemyobjects.__all__) <= set(names)
+        assert "__getattr__" in names
@@ -0,0 +1,237 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_intervaltable.py
+Tests of the interval table template and its R*Tree backed overlap and containment queries.
+"""
+# Imports #
+# Standard Libraries #
+import datetime
+
+import pytest
+from sqlalchemy import BigInteger
+from sqlalchemy import DateTime
+from sqlalchemy import Float
+from sqlalchemy import Integer
+from sqlalchemy import Numeric
+from sqlalchemy import SmallInteger
+from sqlalchemy import create_engine
+from sqlalchemy import create_mock_engine
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import inspect
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import mapped_column
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.tables import IntervalTable
+
+
+# Definitions #
+LARGE = 2**40
+
+
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Segment(IntervalTable, Base):
+    __tablename__ = "segment"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+class Span(IntervalTable, Base):
+    __tablename__ = "span"
+    interval_type = Integer
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+class Tick(IntervalTable, Base):
+    __tablename__ = "tick"
+    interval_type = SmallInteger
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+class Epoch(IntervalTable, Base):
+    __tablename__ = "epoch"
+    interval_type = BigInteger
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+class Meeting(IntervalTable, Base):
+    __tablename__ = "meeting"
+    interval_type = DateTime
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+class Plain(IntervalTable, Base):
+    __tablename__ = "plain"
+    use_rtree = False
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+LegacyBase = declarative_base()
+
+
+class LegacySegment(IntervalTable, LegacyBase):
+    __tablename__ = "legacy_segment"
+
+    id = mapped_column(Integer, primary_key=True)
+
+
+# Functions #
+def ids(intervals):
+    return [i.id for i in intervals]
+
+
+# Fixtures #
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    intervals = [{"id": 1, "start": 0.0, "end": 10.0}, {"id": 2, "start": 5.0, "end": 6.0}]
+    intervals.append({"id": 3, "start": 20.0, "end": 30.0})
+    with engine.begin() as connection:
+        for table in (Segment, Span, Plain):
+            connection.execute(insert(table), intervals)
+    yield engine
+    engine.dispose()
+
+
+# Tests #
+class TestIntervalTable:
+    def test_rtree_table(self):
+        assert Segment.get_rtree_table().name == "segment_rtree"
+        assert Plain.rtree_table is None
+        with pytest.raises(ValueError, match="Plain has no R\\*Tree"):
+            Plain.get_rtree_table()
+
+    def test_is_rtree_type(self):
+        assert IntervalTable.is_rtree_type(Integer())
+        assert IntervalTable.is_rtree_type(Numeric(10, 2))
+        assert IntervalTable.is_rtree_type(Float())
+        assert not IntervalTable.is_rtree_type(DateTime())
+        assert Meeting.rtree_table is None
+
+    def test_rtree_module(self):
+        assert Segment.get_rtree_module() == "rtree"
+        assert Span.get_rtree_module() == "rtree_i32"
+        assert Tick.get_rtree_module() == "rtree_i32"
+        assert Epoch.get_rtree_module() == "rtree"
+        assert "USING rtree_i32(" in Span.create_rtree_ddl()[0]
+
+    def test_schema(self, engine):
+        names = inspect(engine).get_table_names()
+        assert {"segment_rtree", "span_rtree", "epoch_rtree"} <= set(names)
+        assert "plain_rtree" not in names
+        assert [i["name"] for i in inspect(engine).get_indexes("segment")] == ["ix_segment_start_end"]
+
+    def test_triggers(self, engine):
+        rtree = Segment.get_rtree_table()
+        with engine.begin() as connection:
+            connection.execute(update(Segment).where(Segment.id == 2).values(start=5.5))
+            connection.execute(Segment.__table__.delete().where(Segment.id == 3))
+            assert connection.execute(select(rtree.c.id, rtree.c.start).order_by(rtree.c.id)).all() == [
+                (1, 0.0),
+                (2, 5.5),
+            ]
+
+    def test_uses_rtree(self, engine):
+        with Session(engine) as session:
+            assert Segment.uses_rtree(session)
+            assert not Plain.uses_rtree(session)
+        with engine.connect() as connection:
+            assert Span.uses_rtree(connection)
+
+    def test_statements(self):
+        statement = Segment.create_overlap_statement(1.0, 2.0)
+        assert "JOIN segment_rtree" in str(statement)
+        assert "segment_rtree" not in str(Segment.create_overlap_statement(1.0, 2.0, rtree=False))
+        assert "plain_rtree" not in str(Plain.create_overlap_statement(1.0, 2.0))
+        counted = Segment.create_within_statement(1.0, 2.0, statement=select(func.count(Segment.id)))
+        assert "count(segment.id)" in str(counted.compile(dialect=postgresql.dialect()))
+
+    @pytest.mark.parametrize("table", [Segment, Span, Plain])
+    def test_queries(self, engine, table):
+        with Session(engine) as session:
+            assert ids(table.get_overlapping(session, 6, 21)) == [1, 2, 3]
+            assert ids(table.get_overlapping(session, 11, 19)) == []
+            assert ids(table.get_containing(session, 5)) == [1, 2]
+            assert ids(table.get_containing(session, 4, 7)) == [1]
+            assert ids(table.get_within(session, 0, 10)) == [1, 2]
+            assert ids(table.get_within(session, 1, 10)) == [2]
+
+    def test_big_integers(self, engine):
+        with engine.begin() as connection:
+            connection.execute(
+                insert(Epoch),
+                [
+                    {"id": 1, "start": LARGE, "end": LARGE + 10},
+                    {"id": 2, "start": LARGE + 11, "end": LARGE + 20},
+                    {"id": 3, "start": 0, "end": 10},
+                ],
+            )
+        with Session(engine) as session:
+            assert ids(Epoch.get_overlapping(session, LARGE + 5, LARGE + 6)) == [1]
+            assert ids(Epoch.get_overlapping(session, LARGE + 10, LARGE + 11)) == [1, 2]
+            assert ids(Epoch.get_containing(session, LARGE + 15)) == [2]
+            assert ids(Epoch.get_within(session, LARGE + 1, LARGE + 20)) == [2]
+            assert ids(Epoch.get_overlapping(session, 5, 5)) == [3]
+
+    def test_date_times(self, engine):
+        day = datetime.datetime(2024, 1, 1)
+        hour = datetime.timedelta(hours=1)
+        with engine.begin() as connection:
+            connection.execute(insert(Meeting), [{"id": 1, "start": day, "end": day + hour}])
+        assert "meeting_rtree" not in inspect(engine).get_table_names()
+        with Session(engine) as session:
+            assert not Meeting.uses_rtree(session)
+            assert ids(Meeting.get_overlapping(session, day + hour / 2, day + hour * 2)) == [1]
+            assert ids(Meeting.get_containing(session, day + hour * 2)) == []
+
+    def test_create_rtree(self, engine):
+        rtree = Segment.get_rtree_table()
+        with engine.begin() as connection:
+            connection.exec_driver_sql(f'DELETE FROM "{rtree.name}"')
+            Segment.create_rtree(connection)
+            assert connection.scalar(select(func.count()).select_from(rtree)) == 3
+        with Session(engine) as session:
+            assert ids(Segment.get_overlapping(session, 6, 21)) == [1, 2, 3]
+
+    def test_drop(self, engine):
+        Base.metadata.drop_all(engine)
+        assert inspect(engine).get_table_names() == []
+
+    def test_declarative_base(self):
+        assert LegacySegment.get_rtree_table().name == "legacy_segment_rtree"
+        engine = create_engine("sqlite://")
+        LegacyBase.metadata.create_all(engine)
+        assert "legacy_segment_rtree" in inspect(engine).get_table_names()
+        with Session(engine) as session:
+            session.add_all([LegacySegment(id=1, start=0.0, end=10.0), LegacySegment(id=2, start=20.0, end=30.0)])
+            session.flush()
+            assert LegacySegment.uses_rtree(session)
+            assert ids(LegacySegment.get_overlapping(session, 5, 6)) == [1]
+        engine.dispose()
+
+    def test_other_dialects(self):
+        statements = []
+        engine = create_mock_engine("postgresql://", lambda sql, *args, **kwargs: statements.append(str(sql)))
+        Segment.__table__.create(engine)
+        Segment.__table__.drop(engine)
+        assert not any("rtree" in s for s in statements)
+        assert any(s.strip().startswith("CREATE TABLE segment") for s in statements)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_keysets.py
+Tests of filtering selects and deletes by large collections of keys.
+"""
+# Imports #
+# Standard Libraries #
+import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import insert
+from sqlalchemy import inspect
+from sqlalchemy import select
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import mapped_column
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.keysets import KeySet
+from src.sqlalchemyobjects.keysets import delete_by_keys
+from src.sqlalchemyobjects.keysets import select_by_keys
+
+
+# Definitions #
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Sample(Base):
+    __tablename__ = "sample"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    group: Mapped[str]
+    day: Mapped[datetime.date]
+
+
+# Functions #
+def ids(rows):
+    return sorted(r.id for r in rows)
+
+
+# Fixtures #
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'keysets.db'}")
+    Base.metadata.create_all(engine)
+    rows = [
+        {"id": i, "group": "even" if i % 2 == 0 else "odd", "day": datetime.date(2024, 1, 1 + i % 28)}
+        for i in range(1000)
+    ]
+    with engine.begin() as connection:
+        connection.execute(insert(Sample), rows)
+    yield engine
+    engine.dispose()
+
+
+# Tests #
+class TestKeySet:
+    def test_construct(self):
+        key_set = KeySet([1, 2, 2, 3], Sample.id, "temp", 10)
+        assert (key_set.keys, key_set.columns) == ([1, 2, 3], (Sample.id,))
+        assert (key_set.strategy, key_set.in_limit) == ("temp", 10)
+        assert len(key_set) == 3
+        assert KeySet([[1, "a"], (1, "a")], [Sample.id, Sample.group]).keys == [(1, "a")]
+        key_set = KeySet([1], init=False)
+        key_set.construct()
+        assert (key_set.keys, key_set.strategy, key_set.in_limit) == ([], None, 500)
+
+    def test_unknown_strategy(self):
+        with pytest.raises(ValueError, match="Unknown key set strategy 'bad'"):
+            KeySet([1], Sample.id, "bad")
+
+    def test_is_json_compatible(self):
+        assert KeySet([1, "a"], Sample.id).is_json_compatible()
+        assert not KeySet([True], Sample.id).is_json_compatible()
+        assert not KeySet([1.5], Sample.id).is_json_compatible()
+        assert KeySet([(1, "a")], [Sample.id, Sample.group]).is_json_compatible()
+        assert not KeySet([(1, datetime.date(2024, 1, 1))], [Sample.id, Sample.day]).is_json_compatible()
+
+    def test_choose_strategy(self, engine):
+        with engine.connect() as connection:
+            assert KeySet(range(10), Sample.id).choose_strategy(connection) == "in"
+            assert KeySet(range(10), Sample.id, in_limit=5).choose_strategy(connection) == "json"
+            assert KeySet([1.5, 2.5], Sample.id, in_limit=1).choose_strategy(connection) == "temp"
+            assert KeySet(range(10), Sample.id, "temp").choose_strategy(connection) == "temp"
+
+    @pytest.mark.parametrize("strategy", ["in", "json", "temp"])
+    def test_select(self, engine, strategy):
+        keys = list(range(0, 2000, 3))
+        with engine.connect() as connection:
+            with KeySet(keys, Sample.id, strategy) as key_set:
+                rows = key_set.select(connection, select(Sample.id))
+        assert ids(rows) == list(range(0, 1000, 3))
+
+    @pytest.mark.parametrize("strategy", ["in", "json", "temp"])
+    def test_select_columns(self, engine, strategy):
+        keys = [(1, "odd"), (2, "odd"), (4, "even")]
+        with Session(engine) as session:
+            rows = select_by_keys(session, select(Sample), [Sample.id, Sample.group], keys, strategy)
+        assert [r[0].id for r in rows] == [1, 4]
+
+    def test_select_dates(self, engine):
+        keys = [datetime.date(2024, 1, 2), datetime.date(2024, 1, 3)]
+        with engine.connect() as connection:
+            rows = select_by_keys(connection, select(Sample.id), Sample.__table__.c.day, keys, "temp")
+        assert len(rows) == 72
+
+    def test_select_empty(self, engine):
+        with engine.connect() as connection:
+            assert KeySet([], Sample.id).select(connection, select(Sample.id)) == []
+
+    def test_temp_table(self, engine):
+        with engine.connect() as connection:
+            key_set = KeySet([1, 2], Sample.id, "temp")
+            table = key_set.create_temp_table(connection)
+            assert key_set.create_temp_table(connection) is table
+            assert connection.execute(select(*table.columns)).scalars().all() == [1, 2]
+            key_set.close()
+            assert key_set.temp_table is None
+            assert connection.execute(select(*table.columns)).all() == []
+            other = KeySet([3], Sample.id, "temp")
+            assert other.create_temp_table(connection).name == table.name
+        assert table.name not in inspect(engine).get_table_names()
+
+    def test_temp_table_moves(self, engine):
+        key_set = KeySet([1, 2], Sample.id, "temp")
+        with engine.connect() as first:
+            key_set.create_temp_table(first)
+        with engine.connect() as second:
+            assert key_set._connection is first
+            key_set.create_temp_table(second)
+            assert key_set._connection is second
+            key_set.close()
+
+    def test_delete(self, engine):
+        assert KeySet([], Sample.id).delete(engine, Sample) == 0
+        key_set = KeySet(range(100), Sample.id, "temp")
+        assert key_set.delete(engine, Sample) == 100
+        assert key_set.temp_table is None
+        with Session(engine) as session:
+            assert KeySet(range(100, 200), Sample.id).delete(session, Sample.__table__) == 100
+            session.commit()
+        with engine.connect() as connection:
+            assert connection.execute(select(Sample.id).order_by(Sample.id)).scalars().first() == 200
+
+    def test_delete_by_keys(self, engine):
+        assert delete_by_keys(engine, Sample, range(0, 1000, 2), strategy="json") == 500
+        assert delete_by_keys(engine, Sample, [(1, "odd"), (3, "even")], [Sample.id, Sample.group]) == 1
+        with engine.connect() as connection:
+            assert connection.execute(select(Sample.id).order_by(Sample.id)).scalars().first() == 3
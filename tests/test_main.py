@@ -0,0 +1,55 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_main.py
+Tests of the command-line interface.
+"""
+# Imports #
+# Standard Libraries #
+import json
+
+import pytest
+from click.testing import CliRunner
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects import __main__
+
+
+# Definitions #
+# Fixtures #
+@pytest.fixture
+def runner():
+    return CliRunner()
+
+
+@pytest.fixture
+def url(tmp_path):
+    return f"sqlite:///{tmp_path / 'bench.db'}"
+
+
+# Tests #
+class TestBench:
+    def test_table(self, runner, url):
+        result = runner.invoke(__main__.main, ["bench", url, "-n", "100", "-o", "10"])
+        assert result.exit_code == 0
+        lines = result.output.splitlines()
+        assert lines[0].startswith("operation")
+        assert [line.split()[0] for line in lines[1:]] == ["insert", "select", "update", "delete"]
+
+    def test_json(self, runner, url):
+        result = runner.invoke(__main__.main, ["bench", url, "-n", "50", "-o", "5", "-p", "sqlite-bulk-load", "--json"])
+        assert result.exit_code == 0
+        output = json.loads(result.output)
+        assert output["profile"] == "sqlite-bulk-load"
+        assert [r["operations"] for r in output["results"]] == [50, 5, 5, 5]
+
+    def test_unknown_profile(self, runner, url):
+        result = runner.invoke(__main__.main, ["bench", url, "-p", "missing"])
+        assert result.exit_code == 2
+
+    def test_existing_table(self, runner, url):
+        assert runner.invoke(__main__.main, ["bench", url, "-n", "10", "-o", "1", "--keep"]).exit_code == 0
+        result = runner.invoke(__main__.main, ["bench", url, "-n", "10", "-o", "1"])
+        assert result.exit_code == 1
+        assert "Table 'sqlalchemyobjects_bench' already exists" in result.output
@@ -0,0 +1,229 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_nplusonedetector.py
+Tests of counting the statements of each session and detecting N+1 lazy loads.
+"""
+# Imports #
+# Standard Libraries #
+import json
+import logging
+
+import pytest
+from sqlalchemy import ForeignKey
+from sqlalchemy import delete
+from sqlalchemy import create_engine
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import sessionmaker
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.databases import Database
+from src.sqlalchemyobjects.databases import NPlusOneDetector
+from src.sqlalchemyobjects.databases import NPlusOneError
+from src.sqlalchemyobjects.databases.nplusonedetector import ACCOUNT_KEY
+from src.sqlalchemyobjects.databases.nplusonedetector import QueryAccount
+from src.sqlalchemyobjects.databases.nplusonedetector import fingerprint
+
+
+# Definitions #
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Parent(Base):
+    __tablename__ = "parent"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    children: Mapped[list["Child"]] = relationship(back_populates="parent")
+
+
+class Child(Base):
+    __tablename__ = "child"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    parent_id: Mapped[int] = mapped_column(ForeignKey("parent.id"))
+    parent: Mapped[Parent] = relationship(back_populates="children")
+
+
+# Functions #
+def load_children(session):
+    return [len(p.children) for p in session.scalars(select(Parent).order_by(Parent.id))]
+
+
+# Fixtures #
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(Parent), [{"id": i} for i in range(5)])
+        connection.execute(insert(Child), [{"id": i, "parent_id": i % 5} for i in range(10)])
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def factory(engine):
+    return sessionmaker(engine)
+
+
+# Tests #
+class TestFingerprint:
+    def test_fingerprint(self):
+        assert fingerprint("SELECT *  FROM t WHERE a = 'it''s' AND b = 1.5") == "SELECT * FROM t WHERE a = ? AND b = ?"
+        statement = "SELECT * FROM t WHERE a IN (?, ?, ?) AND b = :b"
+        assert fingerprint(statement) == "SELECT * FROM t WHERE a IN (?) AND b = ?"
+        assert fingerprint("SELECT * FROM t WHERE a IN (__[POSTCOMPILE_a])") == "SELECT * FROM t WHERE a IN (__?)"
+
+
+class TestQueryAccount:
+    def test_report(self):
+        account = QueryAccount(statements=3)
+        account.fingerprints.update(["a", "a", "b"])
+        account.lazy_loads.update({"Parent.children": 2, "Child.parent": 1})
+        account.lazy_fingerprints["Parent.children"] = "a"
+        report = account.report(threshold=1)
+        assert json.loads(json.dumps(report)) == report
+        assert (report["statements"], report["distinct"], report["repeated"]) == (3, 2, {"a": 2})
+        assert report["lazy_loads"] == {"Parent.children": {"count": 2, "fingerprint": "a"}}
+
+
+class TestNPlusOneDetector:
+    def test_construct(self):
+        detector = NPlusOneDetector(3, True)
+        assert (detector.threshold, detector.raise_error, detector.engines) == (3, True, [])
+        detector = NPlusOneDetector(init=False)
+        detector.construct()
+        assert (detector.threshold, detector.raise_error) == (10, False)
+
+    def test_accounts(self, engine, factory):
+        detector = NPlusOneDetector()
+        detector.attach(factory, engine)
+        with factory() as session:
+            session.scalars(select(Parent)).all()
+            session.scalars(select(Parent)).all()
+            account = detector.get_account(session)
+            assert (account.statements, len(account.fingerprints)) == (2, 1)
+            new = detector.reset_account(session)
+            assert session.info[ACCOUNT_KEY] is new
+            session.scalars(select(Child)).all()
+            assert (account.statements, new.statements) == (2, 1)
+            with session.begin_nested():
+                session.scalars(select(Child)).all()
+            session.commit()
+            session.scalars(select(Child)).all()
+            assert new.statements == 5
+        with engine.connect() as connection:
+            connection.execute(select(Parent))
+            assert ACCOUNT_KEY not in connection.info
+        detector.detach(factory)
+
+    def test_lazy_loads(self, engine, factory):
+        detector = NPlusOneDetector(threshold=10)
+        detector.attach(factory, engine)
+        with factory() as session:
+            assert load_children(session) == [2] * 5
+            account = detector.get_account(session)
+            assert account.lazy_loads == {"Parent.children": 5}
+            assert "FROM child" in account.lazy_fingerprints["Parent.children"]
+            assert account.statements == 6
+        with factory() as session:
+            load_children(session)
+            assert detector.get_account(session).lazy_loads["Parent.children"] == 5
+        detector.detach(factory)
+
+    def test_other_statements(self, engine, factory):
+        detector = NPlusOneDetector()
+        detector.attach(factory, engine)
+        with factory() as session:
+            session.execute(update(Parent).where(Parent.id == 0).values(id=0))
+            session.execute(delete(Child).where(Child.id == 0))
+            assert detector.get_account(session).statements == 2
+        detector.detach(factory)
+
+    def test_eager_loads(self, engine, factory):
+        detector = NPlusOneDetector(threshold=1, raise_error=True)
+        detector.attach(factory, engine)
+        with factory() as session:
+            parents = session.scalars(select(Parent).options(selectinload(Parent.children))).all()
+            assert [len(p.children) for p in parents] == [2] * 5
+            assert not detector.get_account(session).lazy_loads
+        detector.detach(factory)
+
+    def test_warning(self, engine, factory, caplog):
+        detector = NPlusOneDetector(threshold=2)
+        detector.attach(factory, engine)
+        with caplog.at_level(logging.WARNING):
+            with factory() as session:
+                load_children(session)
+        messages = [r.getMessage() for r in caplog.records]
+        assert len(messages) == 1
+        assert "Parent.children was lazy loaded 3 times in one session" in messages[0]
+        assert "selectinload(Parent.children)" in messages[0]
+        detector.detach(factory)
+
+    def test_raise_error(self, engine, factory):
+        detector = NPlusOneDetector(threshold=2, raise_error=True)
+        detector.attach(factory, engine)
+        with factory() as session:
+            with pytest.raises(NPlusOneError, match="Parent.children was lazy loaded 3 times"):
+                load_children(session)
+            assert detector.get_account(session).lazy_attribute is None
+        detector.detach(factory)
+
+    def test_detach(self, engine, factory):
+        detector = NPlusOneDetector()
+        other = sessionmaker(engine)
+        detector.attach(factory, engine)
+        detector.attach(other, engine)
+        assert detector.engines == [engine]
+        detector.detach(other)
+        detector.detach(factory)
+        assert detector.engines == []
+        with factory() as session:
+            load_children(session)
+            assert ACCOUNT_KEY not in session.info
+
+
+class TestDatabaseDetector:
+    def test_attach(self, engine):
+        detector = NPlusOneDetector(threshold=2, raise_error=True)
+        database = Database(engine=engine, detector=detector)
+        assert (database.detector, detector.engines) == (detector, [engine])
+        with pytest.raises(NPlusOneError):
+            with database.session() as session:
+                load_children(session)
+
+    def test_no_engine(self, engine):
+        detector = NPlusOneDetector(threshold=2, raise_error=True)
+        database = Database(detector=detector)
+        assert (database.detector, detector.engines) == (detector, [])
+        database.construct(engine=engine)
+        assert detector.engines == [engine]
+        with pytest.raises(NPlusOneError):
+            with database.session() as session:
+                load_children(session)
+
+    def test_replace(self, engine):
+        first = NPlusOneDetector()
+        database = Database(engine=engine, detector=first)
+        second = NPlusOneDetector(threshold=2, raise_error=True)
+        database.construct(detector=second)
+        assert (database.detector, first.engines, second.engines) == (second, [], [engine])
+        other = create_engine("sqlite://")
+        database.construct(engine=other)
+        assert second.engines == [other]
+        database.construct(engine=engine)
+        with database.session() as session:
+            with pytest.raises(NPlusOneError):
+                load_children(session)
+        other.dispose()
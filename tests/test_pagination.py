@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_pagination.py
+Tests of keyset pagination with opaque cursors.
+"""
+# Imports #
+# Standard Libraries #
+import datetime
+import decimal
+import uuid
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import select
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import mapped_column
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.pagination import KeysetPager
+from src.sqlalchemyobjects.pagination import Page
+from src.sqlalchemyobjects.pagination import decode_cursor
+from src.sqlalchemyobjects.pagination import encode_cursor
+
+
+# Definitions #
+ROWS = [(g, i) for g in range(3) for i in range(7)]
+
+
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Event(Base):
+    __tablename__ = "event"
+
+    group: Mapped[int] = mapped_column(primary_key=True)
+    index: Mapped[int] = mapped_column(primary_key=True)
+
+
+# Fixtures #
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(Event.__table__.insert(), [{"group": g, "index": i} for g, i in ROWS])
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def connection(engine):
+    with engine.connect() as connection:
+        yield connection
+
+
+# Tests #
+class TestCursors:
+    def test_round_trip(self):
+        values = (
+            1,
+            "text",
+            None,
+            1.5,
+            datetime.datetime(2024, 1, 2, 3, 4, 5),
+            datetime.date(2024, 1, 2),
+            datetime.time(3, 4, 5),
+            decimal.Decimal("1.25"),
+            uuid.UUID(int=7),
+            b"\x00\xff",
+        )
+        token = encode_cursor(values, backward=True)
+        assert "=" not in token
+        assert decode_cursor(token) == (values, True)
+        assert decode_cursor(encode_cursor([1])) == ((1,), False)
+
+    @pytest.mark.parametrize("token", ["not a cursor", encode_cursor([]) + "x", "W10", "WzAsW3sieCI6MX1dXQ"])
+    def test_invalid(self, token):
+        with pytest.raises(ValueError, match="Invalid pagination cursor"):
+            decode_cursor(token)
+
+
+class TestPage:
+    def test_sequence(self):
+        page = Page([1, 2])
+        assert len(page) == 2
+        assert list(page) == [1, 2]
+
+
+class TestKeysetPager:
+    def test_no_init(self):
+        pager = KeysetPager(select(Event), [Event.group], 5, False, init=False)
+        assert pager.statement is None
+        assert pager.page_size == 100
+        pager.construct()
+        assert pager.keys == ()
+
+    def test_no_statement(self, connection):
+        with pytest.raises(ValueError, match="has no statement"):
+            KeysetPager(keys=[Event.group]).fetch(connection)
+
+    @pytest.mark.parametrize("row_values", [True, False], ids=["row_values", "expanded"])
+    def test_forward(self, connection, row_values):
+        pager = KeysetPager(select(Event.group, Event.index), [Event.group, Event.index], 5, row_values)
+        pages = list(pager.iterate(connection))
+        assert [tuple(r) for p in pages for r in p] == ROWS
+        assert [len(p) for p in pages] == [5, 5, 5, 5, 1]
+        assert pages[0].previous_cursor is None
+        assert pages[-1].next_cursor is None
+
+    @pytest.mark.parametrize("row_values", [True, False], ids=["row_values", "expanded"])
+    def test_backward(self, connection, row_values):
+        pager = KeysetPager(select(Event.group, Event.index), [Event.group, Event.index], 5, row_values)
+        pages = list(pager.iterate(connection, backward=True))
+        assert [tuple(r) for p in reversed(pages) for r in p] == ROWS
+        assert pages[0].next_cursor is None
+        assert pages[-1].previous_cursor is None
+        assert len(pages[-1]) == 1
+
+    def test_resume(self, connection):
+        pager = KeysetPager(select(Event.group, Event.index), [Event.group, Event.index], 4)
+        first = pager.fetch(connection)
+        second = pager.fetch(connection, first.next_cursor)
+        assert [tuple(r) for r in second] == ROWS[4:8]
+        previous = pager.fetch(connection, second.previous_cursor)
+        assert [tuple(r) for r in previous] == ROWS[:4]
+        assert previous.previous_cursor is None
+        assert previous.next_cursor is not None
+        rest = list(pager.iterate(connection, second.next_cursor))
+        assert [tuple(r) for p in rest for r in p] == ROWS[8:]
+        back = list(pager.iterate(connection, second.previous_cursor))
+        assert [tuple(r) for r in back[0]] == ROWS[:4]
+
+    def test_ordering_replaced(self, connection):
+        statement = select(Event.group, Event.index).order_by(Event.index.desc())
+        page = KeysetPager(statement, [Event.group, Event.index], 3).fetch(connection)
+        assert [tuple(r) for r in page] == ROWS[:3]
+
+    def test_single_key(self, connection):
+        statement = select(Event.index).where(Event.group == 1)
+        pages = list(KeysetPager(statement, [Event.index], 3).iterate(connection))
+        assert [r.index for p in pages for r in p] == list(range(7))
+
+    def test_labeled_key(self, connection):
+        statement = select(Event.group.label("g"), Event.index.label("i"))
+        pager = KeysetPager(statement, [statement.selected_columns.g, statement.selected_columns.i], 10)
+        pages = list(pager.iterate(connection))
+        assert [tuple(r) for p in pages for r in p] == ROWS
+
+    def test_entities(self, engine):
+        pager = KeysetPager(select(Event), [Event.group, Event.index], 8)
+        with Session(engine) as session:
+            pages = list(pager.iterate(session))
+        assert [(r[0].group, r[0].index) for p in pages for r in p] == ROWS
+
+    def test_empty(self, connection):
+        pager = KeysetPager(select(Event).where(Event.group > 10), [Event.group, Event.index])
+        page = pager.fetch(connection)
+        assert page.rows == []
+        assert page.next_cursor is None
+        assert list(pager.iterate(connection)) == []
+
+    def test_exact_pages(self, connection):
+        pager = KeysetPager(select(Event.group, Event.index), [Event.group, Event.index], 7)
+        pages = list(pager.iterate(connection))
+        assert [len(p) for p in pages] == [7, 7, 7]
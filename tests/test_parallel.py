@@ -0,0 +1,162 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_parallel.py
+Tests of scanning and aggregating tables in key ranges across a process pool.
+"""
+# Imports #
+# Standard Libraries #
+import operator
+
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Table
+from sqlalchemy import create_engine
+from sqlalchemy import insert
+from sqlalchemy import make_url
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.engines import default_registry
+from src.sqlalchemyobjects.parallel import ParallelScanner
+from src.sqlalchemyobjects.parallel import _reset_registry
+from src.sqlalchemyobjects.parallel import _scan_range
+from src.sqlalchemyobjects.parallel import key_ranges
+from src.sqlalchemyobjects.parallel import parallel_aggregate
+from src.sqlalchemyobjects.parallel import sample_keys
+
+
+# Definitions #
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Sample(Base):
+    __tablename__ = "sample"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    value: Mapped[int]
+    weight: Mapped[float]
+
+
+# Functions #
+def count_rows(rows):
+    return sum(1 for _ in rows)
+
+
+def sum_values(rows):
+    return sum(row.value for row in rows)
+
+
+def covered(ranges, keys):
+    return [k for k in keys for low, high in ranges if (low is None or k >= low) and (high is None or k < high)]
+
+
+# Fixtures #
+@pytest.fixture
+def url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'parallel.db'}"
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(Sample), [{"id": i * 3, "value": i, "weight": i / 2} for i in range(100)])
+    engine.dispose()
+    yield url
+    default_registry.dispose()
+
+
+# Tests #
+class TestKeyRanges:
+    def test_sample_keys(self, url):
+        engine = create_engine(url)
+        with engine.connect() as connection:
+            sample = sample_keys(connection, Sample.__table__.c.id, 10)
+            assert len(sample) == 10
+            assert sample == sorted(sample)
+            assert sample_keys(connection, Sample.__table__.c.id) == [i * 3 for i in range(100)]
+        engine.dispose()
+
+    def test_quantiles(self, url):
+        keys = [i * 3 for i in range(100)]
+        ranges = key_ranges(create_engine(url), Sample, "id", 4)
+        assert len(ranges) == 4
+        assert ranges[0][0] is None and ranges[-1][1] is None
+        assert sorted(covered(ranges, keys)) == keys
+        sampled = key_ranges(create_engine(url), Sample, "id", 4, sample_size=20)
+        assert sorted(covered(sampled, keys)) == keys
+
+    def test_even(self, url):
+        ranges = key_ranges(create_engine(url), Sample.__table__, "id", 3, quantiles=False)
+        assert ranges == [(None, 99), (99, 198), (198, None)]
+        float_ranges = key_ranges(create_engine(url), Sample, "weight", 2, quantiles=False)
+        assert float_ranges == [(None, 24.75), (24.75, None)]
+
+    def test_empty(self):
+        engine = create_engine("sqlite://")
+        table = Table("empty", MetaData(), Column("id", Integer, primary_key=True))
+        table.create(engine)
+        assert key_ranges(engine, table, "id", 4) == [(None, None)]
+        assert key_ranges(engine, table, "id", 4, quantiles=False) == [(None, None)]
+
+    def test_few_keys(self):
+        engine = create_engine("sqlite://")
+        table = Table("few", MetaData(), Column("id", Integer, primary_key=True))
+        table.create(engine)
+        with engine.begin() as connection:
+            connection.execute(insert(table), [{"id": 1}, {"id": 2}])
+        assert key_ranges(engine, table, "id", 4) == [(None, 2), (2, None)]
+
+
+class TestParallelScanner:
+    def test_construct(self, url):
+        scanner = ParallelScanner(make_url(url), Sample, profile="sqlite-bulk-load", partitions=3, max_workers=2)
+        assert scanner.get_target() == (url, Sample.__table__, "id")
+        assert (scanner.profile, scanner.partitions, scanner.max_workers) == ("sqlite-bulk-load", 3, 2)
+        scanner.construct(key="value", quantiles=False, partition_size=10)
+        assert (scanner.key, scanner.quantiles, scanner.partition_size) == ("value", False, 10)
+
+    def test_no_target(self):
+        scanner = ParallelScanner(init=False)
+        scanner.construct()
+        with pytest.raises(ValueError, match="needs a URL and a table"):
+            scanner.get_target()
+
+    def test_no_key(self, url):
+        table = Table("pair", MetaData(), Column("a", Integer, primary_key=True), Column("b", Integer, primary_key=True))
+        with pytest.raises(ValueError, match="needs a key column"):
+            ParallelScanner(url, table)
+        assert ParallelScanner(url, table, key="a").key == "a"
+
+    def test_create_ranges(self, url):
+        assert len(ParallelScanner(url, Sample).create_ranges(2)) == 8
+        assert len(ParallelScanner(url, Sample, partitions=2).create_ranges(8)) == 2
+
+    def test_map(self, url):
+        counts = ParallelScanner(url, Sample, partitions=4, max_workers=2).map(count_rows, ["id"])
+        assert len(counts) == 4
+        assert sum(counts) == 100
+
+    def test_aggregate(self, url):
+        scanner = ParallelScanner(url, Sample, max_workers=2, quantiles=False)
+        assert scanner.aggregate(sum_values, operator.add) == sum(range(100))
+        assert scanner.aggregate(count_rows, operator.add, 1000) == 1100
+
+    def test_parallel_aggregate(self, url):
+        assert parallel_aggregate(url, Sample, sum_values, operator.add, columns=["value"], max_workers=2) == 4950
+
+    def test_scan_range(self, url):
+        table = Sample.__table__
+        assert _scan_range(url, None, table, "id", None, (None, None), count_rows, 10) == 100
+        assert _scan_range(url, None, table, "id", ["value"], (30, None), sum_values, 10) == sum(range(10, 100))
+        assert _scan_range(url, None, table, "id", ["id"], (None, 30), count_rows, 10) == 10
+
+    def test_reset_registry(self, url):
+        default_registry.get_engine(url)
+        _reset_registry()
+        assert default_registry.engines == {}
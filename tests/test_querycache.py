@@ -0,0 +1,250 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_querycache.py
+Tests of the LRU and TTL bounded cache of select results.
+"""
+# Imports #
+# Standard Libraries #
+import time
+
+import pytest
+from sqlalchemy import bindparam
+from sqlalchemy import column
+from sqlalchemy import create_engine
+from sqlalchemy import delete
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlalchemy import table
+from sqlalchemy import text
+from sqlalchemy import update
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import mapped_column
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.cache import QueryCache
+from src.sqlalchemyobjects.cache.querycache import read_tables
+
+
+# Definitions #
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Sample(Base):
+    __tablename__ = "sample"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    value: Mapped[float]
+
+
+class Other(Base):
+    __tablename__ = "other"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+class Uncacheable:
+    """A statement stand-in without a cache key."""
+
+    def _generate_cache_key(self):
+        return None
+
+
+# Fixtures #
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'cache.db'}")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(insert(Sample), [{"id": i, "value": float(i)} for i in range(3)])
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def cache(engine):
+    cache = QueryCache(max_size=4)
+    cache.attach(engine)
+    yield cache
+    cache.detach(engine)
+
+
+# Tests #
+class TestQueryCache:
+    def test_construct(self):
+        cache = QueryCache(10, 5.0)
+        assert cache.max_size == 10
+        assert cache.ttl == 5.0
+        assert len(cache) == 0
+        assert cache.hit_ratio == 0.0
+
+    def test_no_ttl(self):
+        assert QueryCache(ttl=None).ttl is None
+        cache = QueryCache(ttl=None)
+        cache.construct(5)
+        assert cache.ttl is None
+        cache.construct(ttl=1.0)
+        assert (cache.max_size, cache.ttl) == (5, 1.0)
+
+    def test_no_init(self):
+        cache = QueryCache(10, None, init=False)
+        assert cache.max_size == 1024
+        assert cache.ttl == 300.0
+
+    def test_read_tables(self):
+        statement = select(Sample.id).join(Other, Other.id == Sample.id)
+        assert read_tables(statement) == {"sample", "other"}
+
+    def test_keys(self, engine):
+        cache = QueryCache()
+        with engine.connect() as connection:
+            entity = cache.create_key(connection, select(Sample).where(Sample.id == 1), None)
+            columns = cache.create_key(connection, select(Sample.id).where(Sample.id == 1), None)
+            same = cache.create_key(connection, select(Sample).where(Sample.id == 1), None)
+            other = cache.create_key(connection, select(Sample).where(Sample.id == 2), None)
+            bound = select(Sample).where(Sample.id == bindparam("key"))
+            assert entity != columns
+            assert entity == same
+            assert entity != other
+            assert cache.create_key(connection, bound, {"key": 1}) != cache.create_key(connection, bound, {"key": 2})
+            assert cache.create_key(connection, bound, {"key": [1, {2}]}) == cache.create_key(
+                connection, bound, {"key": (1, {2})}
+            )
+            assert cache.create_key(connection, Uncacheable(), None) is None
+
+    def test_entity_and_columns(self, engine, cache):
+        with Session(engine) as session:
+            assert cache.execute(session, select(Sample.id).where(Sample.id == 1)).all() == [(1,)]
+            assert cache.execute(session, select(Sample).where(Sample.id == 1)).scalar_one().value == 1.0
+        assert cache.misses == 2
+
+    def test_hits(self, engine, cache):
+        statement = select(Sample.value).where(Sample.id == bindparam("key"))
+        with engine.connect() as connection:
+            assert cache.execute(connection, statement, {"key": 2}).scalar() == 2.0
+            assert cache.execute(connection, statement, {"key": 2}).scalar() == 2.0
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert cache.hit_ratio == 0.5
+
+    def test_session_merge(self, engine, cache):
+        statement = select(Sample).order_by(Sample.id)
+        with Session(engine) as session:
+            cache.execute(session, statement)
+        with Session(engine) as session:
+            samples = cache.execute(session, statement).scalars().all()
+            assert [s.id for s in samples] == [0, 1, 2]
+            assert all(s in session for s in samples)
+        assert cache.hits == 1
+
+    def test_uncacheable(self, engine):
+        cache = QueryCache()
+        with engine.connect() as connection:
+            statement = select(Sample.id)
+            statement._generate_cache_key = lambda: None
+            assert len(cache.execute(connection, statement).all()) == 3
+        assert len(cache) == 0
+
+    def test_expiry(self, engine):
+        cache = QueryCache(ttl=0.0)
+        with engine.connect() as connection:
+            cache.execute(connection, select(Sample.id))
+            time.sleep(0.001)
+            cache.execute(connection, select(Sample.id))
+        assert cache.misses == 2
+
+    def test_lru(self, engine):
+        cache = QueryCache(max_size=2, ttl=None)
+        with engine.connect() as connection:
+            for key in (0, 1, 0, 2):
+                cache.execute(connection, select(Sample.value).where(Sample.id == key))
+            assert len(cache) == 2
+            cache.execute(connection, select(Sample.value).where(Sample.id == 0))
+        assert cache.hits == 2
+        assert set(cache.table_keys) == {"sample"}
+
+    def test_remove_and_clear(self, engine):
+        cache = QueryCache()
+        with engine.connect() as connection:
+            cache.execute(connection, select(Sample.id))
+            cache.execute(connection, select(Other.id))
+        cache.invalidate("other", "missing")
+        assert len(cache) == 1
+        cache.table_keys.clear()
+        cache.remove(next(iter(cache.entries)))
+        cache.remove("missing")
+        assert len(cache) == 0
+        with engine.connect() as connection:
+            cache.execute(connection, select(Sample.id))
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.table_keys == {}
+
+
+class TestInvalidation:
+    def test_write_invalidates(self, engine, cache):
+        with engine.connect() as connection:
+            cache.execute(connection, select(Sample.value).where(Sample.id == 1))
+            cache.execute(connection, select(Other.id))
+        with engine.begin() as connection:
+            connection.execute(update(Sample).where(Sample.id == 1).values(value=10.0))
+        assert list(cache.table_keys) == ["other"]
+        with engine.begin() as connection:
+            assert cache.execute(connection, select(Sample.value).where(Sample.id == 1)).scalar() == 10.0
+        assert len(cache) == 2
+
+    def test_commit_invalidates(self, engine, cache):
+        with engine.connect() as writer, engine.connect() as reader:
+            writer.execute(delete(Sample).where(Sample.id == 0))
+            assert len(cache.execute(reader, select(Sample.id)).all()) == 3
+            reader.rollback()
+            assert len(cache) == 1
+            writer.commit()
+            assert len(cache) == 0
+            assert len(cache.execute(reader, select(Sample.id)).all()) == 2
+
+    def test_uncommitted_writes_bypass(self, engine, cache):
+        with Session(engine) as session:
+            session.add(Sample(id=5, value=5.0))
+            session.flush()
+            assert cache.execute(session, select(Sample.id).where(Sample.id == 5)).all() == [(5,)]
+            assert len(cache) == 0
+            session.rollback()
+            assert cache.pending == {}
+            assert cache.execute(session, select(Sample.id).where(Sample.id == 5)).all() == []
+        assert len(cache) == 1
+
+    def test_textual_writes(self, engine, cache):
+        with engine.connect() as connection:
+            cache.execute(connection, select(Sample.id))
+            connection.execute(text("DELETE FROM sample WHERE id = 0"))
+            assert len(cache) == 0
+            assert cache.pending == {connection: None}
+            cache.execute(connection, select(Sample.id))
+            connection.exec_driver_sql("DELETE FROM sample WHERE id = 1")
+            connection.execute(text("SELECT 1"))
+            connection.exec_driver_sql("SELECT 1")
+            connection.commit()
+            assert cache.pending == {}
+            assert len(cache.execute(connection, select(Sample.id)).all()) == 1
+        assert len(cache) == 1
+
+    def test_unknown_table_writes(self, engine, cache):
+        with engine.connect() as connection:
+            connection.execute(update(Sample).values(value=0.0))
+            connection.execute(insert(table("other", column("id"))).values(id=1))
+            cache.add_pending(connection, "sample")
+            assert cache.pending == {connection: None}
+            connection.rollback()
+
+    def test_detach(self, engine, cache):
+        cache.detach(engine)
+        with engine.begin() as connection:
+            cache.execute(connection, select(Sample.id))
+            connection.execute(delete(Sample))
+        assert len(cache) == 1
+        cache.attach(engine)
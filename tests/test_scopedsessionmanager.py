@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_scopedsessionmanager.py
+Tests of the thread-local sessions pinned to one pooled connection per unit of work.
+"""
+# Imports #
+# Standard Libraries #
+import gc
+import threading
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import select
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.databases import ScopedSessionManager
+from src.sqlalchemyobjects.databases import ThreadScope
+
+
+# Definitions #
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Sample(Base):
+    __tablename__ = "sample"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+# Functions #
+def in_thread(function):
+    results = []
+    thread = threading.Thread(target=lambda: results.append(function()))
+    thread.start()
+    thread.join()
+    return results[0]
+
+
+# Fixtures #
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'scoped.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def manager(engine):
+    manager = ScopedSessionManager(engine)
+    yield manager
+    manager.close_all()
+
+
+# Tests #
+class TestThreadScope:
+    def test_close(self, engine):
+        scope = ThreadScope()
+        scope.connection = engine.connect()
+        scope.depth = 2
+        scope.close()
+        assert (scope.session, scope.connection, scope.depth) == (None, None, 0)
+        ThreadScope.release(None, None)
+
+
+class TestScopedSessionManager:
+    def test_construct(self, engine):
+        manager = ScopedSessionManager(engine, autoflush=False)
+        assert manager.get_engine() is engine
+        assert manager.session_factory.kw["autoflush"] is False
+
+    def test_no_engine(self):
+        manager = ScopedSessionManager(engine=None, init=False)
+        manager.construct()
+        with pytest.raises(ValueError, match="has no engine"):
+            manager.get_engine()
+
+    def test_thread_local_sessions(self, manager):
+        session = manager.session
+        assert manager.session is session
+        assert in_thread(lambda: manager.session) is not session
+
+    def test_remove(self, manager):
+        session = manager.session
+        manager.remove()
+        manager.remove()
+        assert manager.session is not session
+
+    def test_close_all(self, manager):
+        in_thread(lambda: manager.session)
+        manager.session
+        assert len(manager._scopes) >= 1
+        manager.close_all()
+        assert all(scope.session is None for scope in manager._scopes)
+
+    def test_unit_of_work(self, manager, engine):
+        stale = manager.session
+        with manager.unit_of_work() as session:
+            connection = manager.get_scope().connection
+            session.add(Sample(id=1))
+            session.commit()
+            session.add(Sample(id=2))
+            with manager.unit_of_work() as inner:
+                assert inner is session
+                assert manager.get_scope().depth == 2
+            assert session.connection() is connection
+        assert session is not stale
+        assert manager.get_scope().connection is None
+        with engine.connect() as check:
+            assert check.execute(select(Sample.id)).scalars().all() == [1, 2]
+
+    def test_unit_of_work_rollback(self, manager, engine):
+        with pytest.raises(RuntimeError):
+            with manager.unit_of_work() as session:
+                session.add(Sample(id=1))
+                session.flush()
+                raise RuntimeError()
+        with engine.connect() as check:
+            assert check.execute(select(Sample.id)).scalars().all() == []
+        assert engine.pool.checkedout() == 0
+
+    def test_thread_exit_releases(self, manager, engine):
+        in_thread(lambda: manager.session.connection())
+        gc.collect()
+        assert engine.pool.checkedout() == 0
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_sqlitepragmas.py
+Tests of applying and verifying SQLite pragmas on pooled connections.
+"""
+# Imports #
+# Standard Libraries #
+import logging
+import sqlite3
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy import create_mock_engine
+from sqlalchemy import text
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.engines import READ_MOSTLY_PRAGMAS
+from src.sqlalchemyobjects.engines import SQLitePragmaManager
+
+
+# Definitions #
+# Classes #
+class EmptyCursor:
+    """A DBAPI cursor whose pragma reads return no rows."""
+
+    def execute(self, statement):
+        pass
+
+    def fetchone(self):
+        return None
+
+    def close(self):
+        pass
+
+
+class EmptyConnection:
+    def cursor(self):
+        return EmptyCursor()
+
+
+# Fixtures #
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'pragmas.db'}")
+    yield engine
+    engine.dispose()
+
+
+# Tests #
+class TestSQLitePragmaManager:
+    def test_from_preset(self):
+        manager = SQLitePragmaManager.from_preset("read-mostly", strict=True, busy_timeout=10)
+        assert manager.pragmas == READ_MOSTLY_PRAGMAS | {"busy_timeout": 10}
+        assert manager.strict
+
+    def test_unknown_preset(self):
+        with pytest.raises(ValueError, match="Unknown pragma preset"):
+            SQLitePragmaManager.from_preset("missing")
+
+    def test_no_init(self):
+        manager = SQLitePragmaManager({"foreign_keys": 1}, True, init=False)
+        assert manager.pragmas == {}
+        assert not manager.strict
+        manager.construct()
+        assert manager.pragmas == {}
+
+    @pytest.mark.parametrize(
+        ("name", "value", "expected"),
+        [
+            ("synchronous", "normal", 1),
+            ("synchronous", "unknown", "unknown"),
+            ("cache_size", "-2000", -2000),
+            ("journal_mode", "WAL", "wal"),
+            ("busy_timeout", 5000, 5000),
+        ],
+    )
+    def test_normalize(self, name, value, expected):
+        assert SQLitePragmaManager.normalize(name, value) == expected
+
+    def test_apply(self):
+        connection = sqlite3.connect(":memory:")
+        applied = SQLitePragmaManager({"foreign_keys": 1, "temp_store": "MEMORY"}).apply(connection)
+        assert applied == {"foreign_keys": 1, "temp_store": 2}
+
+    def test_apply_without_rows(self):
+        assert SQLitePragmaManager({"optimize": 1}).apply(EmptyConnection()) == {"optimize": None}
+
+    def test_verify(self, caplog):
+        manager = SQLitePragmaManager({"journal_mode": "WAL", "synchronous": "NORMAL"})
+        assert manager.verify({"journal_mode": "wal", "synchronous": 1}) == {}
+        with caplog.at_level(logging.WARNING):
+            mismatched = manager.verify({"journal_mode": "memory", "synchronous": 1})
+        assert mismatched == {"journal_mode": ("WAL", "memory")}
+        assert "did not take effect" in caplog.text
+
+    def test_verify_strict(self):
+        manager = SQLitePragmaManager({"journal_mode": "WAL"}, strict=True)
+        with pytest.raises(ValueError, match="did not take effect"):
+            manager.verify({"journal_mode": "memory"})
+
+    def test_attach(self, engine):
+        manager = SQLitePragmaManager.from_preset("write-heavy").attach(engine)
+        assert manager is engine
+        with engine.connect() as connection:
+            assert connection.execute(text("PRAGMA synchronous")).scalar() == 0
+            record = connection.connection._connection_record
+            applied = record.info[SQLitePragmaManager.info_key]
+            assert applied["journal_mode"] == "wal"
+
+    def test_checkout_once(self, engine):
+        manager = SQLitePragmaManager({"cache_size": -1000})
+        calls = []
+        manager.apply = lambda dbapi_connection: calls.append(dbapi_connection) or {"cache_size": -1000}
+        manager.attach(engine)
+        for _ in range(3):
+            with engine.connect():
+                pass
+        assert len(calls) == 1
+
+    def test_detach(self, engine):
+        manager = SQLitePragmaManager({"cache_size": -1000})
+        manager.attach(engine)
+        manager.detach(engine)
+        with engine.connect() as connection:
+            assert connection.execute(text("PRAGMA cache_size")).scalar() != -1000
+
+    def test_attach_other_dialect(self):
+        engine = create_mock_engine("postgresql://", lambda *args, **kwargs: None)
+        with pytest.raises(ValueError, match="cannot be applied to a postgresql engine"):
+            SQLitePragmaManager({"foreign_keys": 1}).attach(engine)
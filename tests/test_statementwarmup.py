@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_statementwarmup.py
+Tests of compiling registered statements into an engine's compiled cache at startup.
+"""
+# Imports #
+# Standard Libraries #
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import bindparam
+from sqlalchemy import create_engine
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.util import LRUCache
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.cache import StatementWarmup
+from src.sqlalchemyobjects.cache import WarmupEntry
+from src.sqlalchemyobjects.cache import default_warmup
+from src.sqlalchemyobjects.cache import register_statement
+from src.sqlalchemyobjects.cache import warm_statements
+
+
+# Definitions #
+metadata = MetaData()
+sample = Table(
+    "sample",
+    metadata,
+    Column("id", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+)
+SELECT_BY_ID = select(sample).where(sample.c.id == bindparam("id"))
+INSERT = insert(sample)
+RENAME = update(sample).where(sample.c.id == bindparam("key")).values(name=bindparam("new_name"))
+
+
+# Fixtures #
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def warmup():
+    warmup = StatementWarmup()
+    warmup.register(SELECT_BY_ID, "select_by_id", ["id"])
+    warmup.register(INSERT, "insert", ["name", "id"], executemany=True)
+    warmup.register(RENAME, "rename", ["key", "new_name"])
+    return warmup
+
+
+# Tests #
+class TestStatementWarmup:
+    def test_construct(self):
+        entry = WarmupEntry("count", select(func.count()).select_from(sample))
+        warmup = StatementWarmup([entry])
+        assert warmup.entries == {"count": entry}
+        assert len(StatementWarmup(init=False)) == 0
+
+    def test_register(self, warmup):
+        assert warmup.register(SELECT_BY_ID) is SELECT_BY_ID
+        assert str(SELECT_BY_ID) in warmup.entries
+        assert warmup.entries["insert"].column_keys == ("id", "name")
+        warmup.unregister("insert")
+        warmup.unregister("missing")
+        assert set(warmup.entries) == {"select_by_id", "rename", str(SELECT_BY_ID)}
+
+    def test_warm(self, engine, warmup):
+        assert set(warmup.warm(engine).values()) == {CacheStats.CACHE_MISS}
+        assert warmup.verify(engine) == {"select_by_id": True, "insert": True, "rename": True}
+        with engine.begin() as connection:
+            result = connection.execute(INSERT, [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}])
+            assert result.context.cache_hit == CacheStats.CACHE_HIT
+            result = connection.execute(RENAME, {"key": 1, "new_name": "c"})
+            assert result.context.cache_hit == CacheStats.CACHE_HIT
+            result = connection.execute(SELECT_BY_ID, {"id": 1})
+            assert result.context.cache_hit == CacheStats.CACHE_HIT
+            assert result.all() == [(1, "c")]
+
+    def test_no_writes(self, engine, warmup):
+        warmup.warm(engine)
+        with engine.connect() as connection:
+            assert connection.scalar(select(func.count()).select_from(sample)) == 0
+
+    def test_shape(self, engine, warmup):
+        warmup.warm(engine)
+        with engine.begin() as connection:
+            result = connection.execute(INSERT, {"id": 1, "name": "a"})
+            assert result.context.cache_hit == CacheStats.CACHE_MISS
+
+    def test_compiled_cache_option(self, engine, warmup):
+        cache = LRUCache(10)
+        warmup.warm(engine.execution_options(compiled_cache=cache))
+        assert len(cache) == 3
+
+    def test_caching_disabled(self, engine, warmup):
+        stats = warmup.warm(engine.execution_options(compiled_cache=None))
+        assert set(stats.values()) == {CacheStats.CACHING_DISABLED}
+
+    def test_not_executed(self, engine, warmup):
+        warmup.stop_execution = lambda *args: None
+        with engine.connect() as connection:
+            with pytest.raises(RuntimeError, match="was not executed by a cursor"):
+                warmup.compile(connection, warmup.entries["select_by_id"])
+
+
+class TestDefaultWarmup:
+    def test_register_statement(self, engine):
+        statement = select(sample.c.name).where(sample.c.id == bindparam("id"))
+        assert register_statement(statement, "name_by_id", ["id"]) is statement
+        try:
+            assert warm_statements(engine)["name_by_id"] == CacheStats.CACHE_MISS
+        finally:
+            default_warmup.unregister("name_by_id")
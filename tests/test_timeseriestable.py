@@ -0,0 +1,134 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_timeseriestable.py
+Tests of the time-series table template and its range, nearest, and downsample queries.
+"""
+# Imports #
+# Standard Libraries #
+import datetime
+
+import pytest
+from sqlalchemy import DateTime
+from sqlalchemy import create_engine
+from sqlalchemy import func
+from sqlalchemy import insert
+from sqlalchemy import inspect
+from sqlalchemy import literal_column
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import mapped_column
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.tables import TimeSeriesTable
+from src.sqlalchemyobjects.tables.timeseriestable import EpochDateTime
+from src.sqlalchemyobjects.tables.timeseriestable import time_bucket
+
+
+# Definitions #
+START = datetime.datetime(2024, 1, 1)
+
+
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Reading(TimeSeriesTable, Base):
+    __tablename__ = "reading"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    value: Mapped[float]
+
+
+class Event(TimeSeriesTable, Base):
+    __tablename__ = "event"
+    timestamp_type = DateTime
+    series_type = None
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+
+
+# Fixtures #
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        rows = [{"id": i, "series": i % 2, "timestamp": i * 0.5, "value": float(i)} for i in range(-4, 12)]
+        connection.execute(insert(Reading), rows)
+        events = [{"id": i, "timestamp": START + datetime.timedelta(seconds=i * 30)} for i in range(5)]
+        connection.execute(insert(Event), events)
+    yield engine
+    engine.dispose()
+
+
+# Tests #
+class TestTimeBucket:
+    def test_compile(self):
+        statement = select(time_bucket(literal_column("t"), 10))
+        compiled = str(statement.compile(dialect=postgresql.dialect()))
+        assert compiled.startswith("SELECT (floor((t) / (") and "CAST" not in compiled
+
+    def test_negative_values(self, engine):
+        with engine.connect() as connection:
+            buckets = [connection.scalar(select(time_bucket(v, 2))) for v in (-3.0, -2.0, 0.0, 3.5)]
+        assert buckets == [-4, -2, 0, 2]
+
+
+class TestEpochDateTime:
+    def test_convert(self):
+        assert EpochDateTime().process_result_value(None, None) is None
+        assert EpochDateTime().process_result_value(0, None) == datetime.datetime(1970, 1, 1)
+        aware = EpochDateTime(timezone=True).process_result_value(60, None)
+        assert aware == datetime.datetime(1970, 1, 1, 0, 1, tzinfo=datetime.timezone.utc)
+
+
+class TestTimeSeriesTable:
+    def test_columns(self):
+        assert set(Reading.__table__.c.keys()) == {"id", "value", "timestamp", "series"}
+        assert [i.name for i in Reading.__table__.indexes] == ["ix_reading_series_timestamp"]
+        assert set(Event.__table__.c.keys()) == {"id", "timestamp"}
+        assert [i.name for i in Event.__table__.indexes] == ["ix_event_timestamp"]
+        assert not inspect(Reading).columns.timestamp.nullable
+
+    def test_is_datetime(self):
+        assert not Reading.is_datetime()
+        assert Event.is_datetime()
+
+    def test_get_range(self, engine):
+        with Session(engine) as session:
+            assert [r.id for r in Reading.get_range(session, 1.0, 3.0)] == [2, 3, 4, 5]
+            assert [r.id for r in Reading.get_range(session, stop=-1.0, series=0)] == [-4]
+            assert len(Reading.get_range(session)) == 16
+
+    def test_get_nearest(self, engine):
+        with Session(engine) as session:
+            assert Reading.get_nearest(session, 1.2).id == 2
+            assert Reading.get_nearest(session, 1.3).id == 3
+            assert Reading.get_nearest(session, 1.2, series=1).id == 3
+            assert Reading.get_nearest(session, -10.0).id == -4
+            assert Reading.get_nearest(session, 10.0).id == 11
+            assert Reading.get_nearest(session, 1.0, series=5) is None
+
+    def test_downsample(self, engine):
+        with Session(engine) as session:
+            rows = Reading.downsample(session, 2.0, start=0.0, stop=4.0)
+            assert [tuple(r) for r in rows] == [(0.0, 0, 2), (2.0, 0, 2), (0.0, 1, 2), (2.0, 1, 2)]
+        with engine.connect() as connection:
+            columns = [func.sum(Reading.value).label("total")]
+            rows = Reading.downsample(connection, 4.0, columns, series=1, by_series=False)
+            assert [tuple(r) for r in rows] == [(-4.0, -4.0), (0.0, 16.0), (4.0, 20.0)]
+
+    def test_downsample_datetime(self, engine):
+        with Session(engine) as session:
+            rows = Event.downsample(session, 60.0)
+        assert [tuple(r) for r in rows] == [
+            (START, 2),
+            (START + datetime.timedelta(minutes=1), 2),
+            (START + datetime.timedelta(minutes=2), 1),
+        ]
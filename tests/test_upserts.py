@@ -0,0 +1,193 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_upserts.py
+Tests of the dialect-aware upserts executed in batches.
+"""
+# Imports #
+# Standard Libraries #
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy import create_engine
+from sqlalchemy import select
+from sqlalchemy.dialects import mysql
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.upserts import Upserter
+from src.sqlalchemyobjects.upserts import upsert
+
+
+# Definitions #
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Player(Base):
+    __tablename__ = "player"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    handle: Mapped[str] = mapped_column(unique=True)
+    name: Mapped[Optional[str]]
+    score: Mapped[Optional[int]]
+
+
+class StagedUpserter(Upserter):
+    """An upserter which merges through a staging table as dialects without a native upsert do."""
+
+    native_dialects = frozenset()
+
+
+# Functions #
+def read_all(engine):
+    with engine.connect() as connection:
+        columns = (Player.id, Player.handle, Player.name, Player.score)
+        return connection.execute(select(*columns).order_by(Player.id)).all()
+
+
+def fake_connection(dialect):
+    return SimpleNamespace(dialect=dialect)
+
+
+# Fixtures #
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with engine.begin() as connection:
+        connection.execute(Player.__table__.insert(), [{"id": 1, "handle": "a", "name": "first", "score": 10}])
+    yield engine
+    engine.dispose()
+
+
+# Tests #
+class TestUpserter:
+    def test_construct(self):
+        upserter = Upserter(Player, chunk_size=10)
+        assert upserter.conflict_keys == ("id",)
+        assert upserter.update_columns == ("handle", "name", "score")
+        assert upserter.chunk_size == 10
+
+        upserter = Upserter(Player, ["handle"], ["score"])
+        assert upserter.conflict_keys == ("handle",)
+        assert upserter.update_columns == ("score",)
+
+    def test_no_init(self):
+        upserter = Upserter(Player, init=False)
+        assert upserter.table is None
+        upserter.construct()
+        assert upserter.conflict_keys == ()
+
+    def test_unknown_columns(self):
+        with pytest.raises(ValueError, match=r"Columns \['missing'\] are not in table player"):
+            Upserter(Player, update_columns=["missing"])
+
+    def test_no_conflict_keys(self):
+        table = Table("keyless", MetaData(), Column("value", Integer))
+        with pytest.raises(ValueError, match="need conflict keys or a primary key"):
+            Upserter(table)
+
+    @pytest.mark.parametrize("upserter_type", [Upserter, StagedUpserter], ids=["native", "staged"])
+    def test_upsert(self, engine, upserter_type):
+        rows = [(1, "a", "renamed", 11), (2, "b", "second", 20)]
+        report = upserter_type(Player).upsert(engine, rows)
+        assert report.rows == 2
+        assert read_all(engine) == [(1, "a", "renamed", 11), (2, "b", "second", 20)]
+
+    @pytest.mark.parametrize("upserter_type", [Upserter, StagedUpserter], ids=["native", "staged"])
+    def test_missing_columns_kept(self, engine, upserter_type):
+        upserter_type(Player).upsert(engine, [{"id": 1, "handle": "a", "name": "b"}])
+        assert read_all(engine) == [(1, "a", "b", 10)]
+
+    @pytest.mark.parametrize("upserter_type", [Upserter, StagedUpserter], ids=["native", "staged"])
+    def test_ignore_conflicts(self, engine, upserter_type):
+        upserter_type(Player, update_columns=()).upsert(engine, [(1, "a", "ignored", 0), (2, "b", "new", 2)])
+        assert read_all(engine) == [(1, "a", "first", 10), (2, "b", "new", 2)]
+
+    @pytest.mark.parametrize("upserter_type", [Upserter, StagedUpserter], ids=["native", "staged"])
+    def test_only_key_columns(self, engine, upserter_type):
+        upserter_type(Player).upsert(engine, [{"id": 1, "handle": "a"}])
+        assert read_all(engine) == [(1, "a", "first", 10)]
+
+    @pytest.mark.parametrize("upserter_type", [Upserter, StagedUpserter], ids=["native", "staged"])
+    def test_mixed_columns(self, engine, upserter_type):
+        rows = [
+            {"id": 1, "handle": "a"},
+            {"id": 1, "handle": "a", "score": 11},
+            {"id": 2, "handle": "b", "name": "second", "score": 20},
+            {"id": 3, "handle": "c"},
+        ]
+        report = upserter_type(Player).upsert(engine, rows)
+        assert (report.rows, report.chunks) == (4, 1)
+        assert read_all(engine) == [(1, "a", "first", 11), (2, "b", "second", 20), (3, "c", None, None)]
+
+    def test_conflict_keys(self, engine):
+        upserter = Upserter(Player, ["handle"], ["score"])
+        upserter.upsert(engine, [{"id": 5, "handle": "a", "name": "other", "score": 99}])
+        assert read_all(engine) == [(1, "a", "first", 99)]
+
+    def test_chunks(self, engine):
+        rows = ((i, f"h{i}", None, i) for i in range(1, 251))
+        report = StagedUpserter(Player, chunk_size=100, adaptive=False).upsert(engine, rows)
+        assert report.chunks == 3
+        assert len(read_all(engine)) == 250
+        assert read_all(engine)[0] == (1, "h1", None, 1)
+
+    def test_postgresql(self):
+        upserter = Upserter(Player)
+        statement = upserter.create_statement(fake_connection(postgresql.dialect()))
+        sql = str(upserter.create_upsert(statement, ["id", "name"]).compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (id) DO UPDATE SET name = excluded.name" in sql
+        sql = str(upserter.create_upsert(statement, ["id"]).compile(dialect=postgresql.dialect()))
+        assert "ON CONFLICT (id) DO NOTHING" in sql
+
+    def test_mysql(self):
+        upserter = Upserter(Player)
+        statement = upserter.create_statement(fake_connection(mysql.dialect()))
+        sql = str(upserter.create_upsert(statement, ["id", "score"]).compile(dialect=mysql.dialect()))
+        assert "ON DUPLICATE KEY UPDATE score = VALUES(score)" in sql
+        assert "name" not in sql.split("UPDATE")[1]
+        sql = str(upserter.create_upsert(statement, ["id"]).compile(dialect=mysql.dialect()))
+        assert sql.startswith("INSERT IGNORE")
+
+    def test_other_dialect(self):
+        assert Upserter(Player).create_statement(fake_connection(SimpleNamespace(name="mssql"))) is None
+
+    def test_native_dialects(self):
+        assert Upserter.native_dialects == {"sqlite", "postgresql", "mysql", "mariadb"}
+        assert StagedUpserter(Player).create_statement(fake_connection(postgresql.dialect())) is None
+        claimed = type("Claimed", (Upserter,), {"native_dialects": frozenset({"mssql"})})
+        assert claimed(Player).create_statement(fake_connection(SimpleNamespace(name="mssql"))) is None
+
+    def test_upsert_function(self, engine):
+        table = Player.__table__
+        upsert(engine, table, [{"id": 1, "handle": "a", "score": 5}], update_columns=["score"])
+        assert read_all(engine) == [(1, "a", "first", 5)]
+
+
+class TestStagingTable:
+    def test_create_stage(self):
+        first = Upserter(Player).create_stage()
+        second = Upserter(Player).create_stage()
+        assert first.name != second.name
+        assert first.name.startswith("_stage_player_")
+        assert [c.name for c in first.columns] == ["id", "handle", "name", "score"]
+        assert isinstance(first.c.handle.type, String)
+
+    def test_stage_dropped(self, engine):
+        StagedUpserter(Player).upsert(engine, [(2, "b", None, None)])
+        with engine.connect() as connection:
+            names = connection.exec_driver_sql("SELECT name FROM sqlite_temp_master").scalars().all()
+        assert names == []
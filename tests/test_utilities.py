@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_utilities.py
+Tests of the helpers shared by the table operations.
+"""
+# Imports #
+# Standard Libraries #
+from types import SimpleNamespace
+from typing import Optional
+
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import Integer
+from sqlalchemy import MetaData
+from sqlalchemy import Table
+from sqlalchemy import create_engine
+from sqlalchemy import func
+from sqlalchemy import literal
+from sqlalchemy import select
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import Session
+from sqlalchemy.orm import mapped_column
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.utilities import DEFAULT_PARAMETER_LIMIT
+from src.sqlalchemyobjects.utilities import LEGACY_SQLITE_PARAMETER_LIMIT
+from src.sqlalchemyobjects.utilities import PARAMETER_LIMITS
+from src.sqlalchemyobjects.utilities import as_connection
+from src.sqlalchemyobjects.utilities import as_table
+from src.sqlalchemyobjects.utilities import expunge_partition
+from src.sqlalchemyobjects.utilities import is_nullable
+from src.sqlalchemyobjects.utilities import parameter_limit
+from src.sqlalchemyobjects.utilities import selected_columns
+from src.sqlalchemyobjects.utilities import split_by_columns
+
+
+# Definitions #
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Item(Base):
+    __tablename__ = "item"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    size: Mapped[int]
+    note: Mapped[Optional[str]]
+
+
+# Functions #
+def fake_dialect(name, version=None):
+    return SimpleNamespace(name=name, dbapi=SimpleNamespace(sqlite_version_info=version))
+
+
+# Tests #
+class TestAsTable:
+    def test_table(self):
+        table = Table("plain", MetaData(), Column("id", Integer, primary_key=True))
+        assert as_table(table) is table
+
+    def test_mapped_class(self):
+        assert as_table(Item) is Item.__table__
+
+    def test_other(self):
+        with pytest.raises(TypeError, match="is not a Table or a mapped class"):
+            as_table(object())
+
+
+class TestSelectedColumns:
+    def test_names(self):
+        statement = select(Item.id, Item.size + 1, func.max(Item.size), Item.note.label("text"), literal(1))
+        names = [name for name, _ in selected_columns(statement)]
+        assert names == ["id", "column_1", "max", "text", "column_4"]
+
+    def test_duplicate_names(self):
+        other = Table("other", MetaData(), Column("id", Integer, primary_key=True))
+        assert [name for name, _ in selected_columns(select(Item.id, other.c.id))] == ["id", "id_1"]
+
+
+class TestIsNullable:
+    def test_columns(self):
+        assert not is_nullable(Item.__table__.c.id)
+        assert not is_nullable(Item.__table__.c.size)
+        assert is_nullable(Item.__table__.c.note)
+
+    def test_labels_and_expressions(self):
+        assert is_nullable(Item.note.label("text"))
+        assert not is_nullable(Item.size.label("a").label("b"))
+        assert is_nullable(func.count(Item.id))
+
+
+class TestParameterLimit:
+    def test_sqlite(self):
+        assert parameter_limit(fake_dialect("sqlite", (3, 40, 1))) == PARAMETER_LIMITS["sqlite"]
+
+    def test_legacy_sqlite(self):
+        assert parameter_limit(fake_dialect("sqlite", (3, 31, 0))) == LEGACY_SQLITE_PARAMETER_LIMIT
+
+    def test_other_dialects(self):
+        assert parameter_limit(fake_dialect("mssql")) == PARAMETER_LIMITS["mssql"]
+        assert parameter_limit(fake_dialect("unknown")) == DEFAULT_PARAMETER_LIMIT
+
+
+class TestAsConnection:
+    def test_connection_and_session(self):
+        engine = create_engine("sqlite://")
+        with engine.connect() as connection:
+            assert as_connection(connection) is connection
+        with Session(engine) as session:
+            assert as_connection(session) is session.connection()
+
+    def test_other(self):
+        with pytest.raises(TypeError, match="Expected a Connection or Session, got Engine"):
+            as_connection(create_engine("sqlite://"))
+
+
+class TestSplitByColumns:
+    def test_runs(self):
+        rows = [{"a": 1, "b": 1}, {"b": 2, "a": 2}, {"a": 3}, {"a": 4, "b": 4}]
+        assert list(split_by_columns(rows)) == [rows[:2], rows[2:3], rows[3:]]
+        assert list(split_by_columns([])) == []
+
+
+class TestExpungePartition:
+    def test_objects_and_rows(self):
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session, Session(engine) as other:
+            items = [Item(id=i, size=i) for i in range(3)]
+            foreign = Item(id=10, size=10)
+            session.add_all(items)
+            other.add(foreign)
+            session.flush()
+            rows = session.execute(select(Item, Item.size).where(Item.id < 2)).all()
+            expunge_partition(session, rows)
+            expunge_partition(session, [items[2], foreign, 5])
+            assert len(session.identity_map) == 0
+            assert foreign in other
@@ -0,0 +1,259 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+""" test_writebuffer.py
+Tests of the write-behind buffer which coalesces changes to rows and flushes them in batches.
+"""
+# Imports #
+# Standard Libraries #
+import time
+
+import pytest
+from sqlalchemy import ForeignKey
+from sqlalchemy import create_engine
+from sqlalchemy import event
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+# Third-Party Packages #
+
+# Local Packages #
+from src.sqlalchemyobjects.writebuffer import TableBuffer
+from src.sqlalchemyobjects.writebuffer import WriteBuffer
+from src.sqlalchemyobjects.writebuffer import group_by_columns
+
+
+# Definitions #
+# Classes #
+class Base(DeclarativeBase):
+    pass
+
+
+class Parent(Base):
+    __tablename__ = "parent"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str | None]
+
+
+class Child(Base):
+    __tablename__ = "child"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    parent_id: Mapped[int] = mapped_column(ForeignKey("parent.id"))
+
+
+# Functions #
+def rows(engine, table):
+    with engine.connect() as connection:
+        return [tuple(r) for r in connection.execute(select(table).order_by(table.c.id))]
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+# Fixtures #
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'buffer.db'}")
+
+    @event.listens_for(engine, "connect")
+    def enable_foreign_keys(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def buffer(engine):
+    buffer = WriteBuffer(engine, max_size=100, max_age=None)
+    yield buffer
+    buffer.error = None
+    buffer.close()
+
+
+# Tests #
+class TestTableBuffer:
+    def test_coalesce(self):
+        buffer = TableBuffer(Parent.__table__)
+        buffer.insert({"id": 1, "name": "a"})
+        buffer.update({"id": 1, "name": "b"})
+        buffer.update({"id": 2, "name": "c"})
+        buffer.update({"id": 2, "name": "d"})
+        buffer.insert({"name": "unkeyed"})
+        assert buffer.inserts == {(1,): {"id": 1, "name": "b"}}
+        assert buffer.updates == {(2,): {"id": 2, "name": "d"}}
+        assert len(buffer) == 3
+        buffer.delete({"id": 1, "name": "b"})
+        buffer.delete({"id": 2})
+        assert (buffer.inserts, buffer.updates, buffer.deletes) == ({}, {}, {(1,): {"id": 1}, (2,): {"id": 2}})
+        buffer.insert({"id": 2, "name": "e"})
+        assert buffer.inserts == {(2,): {"id": 2, "name": "e"}}
+
+    def test_missing_key(self):
+        buffer = TableBuffer(Parent.__table__)
+        with pytest.raises(ValueError, match="Updates to parent"):
+            buffer.update({"name": "a"})
+        with pytest.raises(ValueError, match="Deletes from parent"):
+            buffer.delete({})
+
+    def test_merge(self):
+        older = TableBuffer(Parent.__table__)
+        older.insert({"id": 1, "name": "a"})
+        older.update({"id": 2, "name": "b"})
+        newer = TableBuffer(Parent.__table__)
+        newer.delete({"id": 1})
+        newer.insert({"id": 3, "name": "c"})
+        newer.insert({"name": "d"})
+        newer.update({"id": 2, "name": "e"})
+        older.merge(newer)
+        assert older.inserts == {(3,): {"id": 3, "name": "c"}}
+        assert older.updates == {(2,): {"id": 2, "name": "e"}}
+        assert older.deletes == {(1,): {"id": 1}}
+        assert older.unkeyed == [{"name": "d"}]
+
+    def test_execute(self, engine):
+        buffer = TableBuffer(Parent.__table__)
+        buffer.insert({"id": 1, "name": "a"})
+        buffer.insert({"id": 2})
+        with engine.begin() as connection:
+            buffer.execute(connection)
+        buffer = TableBuffer(Parent.__table__)
+        buffer.update({"id": 2, "name": "b"})
+        buffer.delete({"id": 1})
+        with engine.begin() as connection:
+            buffer.execute(connection)
+        assert rows(engine, Parent.__table__) == [(2, "b")]
+
+
+class TestWriteBuffer:
+    def test_construct(self, engine):
+        buffer = WriteBuffer(engine, max_size=10, max_age=None)
+        assert (buffer.get_engine(), buffer.max_size, buffer.max_age, buffer.max_pending) == (engine, 10, None, 40)
+        assert buffer._thread is None
+        buffer.construct(max_pending=10)
+        assert buffer.max_pending == 10
+        buffer.close()
+
+    def test_max_pending(self, engine):
+        with pytest.raises(ValueError, match="must be at least max_size"):
+            WriteBuffer(engine, max_size=10, max_pending=5, max_age=None)
+
+    def test_no_init(self):
+        buffer = WriteBuffer(init=False)
+        assert buffer._thread is None
+        buffer.construct(max_age=None)
+        assert (buffer.max_age, buffer.max_pending, buffer._thread) == (None, 40000, None)
+        with pytest.raises(ValueError, match="has no engine"):
+            buffer.get_engine()
+
+    def test_flush(self, buffer, engine):
+        buffer.insert(Parent, {"id": 1, "name": "a"})
+        buffer.update(Parent(id=1), {"id": 1, "name": "b"})
+        buffer.insert(Parent(id=2, name="c"))
+        assert len(buffer) == 2
+        assert buffer.flush() == 2
+        assert buffer.flush() == 0
+        buffer.delete(Parent(id=2))
+        buffer.close()
+        assert rows(engine, Parent.__table__) == [(1, "b")]
+
+    def test_values_required(self, buffer):
+        with pytest.raises(ValueError, match="Values are required"):
+            buffer.insert(Parent)
+
+    def test_max_size(self, engine):
+        with WriteBuffer(engine, max_size=2, max_age=None) as buffer:
+            buffer.insert(Parent, {"id": 1})
+            assert len(buffer) == 1
+            buffer.insert(Parent, {"id": 2})
+            assert len(buffer) == 0
+        assert len(rows(engine, Parent.__table__)) == 2
+
+    def test_blocked_writer_flushes(self, engine):
+        buffer = WriteBuffer(engine, max_size=2, max_pending=2, max_age=None)
+        buffer.pending = 2
+        buffer.insert(Parent, {"id": 1})
+        assert rows(engine, Parent.__table__) == []
+        assert len(buffer) == 1
+        buffer.close()
+        assert rows(engine, Parent.__table__) == [(1, None)]
+
+    def test_dependency_order(self, buffer, engine):
+        buffer.insert(Child, {"id": 1, "parent_id": 1})
+        buffer.insert(Parent, {"id": 1})
+        buffer.flush()
+        buffer.delete(Parent, {"id": 1})
+        buffer.delete(Child, {"id": 1})
+        buffer.flush()
+        assert rows(engine, Child.__table__) == []
+        assert rows(engine, Parent.__table__) == []
+
+    def test_failed_flush_keeps_batch(self, buffer, engine):
+        buffer.insert(Child, {"id": 1, "parent_id": 1})
+        with pytest.raises(IntegrityError):
+            buffer.flush()
+        assert len(buffer) == 1
+        buffer.insert(Parent, {"id": 1})
+        buffer.insert(Child, {"id": 2, "parent_id": 1})
+        assert len(buffer) == 3
+        assert buffer.flush() == 3
+        assert [r[0] for r in rows(engine, Child.__table__)] == [1, 2]
+
+    def test_writes_during_failed_flush(self, buffer, engine):
+        def write_during_flush(connection, clauseelement, multiparams, params, execution_options):
+            buffer.insert(Parent, {"id": 1})
+            buffer.insert(Child, {"id": 2, "parent_id": 1})
+
+        event.listen(engine, "before_execute", write_during_flush, once=True)
+        buffer.insert(Child, {"id": 1, "parent_id": 1})
+        with pytest.raises(IntegrityError):
+            buffer.flush()
+        assert set(buffer.buffers) == {Parent.__table__, Child.__table__}
+        assert len(buffer) == 3
+        assert buffer.flush() == 3
+        assert [r[0] for r in rows(engine, Child.__table__)] == [1, 2]
+
+    def test_error_raised_once(self, buffer):
+        for call in (lambda: buffer.insert(Parent, {"id": 1}), buffer.flush, buffer.close):
+            buffer.error = RuntimeError("background")
+            with pytest.raises(RuntimeError, match="background"):
+                call()
+            assert buffer.error is None
+
+    def test_background_flush(self, engine):
+        buffer = WriteBuffer(engine, max_age=0.05)
+        assert buffer._thread.is_alive()
+        buffer.insert(Parent, {"id": 1})
+        assert wait_for(lambda: rows(engine, Parent.__table__) == [(1, None)])
+        assert len(buffer) == 0
+        buffer.max_age = None
+        buffer._thread.join()
+        buffer.close()
+
+    def test_background_failure(self, engine):
+        buffer = WriteBuffer(engine, max_age=0.05)
+        buffer.insert(Child, {"id": 1, "parent_id": 1})
+        assert wait_for(lambda: buffer.error is not None)
+        buffer.max_age = None
+        buffer._thread.join()
+        assert len(buffer) == 1
+        with pytest.raises(IntegrityError):
+            buffer.insert(Parent, {"id": 1})
+        buffer.insert(Parent, {"id": 1})
+        buffer.close()
+        assert rows(engine, Child.__table__) == [(1, 1)]
+
+
+class TestGroupByColumns:
+    def test_groups(self):
+        groups = group_by_columns([{"b": 1, "a": 2}, {"a": 3}, {"a": 4, "b": 5}])
+        assert groups == {("a", "b"): [{"b": 1, "a": 2}, {"a": 4, "b": 5}], ("a",): [{"a": 3}]}